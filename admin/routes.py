@@ -1,10 +1,11 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from flask_login import login_required, current_user
 from werkzeug.security import generate_password_hash
-from models import User
+from models import User, invalidate_user
 from extensions import db
 from decorators import admin_required
 from utils.password_policy import validate_password
+from utils.db_pool import pool_status
 
 admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
 
@@ -78,6 +79,7 @@ def user_edit(user_id):
         user.is_active = request.form.get("active") == "1"
 
         db.session.commit()
+        invalidate_user(user.user_id)
         flash("User updated successfully", "success")
         return redirect(url_for("admin.users"))
     
@@ -101,6 +103,7 @@ def user_delete(user_id):
 
     db.session.delete(user)
     db.session.commit()
+    invalidate_user(user_id)
     flash("User deleted", "success")
     return redirect(url_for("admin.users"))
 
@@ -123,6 +126,17 @@ def reset_user_password(user_id):
     user.password_hash = generate_password_hash(new_password)
 
     db.session.commit()
+    invalidate_user(user.user_id)
 
     flash(f"Password reset to: {new_password}", "warning")
-    return redirect(url_for("admin.users"))
\ No newline at end of file
+    return redirect(url_for("admin.users"))
+
+
+# ======================
+# DB POOL STATUS (this worker)
+# ======================
+@admin_bp.route("/db-pool")
+@login_required
+@admin_required
+def db_pool():
+    return jsonify(pool_status(db.engine))
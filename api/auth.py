@@ -0,0 +1,69 @@
+from datetime import datetime
+from functools import wraps
+
+from flask import g, request
+from flask_login import current_user
+from sqlalchemy import update
+
+from extensions import db
+from models import User
+from utils.cache import TTLCache
+from .models import ApiToken
+from .serialization import json_error
+
+
+# token hash -> username; revocation applies within the TTL
+_token_cache = TTLCache(maxsize=256, ttl=60)
+
+
+def _token_user(token):
+    token_hash = ApiToken.hash_token(token)
+
+    username = _token_cache.get(token_hash)
+    if username is not None:
+        return username
+
+    row = (
+        db.session.query(ApiToken.id, User.username)
+        .join(User, User.user_id == ApiToken.user_id)
+        .filter(
+            ApiToken.token_hash == token_hash,
+            ApiToken.revoked.is_(False),
+            User.is_active.is_(True),
+        )
+        .first()
+    )
+    if row is None:
+        return None
+
+    # recorded once per cache period, not on every call
+    db.session.execute(
+        update(ApiToken).where(ApiToken.id == row.id).values(last_used_at=datetime.now())
+    )
+    db.session.commit()
+
+    _token_cache.set(token_hash, row.username)
+    return row.username
+
+
+def api_auth_required(f):
+    """
+    Accept ``Authorization: Bearer <token>`` (scripts) or a logged-in
+    browser session; sets ``g.api_user`` to the caller's username.
+    """
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        auth = request.headers.get("Authorization", "")
+
+        if auth.startswith("Bearer "):
+            username = _token_user(auth[len("Bearer "):].strip())
+            if username is None:
+                return json_error("Invalid or revoked API token", 401)
+        elif current_user.is_authenticated:
+            username = current_user.username
+        else:
+            return json_error("Authentication required", 401)
+
+        g.api_user = username
+        return f(*args, **kwargs)
+    return wrapper
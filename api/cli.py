@@ -0,0 +1,63 @@
+import secrets
+
+import click
+
+from extensions import db
+from models import User
+from . import api_bp
+from .models import ApiToken
+
+
+# =============================
+# flask api create-token
+# =============================
+@api_bp.cli.command("create-token")
+@click.argument("name")
+@click.option("--user", "username", required=True, help="Portal user the token acts as")
+def create_token(name, username):
+    """Create an API token for scripts; it is printed only once."""
+    user = User.query.filter_by(username=username).first()
+    if not user:
+        raise click.ClickException(f"No such user: {username}")
+
+    token = secrets.token_urlsafe(32)
+    db.session.add(ApiToken(name=name, token_hash=ApiToken.hash_token(token), user_id=user.user_id))
+    db.session.commit()
+
+    click.echo(token)
+
+
+# =============================
+# flask api list-tokens
+# =============================
+@api_bp.cli.command("list-tokens")
+def list_tokens():
+    """Show API tokens (never the token values)."""
+    rows = (
+        db.session.query(ApiToken, User.username)
+        .join(User, User.user_id == ApiToken.user_id)
+        .order_by(ApiToken.id)
+        .all()
+    )
+    for token, username in rows:
+        state = "revoked" if token.revoked else "active"
+        click.echo(
+            f"{token.id:>4}  {token.name:<30} {username:<20} {state:<8} "
+            f"last used: {token.last_used_at or '-'}"
+        )
+
+
+# =============================
+# flask api revoke-token
+# =============================
+@api_bp.cli.command("revoke-token")
+@click.argument("token_id", type=int)
+def revoke_token(token_id):
+    """Revoke a token; running workers stop accepting it within a minute."""
+    token = db.session.get(ApiToken, token_id)
+    if not token:
+        raise click.ClickException(f"No such token: {token_id}")
+
+    token.revoked = True
+    db.session.commit()
+    click.echo(f"Token {token_id} ({token.name}) revoked")
@@ -0,0 +1,26 @@
+import hashlib
+from datetime import datetime
+
+from extensions import db
+
+
+class ApiToken(db.Model):
+    __tablename__ = "ApiTokens"
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+
+    # sha256 of the token; the token itself is shown once, at creation
+    token_hash = db.Column(db.String(64), nullable=False, unique=True)
+
+    user_id = db.Column(db.Integer, db.ForeignKey("users.user_id"), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.now)
+    last_used_at = db.Column(db.DateTime)
+    revoked = db.Column(db.Boolean, nullable=False, default=False)
+
+    @staticmethod
+    def hash_token(token):
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def __repr__(self):
+        return f"<ApiToken {self.name}>"
@@ -0,0 +1,175 @@
+from flask import request
+
+from extensions import db
+from assets.models import HardDiskSummary, ServerAsset
+from assets.search import filter_hard_disks
+from assets.inventory import filter_servers
+from assets.archive import hard_disk_model, wants_archive
+from utils.keyset import keyset_paginate
+from utils.data_version import get_stamp
+from utils.conditional import Validators
+from . import api_bp
+from .auth import api_auth_required
+from .serialization import json_response, json_error
+
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+HARD_DISK_FIELDS = (
+    "id", "disk_name", "serial_number", "file_name", "full_path",
+    "size_mb", "modified", "uploaded_by", "uploaded_at",
+)
+SUMMARY_FIELDS = (
+    "disk_name", "serial_number", "total_files", "total_size_mb",
+    "latest_backup", "last_upload_at", "last_uploaded_by",
+)
+SERVER_FIELDS = (
+    "id", "hostname", "ip_address", "environment", "segment",
+    "os", "owner", "cpu", "ram", "storage",
+)
+
+
+class ApiError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+@api_bp.errorhandler(ApiError)
+def handle_api_error(e):
+    return json_error(e.message, e.status)
+
+
+def _fields(allowed, required=()):
+    """
+    ``?fields=a,b`` projection; unknown names are a 400. ``required``
+    columns (the pagination key) are always selected.
+    """
+    raw = request.args.get("fields")
+    if not raw:
+        return list(allowed)
+
+    fields = [f.strip() for f in raw.split(",") if f.strip()]
+    unknown = [f for f in fields if f not in allowed]
+    if unknown:
+        raise ApiError(f"Unknown field(s): {', '.join(unknown)}")
+
+    return list(required) + [f for f in fields if f not in required]
+
+
+def _limit():
+    try:
+        limit = int(request.args.get("limit", DEFAULT_LIMIT))
+    except ValueError:
+        raise ApiError("limit must be an integer")
+    return max(1, min(limit, MAX_LIMIT))
+
+
+def _validators(data_set):
+    """Validators for a response determined by ``data_set`` and the query string."""
+    version, updated_at = get_stamp(data_set)
+    return Validators(
+        request.path, version, sorted(request.args.items(multi=True)),
+        last_modified=updated_at,
+    )
+
+
+def _page(model, fields, query):
+    query = query.with_entities(*(getattr(model, f) for f in fields))
+    page = keyset_paginate(query, model.id, _limit(), request.args.get("cursor"))
+
+    return json_response({
+        "data": [dict(zip(fields, row)) for row in page.items],
+        "next_cursor": page.next_cursor,
+        "prev_cursor": page.prev_cursor,
+    })
+
+
+# =============================
+# HARD DISKS
+# =============================
+@api_bp.route("/hard-disks")
+@api_auth_required
+def hard_disks():
+    """Filters: q, start, end (as on the list page), serial (exact), archive=1."""
+    validators = _validators("hard_disk")
+    not_modified = validators.not_modified()
+    if not_modified:
+        return not_modified
+
+    fields = _fields(HARD_DISK_FIELDS, required=("id",))
+    model = hard_disk_model(wants_archive(request.args))
+
+    query = filter_hard_disks(
+        db.session.query(model),
+        request.args.get("q", "").strip(),
+        request.args.get("start"),
+        request.args.get("end"),
+        model,
+    )
+
+    serial = request.args.get("serial")
+    if serial:
+        query = query.filter(model.serial_number == serial)
+
+    return validators.apply(_page(model, fields, query))
+
+
+# =============================
+# DISK SUMMARY
+# =============================
+@api_bp.route("/hard-disks/summary")
+@api_auth_required
+def hard_disk_summary():
+    """One row per disk (small, not paginated). Filter: q."""
+    validators = _validators("hard_disk")
+    not_modified = validators.not_modified()
+    if not_modified:
+        return not_modified
+
+    fields = _fields(SUMMARY_FIELDS)
+
+    query = HardDiskSummary.query
+    keyword = request.args.get("q", "").strip()
+    if keyword:
+        query = query.filter(
+            HardDiskSummary.disk_name.ilike(f"%{keyword}%") |
+            HardDiskSummary.serial_number.ilike(f"%{keyword}%")
+        )
+
+    rows = (
+        query
+        .with_entities(*(getattr(HardDiskSummary, f) for f in fields))
+        .order_by(HardDiskSummary.disk_name, HardDiskSummary.serial_number)
+        .all()
+    )
+
+    return validators.apply(
+        json_response({"data": [dict(zip(fields, row)) for row in rows]})
+    )
+
+
+# =============================
+# SERVERS
+# =============================
+@api_bp.route("/servers")
+@api_auth_required
+def servers():
+    """Filters: segment, env, q (as on the server list page)."""
+    validators = _validators("servers")
+    not_modified = validators.not_modified()
+    if not_modified:
+        return not_modified
+
+    fields = _fields(SERVER_FIELDS, required=("id",))
+
+    query = filter_servers(
+        ServerAsset.query,
+        request.args.get("segment"),
+        request.args.get("env"),
+        request.args.get("q"),
+    )
+
+    return validators.apply(_page(ServerAsset, fields, query))
@@ -4,7 +4,13 @@ from dotenv import load_dotenv
 from config import Config
 from extensions import db, login_manager, migrate
 from assets import assets_bp
-from datetime import datetime
+from jobs import jobs_bp
+from jobs.runner import job_runner
+from metrics import metrics_bp
+from api import api_bp
+from metrics.instrumentation import init_metrics
+from utils.compression import init_compression
+from utils.static_assets import init_static_assets
 
 
 load_dotenv()
@@ -19,6 +25,10 @@ def create_app():
     db.init_app(app)
     login_manager.init_app(app)
     migrate.init_app(app, db)
+    job_runner.init_app(app)
+    init_metrics(app)
+    init_compression(app)
+    init_static_assets(app)
     login_manager.login_view = "auth.login"
 
     # 🔐 FORCE PASSWORD CHANGE
@@ -41,12 +51,6 @@ def create_app():
             "app_version": app.config.get("APP_VERSION", "V1.0")
     }
     
-    @app.context_processor
-    def inject_server_time():
-        return {
-            "server_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-
     from auth.routes import auth_bp
     from main.routes import main_bp
     from admin.routes import admin_bp
@@ -55,6 +59,9 @@ def create_app():
     app.register_blueprint(main_bp)
     app.register_blueprint(admin_bp, url_prefix="/admin")
     app.register_blueprint(assets_bp)
+    app.register_blueprint(jobs_bp)
+    app.register_blueprint(metrics_bp)
+    app.register_blueprint(api_bp)
 
     return app
 
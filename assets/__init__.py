@@ -7,4 +7,4 @@ assets_bp = Blueprint(
     url_prefix="/assets"
 )
 
-from . import routes
+from . import routes, tasks, cli
@@ -0,0 +1,142 @@
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+import time
+
+from sqlalchemy import func, insert, literal, select, union_all, update
+from sqlalchemy.orm import aliased
+
+from extensions import db
+from utils.data_version import bump_version
+from .models import HardDiskBackup, HardDiskArchive, HardDiskSummary
+
+
+DEFAULT_BATCH_SIZE = 5000
+
+HISTORY_COLUMNS = tuple(HardDiskBackup.__table__.columns.keys())
+
+
+# =============================
+# HOT + COLD READS
+# =============================
+def hard_disk_history(with_flag=False):
+    """
+    HardDiskHistorical UNION ALL HardDiskHistoricalArchive as a subquery
+    with the hot table's columns (plus ``archived`` 0/1 if ``with_flag``).
+    Filters on the outer query are pushed into both branches.
+    """
+    hot = HardDiskBackup.__table__
+    cold = HardDiskArchive.__table__
+
+    hot_cols = [hot.c[name] for name in HISTORY_COLUMNS]
+    cold_cols = [cold.c[name] for name in HISTORY_COLUMNS]
+    if with_flag:
+        hot_cols.append(literal(0).label("archived"))
+        cold_cols.append(literal(1).label("archived"))
+
+    return union_all(select(*hot_cols), select(*cold_cols)).subquery("HardDiskHistory")
+
+
+def hard_disk_table(include_archive=False):
+    """Core selectable for exports: the hot table, or hot + archive."""
+    if include_archive:
+        return hard_disk_history()
+    return HardDiskBackup.__table__
+
+
+def hard_disk_model(include_archive=False):
+    """
+    ORM entity for list / search / API queries: ``HardDiskBackup`` itself,
+    or an alias of it over hot + archive, so ``model.column`` filters and
+    keyset pagination on ``model.id`` work the same on both.
+    """
+    if include_archive:
+        return aliased(HardDiskBackup, hard_disk_history(), adapt_on_names=True)
+    return HardDiskBackup
+
+
+def wants_archive(args):
+    """``?archive=1`` on pages, exports and the API."""
+    return args.get("archive") == "1"
+
+
+# =============================
+# ARCHIVE JOB
+# =============================
+@dataclass
+class ArchiveResult:
+    cutoff: datetime = None
+    moved: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+
+    def as_dict(self):
+        return asdict(self)
+
+
+def retention_cutoff(days, now=None):
+    return (now or datetime.now()) - timedelta(days=days)
+
+
+def archive_hard_disks(cutoff, batch_size=DEFAULT_BATCH_SIZE, limit=None):
+    """
+    Move rows with ``modified`` before ``cutoff`` to the archive table,
+    one transaction per batch of ids (copy, summary counters, delete), so
+    a stopped run leaves every row in exactly one table. ``limit`` caps
+    the rows moved in this run.
+    """
+    hot = HardDiskBackup.__table__
+    cold = HardDiskArchive.__table__
+    summary = HardDiskSummary.__table__
+
+    result = ArchiveResult(cutoff=cutoff)
+    started = time.perf_counter()
+
+    while limit is None or result.moved < limit:
+        size = batch_size if limit is None else min(batch_size, limit - result.moved)
+        ids = db.session.execute(
+            select(hot.c.id)
+            .where(hot.c.modified < cutoff)
+            .order_by(hot.c.id)
+            .limit(size)
+        ).scalars().all()
+        if not ids:
+            break
+
+        # id range instead of IN (...): no MSSQL parameter limit
+        in_batch = (hot.c.modified < cutoff) & hot.c.id.between(ids[0], ids[-1])
+        archived_at = datetime.now()
+
+        per_disk = db.session.execute(
+            select(hot.c.disk_name, hot.c.serial_number, func.count())
+            .where(in_batch)
+            .group_by(hot.c.disk_name, hot.c.serial_number)
+        ).all()
+
+        db.session.execute(
+            insert(cold).from_select(
+                HISTORY_COLUMNS + ("archived_at",),
+                select(*(hot.c[name] for name in HISTORY_COLUMNS), literal(archived_at))
+                .where(in_batch),
+            )
+        )
+
+        for disk_name, serial, files in per_disk:
+            same_serial = (
+                summary.c.serial_number.is_(None) if serial is None
+                else summary.c.serial_number == serial
+            )
+            db.session.execute(
+                update(summary)
+                .where(summary.c.disk_name == disk_name, same_serial)
+                .values(archived_files=summary.c.archived_files + files)
+            )
+
+        moved = db.session.execute(hot.delete().where(in_batch)).rowcount
+        bump_version("hard_disk")
+        db.session.commit()
+
+        result.moved += moved
+        result.batches += 1
+
+    result.elapsed = time.perf_counter() - started
+    return result
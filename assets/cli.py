@@ -0,0 +1,92 @@
+import click
+from flask import current_app
+
+from . import assets_bp
+from .summary import rebuild_hard_disk_summary
+from .search import rebuild_search_index
+from .ingest import backfill_row_hashes, delete_duplicate_rows
+from .archive import archive_hard_disks, retention_cutoff
+from extensions import db
+from utils.data_version import bump_version
+
+
+# =============================
+# flask assets rebuild-summary
+# =============================
+@assets_bp.cli.command("rebuild-summary")
+def rebuild_summary():
+    """Recompute the HardDiskSummary rollup from HardDiskHistorical."""
+    disks = rebuild_hard_disk_summary()
+    click.echo(f"Hard disk summary rebuilt: {disks} disk(s)")
+
+
+# =============================
+# flask assets rebuild-search-index
+# =============================
+@assets_bp.cli.command("rebuild-search-index")
+def rebuild_search_index_command():
+    """Recreate the file name search tokens from HardDiskHistorical."""
+    names = rebuild_search_index()
+    click.echo(f"Search index rebuilt: {names} file name(s)")
+
+
+# =============================
+# flask assets rebuild-usage
+# =============================
+@assets_bp.cli.command("rebuild-usage")
+def rebuild_usage():
+    """Recompute the daily / monthly HardDiskUsage rollups of every disk."""
+    # pandas is only needed here; keep it out of `flask` startup
+    from .usage_rollup import refresh_usage_rollups
+
+    buckets = refresh_usage_rollups()
+    click.echo(f"Usage rollups rebuilt: {buckets} bucket(s)")
+
+
+# =============================
+# flask assets backfill-hashes
+# =============================
+@assets_bp.cli.command("backfill-hashes")
+def backfill_hashes():
+    """Fill content_hash / path_hash for rows uploaded before dedup."""
+    rows = backfill_row_hashes()
+    click.echo(f"Hashes backfilled: {rows} row(s)")
+
+
+# =============================
+# flask assets dedupe
+# =============================
+@assets_bp.cli.command("dedupe")
+def dedupe():
+    """Delete re-uploaded duplicate rows, keeping the first of each."""
+    from .usage_rollup import refresh_usage_rollups
+
+    deleted = delete_duplicate_rows()
+    if deleted:
+        rebuild_hard_disk_summary()
+        refresh_usage_rollups()
+        bump_version("hard_disk")
+        db.session.commit()
+    click.echo(f"Duplicates removed: {deleted} row(s)")
+
+
+# =============================
+# flask assets archive
+# =============================
+@assets_bp.cli.command("archive")
+@click.option("--days", type=int, default=None,
+              help="Retention window (default HARD_DISK_RETENTION_DAYS)")
+@click.option("--batch-size", type=int, default=None,
+              help="Rows per transaction (default HARD_DISK_ARCHIVE_BATCH_SIZE)")
+@click.option("--limit", type=int, default=None, help="Stop after this many rows")
+def archive(days, batch_size, limit):
+    """Move hard disk rows older than the retention window to the archive table."""
+    config = current_app.config
+    days = config["HARD_DISK_RETENTION_DAYS"] if days is None else days
+    batch_size = batch_size or config["HARD_DISK_ARCHIVE_BATCH_SIZE"]
+
+    result = archive_hard_disks(retention_cutoff(days), batch_size=batch_size, limit=limit)
+    click.echo(
+        f"Archived {result.moved} row(s) modified before {result.cutoff:%Y-%m-%d %H:%M} "
+        f"in {result.batches} batch(es), {result.elapsed:.1f}s"
+    )
@@ -0,0 +1,172 @@
+from dataclasses import dataclass, field, asdict
+
+import pandas as pd
+
+
+# CSV header -> HardDiskBackup column
+COLUMN_MAP = {
+    "DiskName": "disk_name",
+    "SerialNumber": "serial_number",
+    "FileName": "file_name",
+    "FullPath": "full_path",
+    "SizeMB": "size_mb",
+    "Modified": "modified",
+}
+
+SERIAL_LENGTH = 8
+MAX_LENGTHS = {"DiskName": 200, "FileName": 255}
+
+DEFAULT_CHUNK_SIZE = 5000
+MAX_REPORTED_ERRORS = 500
+
+
+class CsvSchemaError(ValueError):
+    """Raised when the CSV header does not match the hard disk schema."""
+
+
+# =============================
+# PARSE REPORT
+# =============================
+@dataclass
+class RowError:
+    line: int
+    column: str
+    value: str
+    message: str
+
+
+@dataclass
+class ParseReport:
+    rows_read: int = 0
+    rows_valid: int = 0
+    error_count: int = 0
+    errors: list = field(default_factory=list)
+
+    @property
+    def rows_rejected(self):
+        return self.rows_read - self.rows_valid
+
+    @property
+    def truncated(self):
+        return self.error_count > len(self.errors)
+
+    def add(self, line, column, value, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(RowError(line, column, value, message))
+
+    def as_dict(self):
+        data = asdict(self)
+        data["rows_rejected"] = self.rows_rejected
+        data["truncated"] = self.truncated
+        return data
+
+
+# =============================
+# CHUNKED PARSER
+# =============================
+def iter_hard_disk_batches(fileobj, report, chunksize=DEFAULT_CHUNK_SIZE):
+    """
+    Read a hard disk CSV ``chunksize`` rows at a time and yield lists of
+    validated row dicts keyed by HardDiskBackup column names.
+
+    Invalid rows are skipped and recorded in ``report``. Only one chunk is
+    held in memory at a time.
+    """
+    reader = pd.read_csv(
+        fileobj,
+        chunksize=chunksize,
+        dtype=str,
+        keep_default_na=False,
+        skipinitialspace=True,
+    )
+
+    for chunk in reader:
+        if report.rows_read == 0:
+            missing = [c for c in COLUMN_MAP if c not in chunk.columns]
+            if missing:
+                raise CsvSchemaError(
+                    f"Missing column(s): {', '.join(missing)}"
+                )
+
+        chunk = chunk[list(COLUMN_MAP)]
+        report.rows_read += len(chunk)
+
+        rows = _normalize_chunk(chunk, report)
+        report.rows_valid += len(rows)
+
+        if rows:
+            yield rows
+
+
+def _normalize_chunk(chunk, report):
+    # header is line 1, first data row is line 2
+    lines = chunk.index + 2
+
+    raw = chunk.apply(lambda col: col.str.strip())
+    out = pd.DataFrame(index=chunk.index)
+    invalid = pd.Series(False, index=chunk.index)
+    errors = []
+
+    def reject(mask, column, message):
+        nonlocal invalid
+        mask = mask & ~invalid
+        for line, value in zip(lines[mask.to_numpy()], raw.loc[mask, column]):
+            errors.append((int(line), column, value, message))
+        invalid |= mask
+
+    # ===== Required text =====
+    for column in ("DiskName", "FileName"):
+        reject(raw[column] == "", column, f"{column} is required")
+        reject(
+            raw[column].str.len() > MAX_LENGTHS[column],
+            column,
+            f"{column} longer than {MAX_LENGTHS[column]} characters",
+        )
+
+    out["disk_name"] = raw["DiskName"]
+    out["file_name"] = raw["FileName"]
+    out["full_path"] = raw["FullPath"].where(raw["FullPath"] != "")
+
+    # ===== Serial (last 8 chars) =====
+    serial = raw["SerialNumber"].str[-SERIAL_LENGTH:]
+    out["serial_number"] = serial.where(serial != "")
+
+    # ===== Size =====
+    size = pd.to_numeric(raw["SizeMB"], errors="coerce")
+    reject(
+        size.isna() & (raw["SizeMB"] != ""),
+        "SizeMB", "SizeMB is not a number",
+    )
+    reject(size < 0, "SizeMB", "SizeMB is negative")
+    out["size_mb"] = size
+
+    # ===== Modified =====
+    modified = pd.to_datetime(raw["Modified"], errors="coerce")
+    retry = modified.isna() & (raw["Modified"] != "")
+    if retry.any():
+        modified[retry] = pd.to_datetime(
+            raw.loc[retry, "Modified"], errors="coerce", format="mixed"
+        )
+    reject(
+        modified.isna() & (raw["Modified"] != ""),
+        "Modified", "Modified is not a valid date",
+    )
+    out["modified"] = modified
+
+    for error in sorted(errors):
+        report.add(*error)
+
+    valid = out[~invalid]
+    valid = valid.astype(object).where(valid.notna(), None)
+
+    # plain datetime objects, not pandas Timestamps, for every DBAPI
+    modified = valid["modified"].notna()
+    dates = out.loc[~invalid, "modified"].dt.to_pydatetime()
+    valid["modified"] = pd.Series(
+        [d if ok else None for d, ok in zip(dates, modified)],
+        index=valid.index,
+        dtype=object,
+    )
+
+    return valid.to_dict("records")
@@ -0,0 +1,163 @@
+import csv
+import io
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import import_module
+
+from sqlalchemy import select
+
+from extensions import db
+from .models import HardDiskSummary
+from .archive import hard_disk_table
+
+
+# Rows fetched per round trip when streaming from the DB cursor
+STREAM_BATCH_SIZE = 2000
+
+# Export layout; the dedup hash columns stay internal
+EXPORT_COLUMNS = (
+    "id", "disk_name", "serial_number", "file_name", "full_path",
+    "size_mb", "modified", "uploaded_by", "uploaded_at",
+)
+
+
+class NoDataToExport(Exception):
+    """Raised when the export filter matches no rows."""
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    name: str
+    mimetype: str
+    # "module:function" taking (serial, output, include_archive=False);
+    # imported on first use so openpyxl / reportlab stay out of worker startup
+    writer: str
+
+    def write(self, serial, output, include_archive=False):
+        _load_writer(self.writer)(serial, output, include_archive=include_archive)
+
+
+_formats = {}
+
+
+def register_export_format(name, mimetype, writer):
+    _formats[name] = ExportFormat(name, mimetype, writer)
+
+
+def get_export_format(name):
+    return _formats.get(name)
+
+
+@lru_cache(maxsize=None)
+def _load_writer(path):
+    module, _, attr = path.partition(":")
+    return getattr(import_module(module), attr)
+
+
+def export_filename(fmt, serial=None):
+    if fmt == "pdf":
+        return "hard_disk_backup.pdf"
+    return f"hard_disk_{serial or 'all'}.{fmt}"
+
+
+def has_hard_disk_rows(serial=None, include_archive=False):
+    table = hard_disk_table(include_archive)
+    stmt = select(table.c.id)
+    if serial:
+        stmt = stmt.where(table.c.serial_number == serial)
+    return db.session.query(stmt.exists()).scalar()
+
+
+def iter_hard_disk_partitions(serial=None, columns=None, batch_size=STREAM_BATCH_SIZE,
+                              include_archive=False):
+    """
+    Yield the export rows as lists of ``batch_size`` tuples, read through
+    a streaming cursor so only one batch is in memory at a time.
+    ``columns`` restricts/orders the selected column names (default:
+    EXPORT_COLUMNS).
+    """
+    table = hard_disk_table(include_archive)
+    selected = [table.c[name] for name in columns or EXPORT_COLUMNS]
+    stmt = (
+        select(*selected)
+        .order_by(table.c.modified.desc())
+        .execution_options(stream_results=True, yield_per=batch_size)
+    )
+    if serial:
+        stmt = stmt.where(table.c.serial_number == serial)
+
+    result = db.session.execute(stmt)
+    try:
+        for partition in result.partitions():
+            yield partition
+    finally:
+        result.close()
+
+
+def hard_disk_summary_rows(serial=None):
+    query = db.session.query(
+        HardDiskSummary.disk_name,
+        HardDiskSummary.serial_number,
+        HardDiskSummary.total_files,
+        HardDiskSummary.total_size_mb,
+        HardDiskSummary.latest_backup,
+    )
+    if serial:
+        query = query.filter(HardDiskSummary.serial_number == serial)
+
+    return (
+        query
+        .order_by(HardDiskSummary.disk_name, HardDiskSummary.serial_number)
+        .all()
+    )
+
+
+def iter_hard_disk_csv(serial=None, include_archive=False):
+    """Yield the CSV export as text chunks, header first."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    def flush():
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    writer.writerow(EXPORT_COLUMNS)
+    yield flush()
+
+    for partition in iter_hard_disk_partitions(serial, include_archive=include_archive):
+        writer.writerows(partition)
+        yield flush()
+
+
+# =============================
+# EXPORT WRITER
+# =============================
+def write_hard_disk_export(fmt, serial, output, include_archive=False):
+    """
+    Write the hard disk export in ``fmt`` to the binary file ``output``.
+    Used by the download route and by background export jobs.
+    """
+    if not has_hard_disk_rows(serial, include_archive):
+        raise NoDataToExport("No data found for export")
+
+    get_export_format(fmt).write(serial, output, include_archive=include_archive)
+
+
+# ================= CSV =================
+def write_hard_disk_csv(serial, output, include_archive=False):
+    for chunk in iter_hard_disk_csv(serial, include_archive):
+        output.write(chunk.encode("utf-8"))
+
+
+# =============================
+# FORMAT REGISTRY
+# =============================
+register_export_format("csv", "text/csv", "assets.exports:write_hard_disk_csv")
+register_export_format(
+    "xlsx",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "assets.xlsx_export:write_hard_disk_xlsx",
+)
+register_export_format("pdf", "application/pdf", "assets.pdf_report:write_hard_disk_pdf")
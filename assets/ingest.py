@@ -0,0 +1,341 @@
+import hashlib
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from itertools import chain
+from uuid import uuid4
+
+from sqlalchemy import bindparam, exists, func, insert, or_, select, update
+
+from extensions import db
+from utils.data_version import bump_version
+from .models import HardDiskBackup, HardDiskArchive, HardDiskStaging
+from .summary import apply_summary_delta, refresh_disk_summaries
+from .search import index_file_names
+
+
+DEFAULT_BATCH_SIZE = 5000
+
+# Columns copied from staging into HardDiskHistorical
+MERGE_COLUMNS = (
+    "disk_name", "serial_number", "file_name", "full_path", "size_mb",
+    "modified", "uploaded_by", "uploaded_at", "content_hash", "path_hash",
+)
+
+
+# =============================
+# ROW IDENTITY
+# =============================
+def row_hashes(serial_number, full_path, size_mb, modified):
+    """
+    ``(content_hash, path_hash)`` for a hard disk row.
+
+    path_hash identifies the file on a disk (serial + full path);
+    content_hash also covers size and modified, so an unchanged row in a
+    re-uploaded listing hashes the same. Rows stored before the columns
+    existed get them from ``flask assets backfill-hashes``.
+    """
+    path_key = f"{(serial_number or '').strip()}\x1f{full_path or ''}"
+    size = repr(float(size_mb)) if size_mb is not None else ""
+    stamp = modified.isoformat(sep=" ", timespec="seconds") if modified else ""
+
+    return (
+        hashlib.sha1(f"{path_key}\x1f{size}\x1f{stamp}".encode("utf-8")).hexdigest(),
+        hashlib.sha1(path_key.encode("utf-8")).hexdigest(),
+    )
+
+
+# =============================
+# INGEST RESULT
+# =============================
+@dataclass
+class IngestResult:
+    rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    failed: int = 0
+    batches: int = 0
+    failed_batches: list = field(default_factory=list)
+    # [disk_name, serial_number, since] of disks that got rows inserted /
+    # updated; since is the earliest "YYYY-MM-DD" modified written or
+    # replaced (None if none of those rows had one)
+    disks: list = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_sec(self):
+        if not self.elapsed:
+            return 0.0
+        return (self.rows - self.failed) / self.elapsed
+
+    def as_dict(self):
+        data = asdict(self)
+        data["rows_per_sec"] = self.rows_per_sec
+        return data
+
+
+# =============================
+# DELTA INGEST (BATCHED)
+# =============================
+def ingest_hard_disks(rows, uploaded_by, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Merge hard disk rows into HardDiskHistorical, one transaction per
+    batch, so re-uploading a disk listing only writes what changed:
+
+    - same content hash already stored (hot or archived): skipped
+    - same file (serial + full path) with another size / modified: updated;
+      an archived copy is retired and the new version stored hot
+    - otherwise: inserted
+
+    ``rows`` is any iterable of dicts keyed by HardDiskBackup column
+    names. A failing batch is rolled back on its own; batches committed
+    before it are kept.
+    """
+    uploaded_at = datetime.now()
+    result = IngestResult()
+    started = time.perf_counter()
+
+    batch = []
+    for row in rows:
+        row["uploaded_by"] = uploaded_by
+        row["uploaded_at"] = uploaded_at
+        row["content_hash"], row["path_hash"] = row_hashes(
+            row["serial_number"], row["full_path"], row["size_mb"], row["modified"]
+        )
+        batch.append(row)
+
+        if len(batch) >= batch_size:
+            _write_batch(batch, result)
+            batch = []
+
+    if batch:
+        _write_batch(batch, result)
+
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def _write_batch(batch, result):
+    first_row = result.rows + 1
+    result.rows += len(batch)
+    result.batches += 1
+
+    try:
+        inserted, updated, skipped, disks = _merge_batch(batch)
+        # invalidates list page / export validators (ETag)
+        if inserted or updated:
+            bump_version("hard_disk")
+        db.session.commit()
+
+        result.inserted += inserted
+        result.updated += updated
+        result.skipped += skipped
+        for (disk_name, serial), modified in disks.items():
+            _add_disk(result, disk_name, serial, modified)
+
+    except Exception as e:
+        db.session.rollback()
+        result.failed += len(batch)
+        result.failed_batches.append({
+            "first_row": first_row,
+            "last_row": first_row + len(batch) - 1,
+            "error": str(getattr(e, "orig", e)),
+        })
+
+
+def _add_disk(result, disk_name, serial, modified):
+    since = modified.date().isoformat() if modified else None
+    for entry in result.disks:
+        if entry[:2] == [disk_name, serial]:
+            if since and (entry[2] is None or since < entry[2]):
+                entry[2] = since
+            return
+    result.disks.append([disk_name, serial, since])
+
+
+def _earliest(touched, key, modified):
+    current = touched.get(key)
+    if current is None or (modified is not None and modified < current):
+        touched[key] = modified
+
+
+def _merge_batch(batch):
+    """
+    Stage ``batch`` and merge it set-based; returns (inserted, updated,
+    skipped, {(disk_name, serial) written to: earliest modified written
+    or replaced}).
+    """
+    target = HardDiskBackup.__table__
+    staging = HardDiskStaging.__table__
+    archive = HardDiskArchive.__table__
+    batch_id = uuid4().hex
+    uploaded_at, uploaded_by = batch[0]["uploaded_at"], batch[0]["uploaded_by"]
+
+    # a file listed twice in one upload: the last line wins
+    unique = list({row["path_hash"]: row for row in batch}.values())
+    skipped = len(batch) - len(unique)
+
+    # executemany: pyodbc fast_executemany on MSSQL (see Config),
+    # plain DBAPI executemany everywhere else
+    db.session.execute(
+        insert(staging),
+        [dict({c: row[c] for c in MERGE_COLUMNS}, batch_id=batch_id) for row in unique],
+    )
+    in_batch = staging.c.batch_id == batch_id
+
+    # ===== Unchanged rows (hot or already archived) =====
+    skipped += db.session.execute(
+        staging.delete().where(
+            in_batch,
+            or_(
+                exists().where(target.c.content_hash == staging.c.content_hash),
+                exists().where(archive.c.content_hash == staging.c.content_hash),
+            ),
+        )
+    ).rowcount
+
+    # ===== Changed rows (same file, new size / modified) =====
+    changed = db.session.execute(
+        select(staging.c.path_hash, target.c.disk_name, target.c.serial_number,
+               target.c.modified)
+        .join(target, target.c.path_hash == staging.c.path_hash)
+        .where(in_batch)
+    ).all()
+    # ===== Changed rows whose old version is archived =====
+    # the new version goes in as a hot row; the archived copy is retired
+    # so the file is not listed twice across the hot / cold split
+    retired = db.session.execute(
+        select(staging.c.path_hash, archive.c.disk_name, archive.c.serial_number,
+               archive.c.modified)
+        .join(archive, archive.c.path_hash == staging.c.path_hash)
+        .where(in_batch)
+    ).all()
+    if retired:
+        db.session.execute(
+            archive.delete().where(
+                archive.c.path_hash.in_(select(staging.c.path_hash).where(in_batch))
+            )
+        )
+
+    hot_paths = {row.path_hash for row in changed}
+    changed_paths = hot_paths | {row.path_hash for row in retired}
+    refresh_keys = {(row.disk_name, row.serial_number) for row in chain(changed, retired)}
+
+    updated = 0
+    if changed:
+        updated = db.session.execute(
+            update(target)
+            .where(target.c.path_hash == staging.c.path_hash, in_batch)
+            .values({c: staging.c[c] for c in MERGE_COLUMNS if c != "path_hash"})
+        ).rowcount
+
+    # ===== New rows =====
+    inserted = db.session.execute(
+        insert(target).from_select(
+            MERGE_COLUMNS,
+            select(*(staging.c[c] for c in MERGE_COLUMNS)).where(
+                in_batch,
+                ~exists().where(target.c.path_hash == staging.c.path_hash),
+            ),
+        )
+    ).rowcount
+
+    # inserted as hot rows, but they replace an archived version
+    moved = len(changed_paths - hot_paths)
+    inserted -= moved
+    updated += moved
+
+    pending = set(db.session.execute(
+        select(staging.c.path_hash).where(in_batch)
+    ).scalars())
+    db.session.execute(staging.delete().where(in_batch))
+
+    # ===== Derived tables =====
+    written = [row for row in unique if row["path_hash"] in pending]
+    new_rows = [row for row in written if row["path_hash"] not in changed_paths]
+
+    refresh_keys |= {
+        (row["disk_name"], row["serial_number"])
+        for row in written if row["path_hash"] in changed_paths
+    }
+    if refresh_keys:
+        refresh_disk_summaries(refresh_keys, uploaded_at, uploaded_by)
+
+    delta_rows = [
+        row for row in new_rows
+        if (row["disk_name"], row["serial_number"]) not in refresh_keys
+    ]
+    if delta_rows:
+        apply_summary_delta(delta_rows, uploaded_at, uploaded_by)
+
+    index_file_names(row["file_name"] for row in written)
+
+    # usage rollups are recomputed from the earliest day touched, old
+    # modified of updated rows included
+    disks = {}
+    for row in chain(changed, retired):
+        _earliest(disks, (row.disk_name, row.serial_number), row.modified)
+    for row in written:
+        _earliest(disks, (row["disk_name"], row["serial_number"]), row["modified"])
+
+    return inserted, updated, skipped, disks
+
+
+# =============================
+# EXISTING ROWS
+# =============================
+def backfill_row_hashes(batch_size=DEFAULT_BATCH_SIZE):
+    """Hash rows stored without content_hash / path_hash; returns the row count."""
+    table = HardDiskBackup.__table__
+    done = 0
+    last_id = 0
+
+    while True:
+        rows = db.session.execute(
+            select(table.c.id, table.c.serial_number, table.c.full_path,
+                   table.c.size_mb, table.c.modified)
+            .where(table.c.id > last_id, table.c.content_hash.is_(None))
+            .order_by(table.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return done
+
+        values = []
+        for row in rows:
+            content_hash, path_hash = row_hashes(
+                row.serial_number, row.full_path, row.size_mb, row.modified
+            )
+            values.append({"row_id": row.id, "content_hash": content_hash, "path_hash": path_hash})
+
+        db.session.execute(
+            update(table)
+            .where(table.c.id == bindparam("row_id"))
+            .values(content_hash=bindparam("content_hash"), path_hash=bindparam("path_hash")),
+            values,
+        )
+        db.session.commit()
+
+        done += len(rows)
+        last_id = rows[-1].id
+
+
+def delete_duplicate_rows():
+    """
+    Drop rows whose content_hash is already stored under a lower id (what
+    re-uploads inserted before dedup). Summary rebuild and version bump
+    are left to the caller.
+    """
+    table = HardDiskBackup.__table__
+    keep = (
+        select(func.min(table.c.id))
+        .where(table.c.content_hash.is_not(None))
+        .group_by(table.c.content_hash)
+    )
+
+    deleted = db.session.execute(
+        table.delete().where(table.c.content_hash.is_not(None), table.c.id.not_in(keep))
+    ).rowcount
+    db.session.commit()
+    return deleted
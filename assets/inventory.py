@@ -0,0 +1,115 @@
+from collections import defaultdict
+from itertools import groupby
+
+from sqlalchemy import func
+
+from utils.cache import VersionedLRUCache
+from utils.data_version import get_version
+from .models import ServerAsset
+
+
+SERVER_COLUMNS = (
+    "id", "hostname", "ip_address", "environment", "segment",
+    "os", "owner", "cpu", "ram", "storage",
+)
+
+# Distinct filter combinations kept per worker
+SERVER_VIEW_CACHE_SIZE = 64
+
+_server_view_cache = VersionedLRUCache(maxsize=SERVER_VIEW_CACHE_SIZE)
+
+
+# =========================
+# SERVER INVENTORY VIEW (CACHED)
+# =========================
+def get_server_view(segment_filter=None, env_filter=None, search=None, version=None):
+    """
+    Grouped rows, segment totals and counters for the server list.
+
+    Cached per filter combination and tagged with the "servers" data
+    version, which create/edit/delete bump, so every worker rebuilds
+    after a write anywhere.
+    """
+    key = (segment_filter or None, env_filter or None, search or None)
+    if version is None:
+        version = get_version("servers")
+
+    view = _server_view_cache.get(key, version)
+    if view is None:
+        view = build_server_view(*key)
+        _server_view_cache.set(key, version, view)
+
+    return view
+
+
+def filter_servers(query, segment_filter=None, env_filter=None, search=None):
+    if segment_filter:
+        query = query.filter(ServerAsset.segment == segment_filter)
+    if env_filter:
+        query = query.filter(ServerAsset.environment == env_filter)
+    if search:
+        query = query.filter(ServerAsset.hostname.ilike(f"%{search}%"))
+    return query
+
+
+def build_server_view(segment_filter=None, env_filter=None, search=None):
+    query = filter_servers(ServerAsset.query, segment_filter, env_filter, search)
+
+    # Plain dicts, so cached rows never touch a closed session
+    servers = (
+        query
+        .with_entities(*(getattr(ServerAsset, c) for c in SERVER_COLUMNS))
+        .order_by(ServerAsset.segment, ServerAsset.hostname)
+        .all()
+    )
+
+    # ================= Group servers (already ordered by segment) =================
+    grouped = {
+        seg: [dict(row._mapping) for row in rows]
+        for seg, rows in groupby(servers, key=lambda s: s.segment)
+    }
+
+    # ================= Totals per segment / environment (one SQL query) =================
+    aggregates = (
+        query
+        .with_entities(
+            ServerAsset.segment,
+            ServerAsset.environment,
+            func.count().label("servers"),
+            func.coalesce(func.sum(ServerAsset.cpu), 0).label("cpu"),
+            func.coalesce(func.sum(ServerAsset.ram), 0).label("ram_gb"),
+            func.coalesce(func.sum(ServerAsset.storage), 0).label("storage_gb"),
+        )
+        .group_by(ServerAsset.segment, ServerAsset.environment)
+        .all()
+    )
+
+    segment_totals = defaultdict(lambda: {"cpu": 0, "ram_gb": 0, "storage_gb": 0})
+    env_counts = defaultdict(int)
+
+    for row in aggregates:
+        seg = segment_totals[row.segment]
+        seg["cpu"] += row.cpu
+        seg["ram_gb"] += row.ram_gb
+        seg["storage_gb"] += row.storage_gb
+        env_counts[row.environment] += row.servers
+
+    # Convert RAM and Storage to TB for display
+    for seg, totals in segment_totals.items():
+        totals["ram_tb"] = round(totals["ram_gb"] / 1024, 2)
+        totals["storage_tb"] = round(totals["storage_gb"] / 1024, 2)
+
+    # ===== Dashboard counters =====
+    counters = {
+        "total": sum(env_counts.values()),
+        "prod": env_counts["Production"],
+        "dr": env_counts["Disaster Recovery"],
+        "by_env": dict(env_counts),
+        "by_segment": {seg: len(lst) for seg, lst in grouped.items()}
+    }
+
+    return {
+        "grouped": grouped,
+        "segment_totals": dict(segment_totals),
+        "counters": counters,
+    }
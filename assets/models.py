@@ -4,12 +4,26 @@ from extensions import db
 
 class HardDiskBackup(db.Model):
     __tablename__ = "HardDiskHistorical"
+    __table_args__ = (
+        # export by serial, ORDER BY modified DESC
+        db.Index("IX_HardDiskHistorical_Serial_Modified", "serial_number", "modified"),
+        # date range filter, full export ORDER BY modified DESC
+        db.Index("IX_HardDiskHistorical_Modified", "modified"),
+        # search IN (disk_name) / summary rebuild GROUP BY
+        db.Index("IX_HardDiskHistorical_Disk_Serial", "disk_name", "serial_number"),
+        # upload dedup: unchanged row / same file on the same disk
+        db.Index("IX_HardDiskHistorical_ContentHash", "content_hash"),
+        db.Index("IX_HardDiskHistorical_PathHash", "path_hash"),
+        # archived rows keep their id; SQLite would otherwise hand the
+        # highest ids out again once they were moved (IDENTITY never does)
+        {"sqlite_autoincrement": True},
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
     disk_name = db.Column(db.String(200), nullable=False)
-    serial_number = db.Column(db.String(50), index=True)
-    file_name = db.Column(db.String(255), nullable=False)
+    serial_number = db.Column(db.String(50))
+    file_name = db.Column(db.String(255), nullable=False, index=True)
     full_path = db.Column(db.Text)
     size_mb = db.Column(db.Float)
     modified = db.Column(db.DateTime)
@@ -17,12 +31,81 @@ class HardDiskBackup(db.Model):
     uploaded_by = db.Column(db.String(100))
     uploaded_at = db.Column(db.DateTime, default=datetime.now)
 
+    # sha1 of (serial, full_path, size, modified) / (serial, full_path),
+    # see assets.ingest.row_hashes
+    content_hash = db.Column(db.String(40))
+    path_hash = db.Column(db.String(40))
+
     def __repr__(self):
         return f"<HardDiskBackup {self.file_name}>"
 
 
+# Upload batches land here first and are merged into HardDiskHistorical
+# set-based; rows are removed again in the same transaction
+class HardDiskStaging(db.Model):
+    __tablename__ = "HardDiskStaging"
+
+    id = db.Column(db.Integer, primary_key=True)
+    batch_id = db.Column(db.String(32), nullable=False, index=True)
+
+    disk_name = db.Column(db.String(200), nullable=False)
+    serial_number = db.Column(db.String(50))
+    file_name = db.Column(db.String(255), nullable=False)
+    full_path = db.Column(db.Text)
+    size_mb = db.Column(db.Float)
+    modified = db.Column(db.DateTime)
+
+    uploaded_by = db.Column(db.String(100))
+    uploaded_at = db.Column(db.DateTime)
+
+    content_hash = db.Column(db.String(40), nullable=False)
+    path_hash = db.Column(db.String(40), nullable=False)
+
+
+# Cold tier: rows moved out of HardDiskHistorical by `flask assets archive`
+# (ids kept). Only read when a page / export asks for the archive.
+class HardDiskArchive(db.Model):
+    __tablename__ = "HardDiskHistoricalArchive"
+    __table_args__ = (
+        db.Index("IX_HardDiskHistoricalArchive_Serial_Modified", "serial_number", "modified"),
+        db.Index("IX_HardDiskHistoricalArchive_Modified", "modified"),
+        db.Index("IX_HardDiskHistoricalArchive_Disk_Serial", "disk_name", "serial_number"),
+        # upload dedup: a re-uploaded archived row is not inserted again
+        db.Index("IX_HardDiskHistoricalArchive_ContentHash", "content_hash"),
+        # a changed file re-uploaded after archival replaces its archived row
+        db.Index("IX_HardDiskHistoricalArchive_PathHash", "path_hash"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+
+    disk_name = db.Column(db.String(200), nullable=False)
+    serial_number = db.Column(db.String(50))
+    file_name = db.Column(db.String(255), nullable=False, index=True)
+    full_path = db.Column(db.Text)
+    size_mb = db.Column(db.Float)
+    modified = db.Column(db.DateTime)
+
+    uploaded_by = db.Column(db.String(100))
+    uploaded_at = db.Column(db.DateTime)
+
+    content_hash = db.Column(db.String(40))
+    path_hash = db.Column(db.String(40))
+
+    archived_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<HardDiskArchive {self.file_name}>"
+
+
 class ServerAsset(db.Model):
     __tablename__ = "ServerAssets"
+    __table_args__ = (
+        # segment filter, ORDER BY segment, hostname
+        db.Index("IX_ServerAssets_Segment_Hostname", "segment", "hostname"),
+        # environment filter, ORDER BY segment, hostname
+        db.Index("IX_ServerAssets_Env_Segment_Hostname", "environment", "segment", "hostname"),
+        db.Index("IX_ServerAssets_IP", "ip_address"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -36,6 +119,71 @@ class ServerAsset(db.Model):
     created_by = db.Column(db.String(50))
     created_at = db.Column(db.DateTime, default=datetime.now)
     
-    cpu = db.Column(db.String(50))        # e.g., "16 cores"
-    ram = db.Column(db.String(50))        # e.g., "64 GB"
-    storage = db.Column(db.String(50))    # e.g., "2 TB"
\ No newline at end of file
+    cpu = db.Column(db.Integer)           # cores
+    ram = db.Column(db.Integer)           # GB
+    storage = db.Column(db.Integer)       # GB
+
+
+# Per disk/serial rollup of HardDiskHistorical, kept current by uploads
+class HardDiskSummary(db.Model):
+    __tablename__ = "HardDiskSummary"
+    __table_args__ = (
+        db.UniqueConstraint("disk_name", "serial_number", name="UQ_HardDiskSummary_Disk"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    disk_name = db.Column(db.String(200), nullable=False)
+    serial_number = db.Column(db.String(50))
+
+    # totals cover the whole history, archived_files of them are in
+    # HardDiskHistoricalArchive
+    total_files = db.Column(db.BigInteger, nullable=False, default=0)
+    total_size_mb = db.Column(db.Float, nullable=False, default=0)
+    latest_backup = db.Column(db.DateTime)
+    archived_files = db.Column(db.BigInteger, nullable=False, default=0)
+
+    last_upload_at = db.Column(db.DateTime)
+    last_uploaded_by = db.Column(db.String(100))
+
+    def __repr__(self):
+        return f"<HardDiskSummary {self.disk_name} {self.serial_number}>"
+
+
+# Per-disk growth per day ("D") / month ("M") by file modified date, over
+# the hot and archived history; rebuilt per disk by assets.usage_rollup
+class HardDiskUsage(db.Model):
+    __tablename__ = "HardDiskUsage"
+    __table_args__ = (
+        db.UniqueConstraint(
+            "period", "disk_name", "serial_number", "bucket", name="UQ_HardDiskUsage_Bucket"
+        ),
+        # projection: every disk's daily buckets since a date
+        db.Index("IX_HardDiskUsage_Period_Bucket", "period", "bucket"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    period = db.Column(db.String(1), nullable=False)
+    bucket = db.Column(db.Date, nullable=False)
+
+    disk_name = db.Column(db.String(200), nullable=False)
+    serial_number = db.Column(db.String(50))
+
+    files_added = db.Column(db.BigInteger, nullable=False, default=0)
+    mb_added = db.Column(db.Float, nullable=False, default=0)
+    cumulative_mb = db.Column(db.Float, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<HardDiskUsage {self.period} {self.serial_number} {self.bucket}>"
+
+
+# Search side table: lowercase alphanumeric tokens of each distinct file name
+class HardDiskSearchToken(db.Model):
+    __tablename__ = "HardDiskSearchTokens"
+
+    token = db.Column(db.String(64), primary_key=True)
+    file_name = db.Column(db.String(255), primary_key=True)
+
+    def __repr__(self):
+        return f"<HardDiskSearchToken {self.token} {self.file_name}>"
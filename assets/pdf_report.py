@@ -0,0 +1,172 @@
+from datetime import datetime
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import (
+    SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+)
+
+from .exports import hard_disk_summary_rows, iter_hard_disk_partitions
+
+
+# (column, header, width)
+PDF_COLUMNS = [
+    ("disk_name", "Disk", 80),
+    ("serial_number", "Serial", 80),
+    ("file_name", "File Name", 140),
+    ("full_path", "Full Path", 180),
+    ("size_mb", "Size (MB)", 70),
+    ("modified", "Modified", 110),
+    ("uploaded_by", "Uploaded By", 90),
+    ("uploaded_at", "Uploaded At", 110),
+]
+
+# Roughly one landscape A4 page of 8pt rows per Table flowable
+ROWS_PER_TABLE = 36
+
+TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+    ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+    ("FONT", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("ALIGN", (4, 1), (4, -1), "RIGHT"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("FONTSIZE", (0, 0), (-1, -1), 8),
+])
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M")
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    return str(value)
+
+
+# =============================
+# LAZY FLOWABLE LIST
+# =============================
+class _FlowableStream(list):
+    """
+    List handed to ``doc.build`` that refills itself from a generator.
+
+    ReportLab consumes flowables from the front and checks ``len()``
+    before each one, so keeping only a couple of tables buffered lets a
+    report of any size render with flat memory.
+    """
+
+    def __init__(self, source):
+        super().__init__()
+        self._source = iter(source)
+
+    def __len__(self):
+        while self._source is not None and super().__len__() < 2:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+        return super().__len__()
+
+
+# =============================
+# EXPORT WRITER
+# =============================
+def write_hard_disk_pdf(serial, output, include_archive=False):
+    """Registered "pdf" export format (see assets/exports.py)."""
+    render_hard_disk_pdf(
+        output,
+        hard_disk_summary_rows(serial),
+        iter_hard_disk_partitions(
+            serial, columns=[name for name, _, _ in PDF_COLUMNS],
+            include_archive=include_archive,
+        ),
+    )
+
+
+# =============================
+# RENDERER
+# =============================
+def render_hard_disk_pdf(output, summary, partitions, rows_per_table=ROWS_PER_TABLE):
+    """
+    Render the hard disk report to ``output``.
+
+    ``summary`` is an iterable of (disk_name, serial_number, total_files,
+    total_size_mb, latest_backup); ``partitions`` yields batches of rows
+    ordered like PDF_COLUMNS. Rows are laid out in page-sized tables so
+    layout cost stays linear in the row count.
+    """
+    doc = SimpleDocTemplate(
+        output,
+        pagesize=landscape(A4),
+        rightMargin=20,
+        leftMargin=20,
+        topMargin=20,
+        bottomMargin=20,
+    )
+
+    styles = getSampleStyleSheet()
+
+    doc.build(_FlowableStream(
+        _report_flowables(styles, summary, partitions, rows_per_table)
+    ))
+
+
+def _report_flowables(styles, summary, partitions, rows_per_table):
+
+    # ===== Title =====
+    yield Paragraph("Hard Disk Cold Storage Report", styles["Title"])
+
+    # ===== Per-disk summary =====
+    yield Paragraph("Disk Summary", styles["Heading2"])
+
+    summary_data = [["Disk", "Serial", "Total Files", "Total Size (GB)", "Latest Backup"]]
+    for disk_name, serial, files, size_mb, latest in summary:
+        summary_data.append([
+            _cell(disk_name),
+            _cell(serial),
+            f"{files:,}",
+            f"{(size_mb or 0) / 1024:,.2f}",
+            _cell(latest),
+        ])
+
+    summary_table = Table(
+        summary_data,
+        repeatRows=1,
+        colWidths=[160, 100, 90, 110, 120],
+    )
+    summary_table.setStyle(TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+        ("FONT", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("ALIGN", (2, 1), (3, -1), "RIGHT"),
+        ("FONTSIZE", (0, 0), (-1, -1), 8),
+    ]))
+    yield summary_table
+
+    # ===== Detail tables (one per page-sized chunk) =====
+    yield PageBreak()
+    yield Paragraph("Files", styles["Heading2"])
+    yield Spacer(1, 4)
+
+    header = [title for _, title, _ in PDF_COLUMNS]
+    widths = [width for _, _, width in PDF_COLUMNS]
+
+    chunk = []
+    for partition in partitions:
+        for row in partition:
+            chunk.append([_cell(v) for v in row])
+
+            if len(chunk) >= rows_per_table:
+                yield _detail_table(header, chunk, widths)
+                chunk = []
+
+    if chunk:
+        yield _detail_table(header, chunk, widths)
+
+
+def _detail_table(header, rows, widths):
+    table = Table([header] + rows, repeatRows=1, colWidths=widths)
+    table.setStyle(TABLE_STYLE)
+    return table
@@ -1,15 +1,33 @@
-import pandas as pd
-from flask import render_template, request, redirect, url_for, flash, Response, send_file
+from flask import render_template, request, redirect, url_for, flash, Response, send_file, abort, stream_with_context, make_response
 from flask_login import login_required, current_user
-import io 
-from reportlab.lib.pagesizes import A4 
-from reportlab.pdfgen import canvas
+import tempfile
 from extensions import db
-from .models import HardDiskBackup, ServerAsset
+from .models import HardDiskSummary, ServerAsset
+from .search import filter_hard_disks
+from .inventory import get_server_view
+from .archive import hard_disk_model, wants_archive
+from .usage import PERIODS, project_disks, usage_series, growth_chart
+from .exports import (
+    write_hard_disk_export, export_filename, get_export_format, NoDataToExport,
+    has_hard_disk_rows, iter_hard_disk_csv,
+)
 from . import assets_bp
+from jobs.runner import submit_job, job_file_path
 from sqlalchemy import func 
 from decorators import operator_or_admin_required
-from collections import defaultdict
+from utils.keyset import keyset_paginate
+from utils.data_version import bump_version, get_stamp
+from utils.conditional import Validators
+from uuid import uuid4
+from datetime import date
+
+
+def _viewer():
+    # pages show role-dependent buttons and the navbar's user name
+    return (
+        f"{current_user.user_id}:{current_user.role}:"
+        f"{current_user.username}:{current_user.full_name}"
+    )
 
 
 # =============================
@@ -18,54 +36,64 @@ from collections import defaultdict
 @assets_bp.route("/hard-disk")
 @login_required
 def hard_disk_list():
-    page = request.args.get("page", 1, type=int)
+    # ===== Conditional GET: 304 before any query / rendering =====
+    version, updated_at = get_stamp("hard_disk")
+    validators = Validators(
+        "hard_disk_list", version, sorted(request.args.items(multi=True)), _viewer(),
+        last_modified=updated_at,
+    )
+    not_modified = validators.not_modified()
+    if not_modified:
+        return not_modified
+
+    cursor = request.args.get("cursor")
     per_page = 20
 
     # ===== Filters =====
     keyword = request.args.get("q", "").strip()
     start_date = request.args.get("start")
     end_date = request.args.get("end")
+    include_archive = wants_archive(request.args)
 
-    query = HardDiskBackup.query
+    # ===== Hot table only, unless the archive is asked for =====
+    model = hard_disk_model(include_archive)
 
-    # ===== Search =====
-    if keyword:
-        query = query.filter(
-            HardDiskBackup.disk_name.ilike(f"%{keyword}%") |
-            HardDiskBackup.serial_number.ilike(f"%{keyword}%") |
-            HardDiskBackup.file_name.ilike(f"%{keyword}%")
-        )
+    # ===== Search (indexed, see assets/search.py) + date range =====
+    query = filter_hard_disks(db.session.query(model), keyword, start_date, end_date, model)
 
-    # ===== Date Range =====
-    if start_date:
-        query = query.filter(HardDiskBackup.modified >= start_date)
+    # ===== Keyset pagination on id (no OFFSET / COUNT) =====
+    pagination = keyset_paginate(query, model.id, per_page, cursor)
 
-    if end_date:
-        query = query.filter(HardDiskBackup.modified <= end_date)
+    filtered = bool(keyword or start_date or end_date)
 
-    pagination = (
-        query
-        .order_by(HardDiskBackup.id.asc())
-        .paginate(page=page, per_page=per_page, error_out=False)
-    )
-
-    # ===== Summary (filtered) =====
-    summary = (
-        db.session.query(
-            HardDiskBackup.disk_name,
-            HardDiskBackup.serial_number,
-            func.count().label("total_files"),
-            func.sum(HardDiskBackup.size_mb).label("total_size_mb"),
-            func.max(HardDiskBackup.modified).label("latest_backup"),
+    if not filtered:
+        # Unfiltered total is exact and O(disks) from the rollup
+        total = HardDiskSummary.total_files
+        if not include_archive:
+            total = total - HardDiskSummary.archived_files
+        pagination.total = (
+            db.session.query(func.coalesce(func.sum(total), 0))
+            .scalar()
         )
-        .group_by(
-            HardDiskBackup.disk_name,
-            HardDiskBackup.serial_number
+    elif request.args.get("count") == "1":
+        pagination.total = query.order_by(None).count()
+
+    # ===== Summary (rollup table, one row per disk) =====
+    summary_query = HardDiskSummary.query
+
+    if keyword:
+        summary_query = summary_query.filter(
+            HardDiskSummary.disk_name.ilike(f"%{keyword}%") |
+            HardDiskSummary.serial_number.ilike(f"%{keyword}%")
         )
+
+    summary = (
+        summary_query
+        .order_by(HardDiskSummary.disk_name, HardDiskSummary.serial_number)
         .all()
     )
 
-    return render_template(
+    return validators.apply(make_response(render_template(
         "assets/hard_disk_list.html",
         data=pagination.items,
         pagination=pagination,
@@ -73,8 +101,55 @@ def hard_disk_list():
         keyword=keyword,
         start_date=start_date,
         end_date=end_date,
+        include_archive=include_archive,
+        filtered=filtered,
+    )))
+
+# =============================
+# HARD DISK CAPACITY / GROWTH
+# =============================
+@assets_bp.route("/hard-disk/capacity")
+@login_required
+def hard_disk_capacity():
+    # ===== Conditional GET (projection also moves with the date) =====
+    version, updated_at = get_stamp("hard_disk")
+    validators = Validators(
+        "hard_disk_capacity", version, date.today(),
+        sorted(request.args.items(multi=True)), _viewer(),
+        last_modified=updated_at,
+    )
+    not_modified = validators.not_modified()
+    if not_modified:
+        return not_modified
+
+    # ===== Rollups only: O(disks * days) + O(buckets of one disk) =====
+    projections = project_disks()
+
+    period = request.args.get("period", "M")
+    if period not in PERIODS:
+        period = "M"
+
+    selected = next(
+        (p for p in projections if p.serial_number == request.args.get("serial")),
+        projections[0] if projections else None,
     )
 
+    series, chart = [], None
+    if selected:
+        series = usage_series(selected.disk_name, selected.serial_number, period)
+        chart = growth_chart(series, selected.capacity_mb)
+
+    return validators.apply(make_response(render_template(
+        "assets/hard_disk_capacity.html",
+        projections=projections,
+        selected=selected,
+        period=period,
+        periods=PERIODS,
+        series=series,
+        chart=chart,
+    )))
+
+
 # =============================
 # UPLOAD CSV FORM
 # =============================
@@ -89,39 +164,18 @@ def hard_disk_upload():
             flash("Please upload a valid CSV file", "danger")
             return redirect(request.url)
 
-        try:
-            df = pd.read_csv(file)
+        # Parse + insert run in a background job (assets/tasks.py, runner in jobs/runner.py)
+        path = job_file_path(f"upload_{uuid4().hex}.csv")
+        file.save(path)
 
-            # === YOUR EXISTING LOGIC (UNCHANGED) ===
-            df["SerialNumber"] = df["SerialNumber"].astype(str).str[-8:]
-
-            df = df.rename(columns={"SizeMB": "Size"})[
-                ["DiskName", "SerialNumber", "FileName", "FullPath", "Size", "Modified"]
-            ]
-
-            df["Modified"] = pd.to_datetime(df["Modified"])
-
-            # === INSERT INTO DB ===
-            for _, row in df.iterrows():
-                record = HardDiskBackup(
-                    disk_name=row["DiskName"],
-                    serial_number=row["SerialNumber"],
-                    file_name=row["FileName"],
-                    full_path=row["FullPath"],
-                    size_mb=row["Size"],
-                    modified=row["Modified"],
-                    uploaded_by=current_user.username
-                )
-                db.session.add(record)
-
-            db.session.commit()
-            flash("Hard disk data uploaded successfully", "success")
-
-            return redirect(url_for("assets.hard_disk_list"))
+        job = submit_job(
+            "hard_disk_upload",
+            {"path": path, "filename": file.filename},
+            created_by=current_user.username,
+        )
 
-        except Exception as e:
-            db.session.rollback()
-            flash(f"CSV processing failed: {e}", "danger")
+        flash("Upload queued for processing", "info")
+        return redirect(url_for("jobs.detail", job_id=job.id))
 
     return render_template("hard_disk_upload.html")
 
@@ -133,124 +187,82 @@ def hard_disk_upload():
 def export_hard_disk(fmt):
 
     serial = request.args.get("serial")
+    include_archive = wants_archive(request.args)
 
-    query = HardDiskBackup.query
+    export_format = get_export_format(fmt)
+    if export_format is None:
+        abort(404)
 
-    # ✅ Filter by Serial Number (optional)
-    if serial:
-        query = query.filter(HardDiskBackup.serial_number == serial)
-
-    query = query.order_by(HardDiskBackup.modified.desc())
-
-    df = pd.read_sql(query.statement, db.engine)
-
-    if df.empty:
-        flash("No data found for export", "warning")
-        return redirect(url_for("assets.hard_disk_list"))
+    # ===== Conditional GET: same data version -> same file =====
+    version, updated_at = get_stamp("hard_disk")
+    validators = Validators(
+        "hard_disk_export", version, fmt, serial, include_archive,
+        last_modified=updated_at,
+    )
+    not_modified = validators.not_modified()
+    if not_modified:
+        return not_modified
 
-    # ================= CSV =================
+    # ================= CSV (STREAMED) =================
     if fmt == "csv":
-        output = io.StringIO()
-        df.to_csv(output, index=False)
-
-        return Response(
-            output.getvalue(),
-            mimetype="text/csv",
-            headers={
-                "Content-Disposition": (
-                    f"attachment; filename=hard_disk_{serial or 'all'}.csv"
-                )
-            }
-        )
+        if not has_hard_disk_rows(serial, include_archive):
+            flash("No data found for export", "warning")
+            return redirect(url_for("assets.hard_disk_list"))
 
-    # ================= XLSX =================
-    elif fmt == "xlsx":
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine="openpyxl") as writer:
-            df.to_excel(writer, index=False, sheet_name="HardDisk")
-
-        output.seek(0)
-        return Response(
-            output,
-            mimetype=(
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            ),
+        return validators.apply(Response(
+            stream_with_context(iter_hard_disk_csv(serial, include_archive)),
+            mimetype=export_format.mimetype,
             headers={
                 "Content-Disposition": (
-                    f"attachment; filename=hard_disk_{serial or 'all'}.xlsx"
+                    f"attachment; filename={export_filename(fmt, serial)}"
                 )
             }
-        )
-
-    # ================= PDF =================
-    elif fmt == "pdf":
-        from reportlab.platypus import (
-            SimpleDocTemplate, Table, TableStyle, Paragraph
-        )
-        from reportlab.lib.pagesizes import A4, landscape
-        from reportlab.lib import colors
-        from reportlab.lib.styles import getSampleStyleSheet
-
-        output = io.BytesIO()
-
-        doc = SimpleDocTemplate(
-            output,
-            pagesize=landscape(A4),
-            rightMargin=20,
-            leftMargin=20,
-            topMargin=20,
-            bottomMargin=20,
-        )
+        ))
 
-        styles = getSampleStyleSheet()
-        elements = []
+    # ================= XLSX / PDF (SPOOLED TO DISK) =================
+    output = tempfile.TemporaryFile()
 
-        # ===== Title =====
-        elements.append(
-            Paragraph("Hard Disk Cold Storage Report", styles["Title"])
-        )
+    try:
+        write_hard_disk_export(fmt, serial, output, include_archive)
+    except NoDataToExport:
+        output.close()
+        flash("No data found for export", "warning")
+        return redirect(url_for("assets.hard_disk_list"))
+    except Exception:
+        output.close()
+        raise
 
-        # ===== Table Data =====
-        table_data = [df.columns.tolist()] + df.values.tolist()
-
-        table = Table(
-            table_data,
-            repeatRows=1,
-            colWidths=[
-                80,   # disk_name
-                80,   # serial
-                140,  # file_name
-                180,  # full_path
-                70,   # size_mb
-                110,  # modified
-                90,   # uploaded_by
-                110,  # uploaded_at
-            ],
-        )
+    output.seek(0)
 
-        table.setStyle(
-            TableStyle([
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-                ("FONT", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("ALIGN", (4, 1), (4, -1), "RIGHT"),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("FONTSIZE", (0, 0), (-1, -1), 8),
-            ])
-        )
+    return validators.apply(send_file(
+        output,
+        mimetype=export_format.mimetype,
+        as_attachment=True,
+        download_name=export_filename(fmt, serial),
+    ))
 
-        elements.append(table)
-        doc.build(elements)
 
-        output.seek(0)
+# =============================
+# EXPORT DATA HARD DISK (BACKGROUND JOB)
+# =============================
+@assets_bp.route("/hard-disk/export/<string:fmt>/job", methods=["POST"])
+@login_required
+def export_hard_disk_job(fmt):
+
+    if get_export_format(fmt) is None:
+        abort(404)
+
+    job = submit_job(
+        "hard_disk_export",
+        {
+            "fmt": fmt,
+            "serial": request.args.get("serial"),
+            "archive": wants_archive(request.args),
+        },
+        created_by=current_user.username,
+    )
 
-        return Response(
-            output,
-            mimetype="application/pdf",
-            headers={
-                "Content-Disposition": "attachment; filename=hard_disk_backup.pdf"
-            }
-        )
+    return redirect(url_for("jobs.detail", job_id=job.id))
 
 
 
@@ -261,64 +273,29 @@ def export_hard_disk(fmt):
 @login_required
 def server_list():
 
-    segment_filter = request.args.get("segment")
-    env_filter = request.args.get("env")
-    search = request.args.get("q")
-
-    query = ServerAsset.query
-    if segment_filter:
-        query = query.filter(ServerAsset.segment == segment_filter)
-    if env_filter:
-        query = query.filter(ServerAsset.environment == env_filter)
-    if search:
-        query = query.filter(ServerAsset.hostname.ilike(f"%{search}%"))
-
-    servers = query.order_by(ServerAsset.segment, ServerAsset.hostname).all()
-
-    # ================= Group servers and calculate totals =================
-    grouped = defaultdict(list)
-    segment_totals = defaultdict(lambda: {"cpu": 0, "ram_gb": 0, "storage_gb": 0})
-
-    for s in servers:
-        grouped[s.segment].append(s)
-
-        # CPU
-        try:
-            segment_totals[s.segment]["cpu"] += int(s.cpu.split()[0]) if s.cpu else 0
-        except:
-            segment_totals[s.segment]["cpu"] += 0
-
-        # RAM in GB
-        try:
-            segment_totals[s.segment]["ram_gb"] += int(s.ram.split()[0]) if s.ram else 0
-        except:
-            segment_totals[s.segment]["ram_gb"] += 0
-
-        # Storage in GB
-        try:
-            segment_totals[s.segment]["storage_gb"] += int(s.storage.split()[0]) if s.storage else 0
-        except:
-            segment_totals[s.segment]["storage_gb"] += 0
-
-    # Convert RAM and Storage to TB for display
-    for seg, totals in segment_totals.items():
-        totals["ram_tb"] = round(totals["ram_gb"] / 1024, 2)
-        totals["storage_tb"] = round(totals["storage_gb"] / 1024, 2)
-
-    # ===== Dashboard counters =====
-    counters = {
-        "total": len(servers),
-        "prod": sum(1 for s in servers if s.environment=="Production"),
-        "dr": sum(1 for s in servers if s.environment=="Disaster Recovery"),
-        "by_segment": {seg: len(lst) for seg, lst in grouped.items()}
-    }
+    # ===== Conditional GET: 304 before touching the cache / DB =====
+    version, updated_at = get_stamp("servers")
+    validators = Validators(
+        "server_list", version, sorted(request.args.items(multi=True)), _viewer(),
+        last_modified=updated_at,
+    )
+    not_modified = validators.not_modified()
+    if not_modified:
+        return not_modified
+
+    view = get_server_view(
+        segment_filter=request.args.get("segment"),
+        env_filter=request.args.get("env"),
+        search=request.args.get("q"),
+        version=version,
+    )
 
-    return render_template(
+    return validators.apply(make_response(render_template(
         "assets/server_list.html",
-        grouped=grouped,
-        segment_totals=segment_totals,
-        counters=counters
-    )
+        grouped=view["grouped"],
+        segment_totals=view["segment_totals"],
+        counters=view["counters"]
+    )))
 
 
 # =========================
@@ -345,6 +322,7 @@ def server_create():
 
 
         db.session.add(server)
+        bump_version("servers")
         db.session.commit()
 
         flash("Server registered successfully", "success")
@@ -362,6 +340,7 @@ def server_delete(id):
     server = ServerAsset.query.get_or_404(id)
 
     db.session.delete(server)
+    bump_version("servers")
     db.session.commit()
 
     flash("Server deleted successfully", "warning")
@@ -387,6 +366,7 @@ def server_edit(id):
         server.ram = int(request.form.get("ram") or 0)
         server.storage = int(request.form.get("storage") or 0)
 
+        bump_version("servers")
         db.session.commit()
         flash("Server updated successfully", "success")
         return redirect(url_for("assets.server_list"))
@@ -0,0 +1,165 @@
+import re
+
+from sqlalchemy import intersect, or_, select, union
+from sqlalchemy.exc import IntegrityError
+
+from extensions import db
+from .models import HardDiskArchive, HardDiskBackup, HardDiskSummary, HardDiskSearchToken
+
+
+TOKEN_RE = re.compile(r"[0-9a-z]+")
+MAX_TOKEN_LENGTH = 64
+
+# Keep IN (...) lists well under the MSSQL 2100 parameter limit
+IN_CHUNK_SIZE = 1000
+
+
+def tokenize(text):
+    if not text:
+        return set()
+    return {t[:MAX_TOKEN_LENGTH] for t in TOKEN_RE.findall(text.lower())}
+
+
+# =============================
+# INDEXING
+# =============================
+def index_file_names(file_names):
+    """
+    Add search tokens for file names not indexed yet.
+
+    Tokens depend only on the file name, so re-uploaded names are skipped.
+    Runs in a savepoint inside the caller's transaction; if a concurrent
+    upload indexes the same name first, that upload's tokens are kept.
+    """
+    table = HardDiskSearchToken.__table__
+    names = list({n for n in file_names if n})
+
+    for start in range(0, len(names), IN_CHUNK_SIZE):
+        chunk = names[start:start + IN_CHUNK_SIZE]
+
+        known = set(db.session.execute(
+            select(table.c.file_name).distinct().where(table.c.file_name.in_(chunk))
+        ).scalars())
+
+        rows = [
+            {"token": token, "file_name": name}
+            for name in chunk if name not in known
+            for token in tokenize(name)
+        ]
+        if not rows:
+            continue
+
+        try:
+            with db.session.begin_nested():
+                db.session.execute(table.insert(), rows)
+        except IntegrityError:
+            pass
+
+
+def rebuild_search_index(batch_size=5000):
+    """
+    Recreate HardDiskSearchTokens from the distinct file names in history,
+    hot and archived (``?archive=1`` searches resolve through it too).
+    """
+    db.session.execute(HardDiskSearchToken.__table__.delete())
+    db.session.commit()
+
+    # UNION, not UNION ALL: a name in both tables is indexed once
+    result = db.session.execute(
+        union(
+            select(HardDiskBackup.file_name),
+            select(HardDiskArchive.file_name),
+        )
+        .execution_options(stream_results=True, yield_per=batch_size)
+    )
+
+    indexed = 0
+    table = HardDiskSearchToken.__table__
+    for partition in result.partitions():
+        rows = [
+            {"token": token, "file_name": name}
+            for (name,) in partition
+            for token in tokenize(name)
+        ]
+        if rows:
+            db.session.execute(table.insert(), rows)
+        indexed += len(partition)
+
+    db.session.commit()
+    return indexed
+
+
+# =============================
+# SEARCH
+# =============================
+def _prefix(column, prefix):
+    # SQLite only seeks an index for LIKE under NOCASE collation; a
+    # range predicate works with the default BINARY index instead.
+    if db.session.get_bind().dialect.name == "sqlite":
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return (column >= prefix) & (column < upper)
+    return column.like(f"{prefix}%")
+
+
+def filter_by_keyword(query, keyword, model=HardDiskBackup):
+    """
+    Apply the hard disk keyword search to ``query``.
+
+    - disk name / serial: substring match on the per-disk summary, then
+      an IN filter on the history table (an exact serial is one of them)
+    - file name: every keyword token must prefix-match a token of the
+      file name, resolved through HardDiskSearchTokens
+
+    The matches are OR'ed, so a keyword that is a serial still finds file
+    names containing it.
+    """
+    conditions = []
+
+    # ===== Disk name / serial (O(disks)) =====
+    disks = (
+        db.session.query(HardDiskSummary.disk_name, HardDiskSummary.serial_number)
+        .filter(
+            HardDiskSummary.disk_name.ilike(f"%{keyword}%") |
+            HardDiskSummary.serial_number.ilike(f"%{keyword}%")
+        )
+        .all()
+    )
+    names = sorted({d.disk_name for d in disks if keyword.lower() in d.disk_name.lower()})
+    serials = sorted({
+        d.serial_number for d in disks
+        if d.serial_number and keyword.lower() in d.serial_number.lower()
+    })
+    if names:
+        conditions.append(model.disk_name.in_(names))
+    if serials:
+        conditions.append(model.serial_number.in_(serials))
+
+    # ===== File name (token prefix index) =====
+    tokens = tokenize(keyword)
+    if tokens:
+        token_col = HardDiskSearchToken.file_name
+        selects = [
+            select(token_col).where(_prefix(HardDiskSearchToken.token, token))
+            for token in sorted(tokens)
+        ]
+        matched = selects[0] if len(selects) == 1 else intersect(*selects)
+        conditions.append(model.file_name.in_(matched))
+    else:
+        # no alphanumerics to index (e.g. "_"), fall back to a scan
+        conditions.append(model.file_name.ilike(f"%{keyword}%"))
+
+    return query.filter(or_(*conditions))
+
+
+def filter_hard_disks(query, keyword=None, start_date=None, end_date=None, model=HardDiskBackup):
+    """Keyword search plus the ``modified`` date range, as on the list page."""
+    if keyword:
+        query = filter_by_keyword(query, keyword, model)
+
+    if start_date:
+        query = query.filter(model.modified >= start_date)
+
+    if end_date:
+        query = query.filter(model.modified <= end_date)
+
+    return query
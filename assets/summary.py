@@ -0,0 +1,155 @@
+from sqlalchemy import case, func, insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
+
+from extensions import db
+from .models import HardDiskSummary
+from .archive import hard_disk_history
+
+
+# =============================
+# INCREMENTAL UPDATE
+# =============================
+def apply_summary_delta(rows, uploaded_at, uploaded_by):
+    """
+    Fold a batch of newly inserted hard disk rows into HardDiskSummary.
+
+    Runs inside the caller's transaction so the summary commits (or rolls
+    back) together with the batch it describes. A disk's first row is
+    inserted in a savepoint: if a concurrent upload inserts it first, the
+    delta is applied to that row instead.
+    """
+    deltas = {}
+    for row in rows:
+        key = (row["disk_name"], row["serial_number"])
+        files, size_mb, latest = deltas.get(key, (0, 0.0, None))
+
+        modified = row["modified"]
+        if modified is not None and (latest is None or modified > latest):
+            latest = modified
+
+        deltas[key] = (files + 1, size_mb + (row["size_mb"] or 0), latest)
+
+    table = HardDiskSummary.__table__
+
+    for (disk_name, serial), (files, size_mb, latest) in deltas.items():
+        latest_expr = table.c.latest_backup
+        if latest is not None:
+            latest_value = literal(latest, db.DateTime)
+            latest_expr = case(
+                (table.c.latest_backup.is_(None), latest_value),
+                (table.c.latest_backup < latest_value, latest_value),
+                else_=table.c.latest_backup,
+            )
+
+        add_delta = (
+            update(table)
+            .where(table.c.disk_name == disk_name, table.c.serial_number == serial)
+            .values(
+                total_files=table.c.total_files + files,
+                total_size_mb=table.c.total_size_mb + size_mb,
+                latest_backup=latest_expr,
+                last_upload_at=uploaded_at,
+                last_uploaded_by=uploaded_by,
+            )
+        )
+
+        if db.session.execute(add_delta).rowcount:
+            continue
+
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(table).values(
+                    disk_name=disk_name,
+                    serial_number=serial,
+                    total_files=files,
+                    total_size_mb=size_mb,
+                    latest_backup=latest,
+                    last_upload_at=uploaded_at,
+                    last_uploaded_by=uploaded_by,
+                ))
+        except IntegrityError:
+            # UQ_HardDiskSummary_Disk: another upload created the row
+            db.session.execute(add_delta)
+
+
+# =============================
+# PER-DISK RECOMPUTE
+# =============================
+def _same_serial(column, serial):
+    # the parser stores an empty serial as NULL
+    return column.is_(None) if serial is None else column == serial
+
+
+def refresh_disk_summaries(keys, uploaded_at, uploaded_by):
+    """
+    Recompute the summary rows of ``keys`` ((disk_name, serial) pairs)
+    from the hot and archived history. Used when rows were updated in
+    place, where a delta cannot move latest_backup backwards. Same
+    transaction as the caller.
+    """
+    table = HardDiskSummary.__table__
+    history = hard_disk_history(with_flag=True)
+
+    for disk_name, serial in keys:
+        files, size_mb, latest, archived = db.session.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(history.c.size_mb), 0),
+                func.max(history.c.modified),
+                func.coalesce(func.sum(history.c.archived), 0),
+            )
+            .where(
+                history.c.disk_name == disk_name,
+                _same_serial(history.c.serial_number, serial),
+            )
+        ).one()
+
+        db.session.execute(
+            table.delete()
+            .where(table.c.disk_name == disk_name, _same_serial(table.c.serial_number, serial))
+        )
+        if files:
+            db.session.execute(insert(table).values(
+                disk_name=disk_name,
+                serial_number=serial,
+                total_files=files,
+                total_size_mb=size_mb,
+                latest_backup=latest,
+                archived_files=archived,
+                last_upload_at=uploaded_at,
+                last_uploaded_by=uploaded_by,
+            ))
+
+
+# =============================
+# FULL REBUILD
+# =============================
+def rebuild_hard_disk_summary():
+    """Recompute HardDiskSummary from the hot and archived history in one statement."""
+    history = hard_disk_history(with_flag=True)
+    source = (
+        select(
+            history.c.disk_name,
+            history.c.serial_number,
+            func.count(),
+            func.coalesce(func.sum(history.c.size_mb), 0),
+            func.max(history.c.modified),
+            func.coalesce(func.sum(history.c.archived), 0),
+            func.max(history.c.uploaded_at),
+        )
+        .group_by(history.c.disk_name, history.c.serial_number)
+    )
+
+    db.session.execute(HardDiskSummary.__table__.delete())
+    db.session.execute(
+        insert(HardDiskSummary.__table__).from_select(
+            [
+                "disk_name", "serial_number", "total_files", "total_size_mb",
+                "latest_backup", "archived_files", "last_upload_at",
+            ],
+            source,
+        )
+    )
+    db.session.commit()
+
+    return HardDiskSummary.query.count()
@@ -0,0 +1,116 @@
+import os
+from datetime import date
+from itertools import chain
+
+from flask import current_app
+
+from extensions import db
+from jobs.runner import job_handler, job_file_path
+from .ingest import ingest_hard_disks
+from .exports import write_hard_disk_export, export_filename
+
+
+# =============================
+# HARD DISK CSV UPLOAD
+# =============================
+@job_handler("hard_disk_upload")
+def run_hard_disk_upload(job, params, progress):
+    # pandas is only needed here; keep it out of worker startup
+    from .csv_parser import iter_hard_disk_batches, ParseReport
+
+    path = params["path"]
+    size = os.path.getsize(path) or 1
+    batch_size = current_app.config["HARD_DISK_UPLOAD_BATCH_SIZE"]
+    report = ParseReport()
+
+    try:
+        with open(path, "rb") as f:
+
+            def tracked(batches):
+                for rows in batches:
+                    yield rows
+                    progress(
+                        min(f.tell() * 100 // size, 99),
+                        f"{report.rows_read:,} rows read",
+                    )
+
+            result = ingest_hard_disks(
+                chain.from_iterable(
+                    tracked(iter_hard_disk_batches(f, report, chunksize=batch_size))
+                ),
+                uploaded_by=job.created_by,
+                batch_size=batch_size,
+            )
+    finally:
+        os.remove(path)
+
+    # ===== Usage rollups =====
+    # the rows are committed by now; a failure here must not fail the job
+    usage_error = None
+    since = {
+        (disk_name, serial): date.fromisoformat(day)
+        for disk_name, serial, day in result.disks if day
+    }
+    if since:
+        from .usage_rollup import refresh_usage_rollups
+
+        progress(99, "Updating usage rollups")
+        try:
+            refresh_usage_rollups(since, since=since)
+        except Exception as e:
+            db.session.rollback()
+            usage_error = str(getattr(e, "orig", e))
+            current_app.logger.exception(
+                "Hard disk upload %s: usage rollup refresh failed", params.get("filename")
+            )
+
+    current_app.logger.info(
+        "Hard disk upload %s: %d rows in %.2fs (%.0f rows/s), "
+        "%d inserted, %d updated, %d skipped, %d rejected, %d failed",
+        params.get("filename"), result.rows, result.elapsed, result.rows_per_sec,
+        result.inserted, result.updated, result.skipped,
+        report.rows_rejected, result.failed,
+    )
+
+    message = (
+        f"{result.inserted:,} rows inserted, "
+        f"{result.updated:,} updated, "
+        f"{result.skipped:,} unchanged, "
+        f"{report.rows_rejected + result.failed:,} rejected"
+    )
+    if usage_error:
+        message += "; usage rollups not updated"
+
+    return {
+        "message": message,
+        "result": {
+            "report": report.as_dict(),
+            "ingest": result.as_dict(),
+            "usage_error": usage_error,
+        },
+    }
+
+
+# =============================
+# HARD DISK EXPORT
+# =============================
+@job_handler("hard_disk_export")
+def run_hard_disk_export(job, params, progress):
+    fmt = params["fmt"]
+    serial = params.get("serial")
+    path = job_file_path(f"{job.id}.{fmt}")
+
+    progress(5, "Exporting")
+
+    try:
+        with open(path, "wb") as f:
+            write_hard_disk_export(fmt, serial, f, params.get("archive", False))
+    except Exception:
+        os.remove(path)
+        raise
+
+    return {
+        "message": "Export ready",
+        "result_path": path,
+        "result_name": export_filename(fmt, serial),
+    }
@@ -0,0 +1,142 @@
+import math
+from dataclasses import dataclass, asdict
+from datetime import date, timedelta
+
+from flask import current_app
+from sqlalchemy import func, select
+
+from extensions import db
+from .models import HardDiskSummary, HardDiskUsage
+
+
+PERIODS = {"D": "Daily", "M": "Monthly"}
+
+
+# =============================
+# CAPACITY
+# =============================
+def capacity_mb(serial):
+    """Disk size from HARD_DISK_CAPACITIES ("SERIAL=GB,..."), else HARD_DISK_CAPACITY_GB."""
+    config = current_app.config
+    overrides = {}
+    for item in config["HARD_DISK_CAPACITIES"].split(","):
+        name, _, size = item.partition("=")
+        if name.strip() and size.strip():
+            overrides[name.strip()] = float(size)
+
+    return overrides.get(serial, config["HARD_DISK_CAPACITY_GB"]) * 1024
+
+
+# =============================
+# PROJECTION
+# =============================
+@dataclass
+class DiskProjection:
+    disk_name: str
+    serial_number: str
+    used_mb: float
+    capacity_mb: float
+    mb_per_day: float = 0.0
+    days_until_full: int = None
+    full_date: date = None
+
+    @property
+    def used_pct(self):
+        return min(self.used_mb / self.capacity_mb * 100, 100) if self.capacity_mb else None
+
+    def as_dict(self):
+        data = asdict(self)
+        data["used_pct"] = self.used_pct
+        return data
+
+
+def project_disks(today=None):
+    """
+    Days until each disk is full at its average growth over the last
+    HARD_DISK_GROWTH_WINDOW_DAYS, from HardDiskSummary and the daily
+    buckets in the window (O(disks * days), no history scan).
+    """
+    today = today or date.today()
+    window = current_app.config["HARD_DISK_GROWTH_WINDOW_DAYS"]
+
+    rows = db.session.execute(
+        select(
+            HardDiskUsage.disk_name,
+            HardDiskUsage.serial_number,
+            func.sum(HardDiskUsage.mb_added),
+        )
+        .where(
+            HardDiskUsage.period == "D",
+            HardDiskUsage.bucket > today - timedelta(days=window),
+        )
+        .group_by(HardDiskUsage.disk_name, HardDiskUsage.serial_number)
+    ).all()
+    recent = {(disk_name, serial): mb for disk_name, serial, mb in rows}
+
+    projections = []
+    for s in HardDiskSummary.query.order_by(HardDiskSummary.disk_name, HardDiskSummary.serial_number):
+        projection = DiskProjection(
+            disk_name=s.disk_name,
+            serial_number=s.serial_number,
+            used_mb=s.total_size_mb,
+            capacity_mb=capacity_mb(s.serial_number),
+            mb_per_day=(recent.get((s.disk_name, s.serial_number)) or 0) / window,
+        )
+
+        remaining = projection.capacity_mb - projection.used_mb
+        if remaining <= 0:
+            projection.days_until_full = 0
+        elif projection.mb_per_day > 0:
+            projection.days_until_full = math.ceil(remaining / projection.mb_per_day)
+
+        if projection.days_until_full is not None:
+            projection.full_date = today + timedelta(days=projection.days_until_full)
+
+        projections.append(projection)
+
+    # closest to full first; disks without recent growth last
+    projections.sort(key=lambda p: (p.days_until_full is None, p.days_until_full or 0))
+    return projections
+
+
+# =============================
+# GROWTH SERIES
+# =============================
+def usage_series(disk_name, serial, period="M"):
+    """Buckets of one disk, oldest first (O(buckets))."""
+    query = HardDiskUsage.query.filter(
+        HardDiskUsage.period == period,
+        HardDiskUsage.disk_name == disk_name,
+    )
+    if serial is None:
+        query = query.filter(HardDiskUsage.serial_number.is_(None))
+    else:
+        query = query.filter(HardDiskUsage.serial_number == serial)
+
+    return query.order_by(HardDiskUsage.bucket).all()
+
+
+def growth_chart(series, capacity, width=720, height=220, pad=30):
+    """SVG coordinates for the cumulative MB line and the capacity line."""
+    if not series:
+        return None
+
+    top = max(capacity, series[-1].cumulative_mb) or 1
+    first = series[0].bucket.toordinal()
+    span = (series[-1].bucket.toordinal() - first) or 1
+
+    def x(bucket):
+        return pad + (bucket.toordinal() - first) / span * (width - 2 * pad)
+
+    def y(mb):
+        return height - pad - mb / top * (height - 2 * pad)
+
+    return {
+        "width": width,
+        "height": height,
+        "points": " ".join(f"{x(b.bucket):.1f},{y(b.cumulative_mb):.1f}" for b in series),
+        "capacity_y": round(y(capacity), 1),
+        "start": series[0].bucket,
+        "end": series[-1].bucket,
+        "pad": pad,
+    }
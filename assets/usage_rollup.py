@@ -0,0 +1,169 @@
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy import and_, or_, select
+
+from extensions import db
+from utils.data_version import bump_version
+from .models import HardDiskUsage
+from .archive import hard_disk_history
+
+
+# Rows aggregated per DataFrame when reading the history
+READ_CHUNK_SIZE = 50000
+
+KEYS = ["disk_name", "serial_number"]
+
+
+def _key_filter(history, keys):
+    conditions = []
+    for disk_name, serial in keys:
+        serial_match = (
+            history.c.serial_number.is_(None) if serial is None
+            else history.c.serial_number == serial
+        )
+        conditions.append(and_(history.c.disk_name == disk_name, serial_match))
+    return or_(*conditions)
+
+
+def _daily(keys=None, start=None, chunksize=READ_CHUNK_SIZE):
+    """
+    (files_added, mb_added) per disk and day from ``start`` on (all
+    history if None), aggregated one chunk at a time.
+    """
+    history = hard_disk_history()
+    stmt = (
+        select(history.c.disk_name, history.c.serial_number,
+               history.c.modified, history.c.size_mb)
+        .where(history.c.modified.is_not(None))
+        .execution_options(stream_results=True, yield_per=chunksize)
+    )
+    if keys is not None:
+        stmt = stmt.where(_key_filter(history, keys))
+    if start is not None:
+        stmt = stmt.where(history.c.modified >= start)
+
+    parts = []
+    result = db.session.execute(stmt)
+    try:
+        for partition in result.partitions():
+            df = pd.DataFrame.from_records(
+                partition, columns=KEYS + ["modified", "size_mb"]
+            )
+            df["bucket"] = pd.to_datetime(df["modified"]).dt.normalize()
+            parts.append(
+                df.groupby(KEYS + ["bucket"], dropna=False)["size_mb"]
+                .agg(files_added="size", mb_added="sum")
+            )
+    finally:
+        result.close()
+
+    if not parts:
+        return None
+
+    # same (disk, day) can span two chunks
+    return pd.concat(parts).groupby(level=[0, 1, 2], dropna=False).sum().reset_index()
+
+
+def _base_totals(keys, start):
+    """cumulative_mb of each disk's last monthly bucket before ``start``."""
+    table = HardDiskUsage.__table__
+    rows = db.session.execute(
+        select(table.c.disk_name, table.c.serial_number, table.c.cumulative_mb)
+        .where(table.c.period == "M", table.c.bucket < start.date(), _key_filter(table, keys))
+        .order_by(table.c.bucket)
+    ).all()
+    # oldest first, so the last bucket of each disk wins
+    return {(row.disk_name, row.serial_number): row.cumulative_mb for row in rows}
+
+
+def _with_cumulative(frame, base=None):
+    frame = frame.sort_values(KEYS + ["bucket"], ignore_index=True)
+    frame["cumulative_mb"] = frame.groupby(KEYS, dropna=False)["mb_added"].cumsum()
+    if base:
+        frame["cumulative_mb"] += [
+            base.get((disk_name, None if pd.isna(serial) else serial), 0.0)
+            for disk_name, serial in zip(frame["disk_name"], frame["serial_number"])
+        ]
+    return frame
+
+
+def _records(frame, period):
+    frame = frame.astype(object).where(frame.notna(), None)
+    return [
+        {
+            "period": period,
+            "bucket": row["bucket"].date(),
+            "disk_name": row["disk_name"],
+            "serial_number": row["serial_number"],
+            "files_added": int(row["files_added"]),
+            "mb_added": float(row["mb_added"]),
+            "cumulative_mb": float(row["cumulative_mb"]),
+        }
+        for row in frame.to_dict("records")
+    ]
+
+
+def _rollups(keys, start, chunksize):
+    """D and M records of ``keys`` from ``start`` (a month start, or None)."""
+    daily = _daily(keys, start, chunksize)
+    if daily is None:
+        return []
+
+    monthly = (
+        daily.assign(bucket=daily["bucket"].dt.to_period("M").dt.to_timestamp())
+        .groupby(KEYS + ["bucket"], dropna=False)[["files_added", "mb_added"]]
+        .sum()
+        .reset_index()
+    )
+    # running totals carry on from the buckets kept before ``start``
+    base = _base_totals(keys, start) if start is not None else None
+    return (
+        _records(_with_cumulative(daily, base), "D")
+        + _records(_with_cumulative(monthly, base), "M")
+    )
+
+
+def refresh_usage_rollups(keys=None, since=None, chunksize=READ_CHUNK_SIZE):
+    """
+    Rebuild the daily / monthly HardDiskUsage buckets of ``keys``
+    ((disk_name, serial) pairs, e.g. the disks an upload touched), or of
+    every disk when ``keys`` is None.
+
+    ``since`` maps a key to the earliest day whose rows changed; that
+    disk's buckets are recomputed from the start of that month only,
+    reading just the history from there on. Keys not in ``since`` are
+    rebuilt from their whole history. Grouping and running totals are
+    vectorized. Commits; returns the number of buckets written.
+    """
+    if keys is None:
+        groups = {None: None}
+    else:
+        since = since or {}
+        groups = {}
+        for key in keys:
+            day = since.get(key)
+            start = datetime(day.year, day.month, 1) if day else None
+            groups.setdefault(start, []).append(key)
+        if not groups:
+            return 0
+
+    table = HardDiskUsage.__table__
+    rows = []
+    for start, group in groups.items():
+        rows += _rollups(group, start, chunksize)
+
+        delete = table.delete()
+        if group is not None:
+            delete = delete.where(_key_filter(table, group))
+        if start is not None:
+            delete = delete.where(table.c.bucket >= start.date())
+        db.session.execute(delete)
+
+    if rows:
+        db.session.execute(table.insert(), rows)
+    # capacity page validators (ETag)
+    bump_version("hard_disk")
+    db.session.commit()
+
+    return len(rows)
@@ -0,0 +1,46 @@
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+
+from .exports import EXPORT_COLUMNS, iter_hard_disk_partitions
+
+
+# Excel hard limit per worksheet (header row included)
+EXCEL_MAX_ROWS = 1048576
+
+
+def write_hard_disk_xlsx(serial, output, max_rows=EXCEL_MAX_ROWS, include_archive=False):
+    """
+    Write-only workbook fed from cursor batches: openpyxl spools each
+    sheet to a temp file instead of keeping the cell tree in memory.
+    Rolls over to a new sheet when ``max_rows`` is reached.
+    """
+    wb = Workbook(write_only=True)
+    columns = EXPORT_COLUMNS
+    bold = Font(bold=True)
+
+    sheet = None
+    sheet_count = 0
+    sheet_rows = max_rows
+
+    for partition in iter_hard_disk_partitions(serial, include_archive=include_archive):
+        for row in partition:
+            if sheet_rows >= max_rows:
+                sheet_count += 1
+                sheet = wb.create_sheet(
+                    "HardDisk" if sheet_count == 1 else f"HardDisk ({sheet_count})"
+                )
+
+                header = []
+                for name in columns:
+                    cell = WriteOnlyCell(sheet, value=name)
+                    cell.font = bold
+                    header.append(cell)
+
+                sheet.append(header)
+                sheet_rows = 1
+
+            sheet.append(tuple(row))
+            sheet_rows += 1
+
+    wb.save(output)
@@ -1,7 +1,7 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from flask_login import login_user, logout_user, login_required, current_user
 from werkzeug.security import check_password_hash, generate_password_hash
-from models import User
+from models import User, invalidate_user
 from extensions import db 
 from utils.password_policy import validate_password
 
@@ -24,6 +24,7 @@ def login():
             return render_template("login.html")
 
         login_user(user)
+        invalidate_user(user.user_id)
 
         # 🚨 FORCE PASSWORD CHANGE
         if user.must_change_password:
@@ -56,10 +57,13 @@ def change_password():
             flash(error, "danger")
             return redirect(url_for("auth.change_password"))
 
-        current_user.password_hash = generate_password_hash(new_password)
-        current_user.must_change_password = False
+        # current_user is a cached, read-only principal
+        user = db.session.get(User, current_user.user_id)
+        user.password_hash = generate_password_hash(new_password)
+        user.must_change_password = False
 
         db.session.commit()
+        invalidate_user(user.user_id)
 
         flash("Password updated successfully", "success")
         return redirect(url_for("main.dashboard"))
@@ -0,0 +1 @@
+"""Local performance benchmarks. Run modules with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,150 @@
+"""
+Hard disk list latency as total history grows, with archival.
+
+    python -m benchmarks.archive --db /tmp/dba_archive.db --hot-rows 200000 --steps 4 --rows-per-step 200000
+
+Seeds a hot set (``benchmarks.synthetic``, modified 2023-2025), then per
+step adds ``--rows-per-step`` older rows, times the pages with all of
+that history still in HardDiskHistorical, runs the archival and times
+them again. Exits non-zero if a gated, archived (hot-only) median of
+the last step is more than ``--max-ratio`` times that of the first.
+
+The file token search is reported but not gated: HardDiskSearchTokens
+indexes every file name in the history, archived or not, so token
+matches keep growing with it.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+
+CUTOFF = datetime(2023, 1, 1)
+STEP_SPAN = timedelta(days=730)
+
+# (name, url, gated)
+SCENARIOS = (
+    ("list: first page", "/assets/hard-disk", True),
+    ("list: one day + count", "/assets/hard-disk?start=2024-03-01&end=2024-03-01 23:59:59&count=1", True),
+    ("search: serial + count", "/assets/hard-disk?q=00000007&count=1", True),
+    ("export csv: one disk", "/assets/hard-disk/export/csv?serial=00000007", True),
+    ("search: file token + count", "/assets/hard-disk?q=DB0042_FULL&count=1", False),
+)
+
+
+def _grow_history(rows, step, batch_size):
+    """Insert ``rows`` rows older than CUTOFF straight into the hot table."""
+    from extensions import db
+    from assets.ingest import row_hashes
+    from assets.models import HardDiskBackup
+    from assets.search import index_file_names
+    from assets.summary import rebuild_hard_disk_summary
+    from .synthetic import iter_hard_disk_rows, _insert
+
+    names = []
+
+    def with_hashes():
+        for row in iter_hard_disk_rows(rows, seed=1000 + step, start=CUTOFF - STEP_SPAN * step):
+            row["content_hash"], row["path_hash"] = row_hashes(
+                row["serial_number"], row["full_path"], row["size_mb"], row["modified"]
+            )
+            names.append(row["file_name"])
+            yield dict(row, uploaded_by="benchmark", uploaded_at=CUTOFF)
+
+    _insert(HardDiskBackup.__table__, with_hashes(), batch_size)
+    index_file_names(names)
+    db.session.commit()
+    rebuild_hard_disk_summary()
+
+
+def _time(client, url, repeat):
+    client.get(url).get_data()                  # warm up
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = client.get(url)
+        response.get_data()
+        timings.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            raise RuntimeError(f"{url}: HTTP {response.status_code}")
+    return statistics.median(timings)
+
+
+def _measure(client, repeat):
+    return {name: _time(client, url, repeat) for name, url, _ in SCENARIOS}
+
+
+def main(argv=None):
+    from .suite import create_benchmark_app, _login
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default="dba_archive_bench.db", help="SQLite file to (re)create")
+    parser.add_argument("--hot-rows", type=int, default=100_000)
+    parser.add_argument("--rows-per-step", type=int, default=100_000)
+    parser.add_argument("--steps", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=9)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--max-ratio", type=float, default=1.5,
+                        help="allowed growth of hot-only medians from first to last step")
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    app = create_benchmark_app(args.db, fresh=True)
+
+    from extensions import db
+    from assets.archive import archive_hard_disks
+    from assets.models import HardDiskBackup, HardDiskArchive
+    from .synthetic import seed_inventory
+
+    print(f"Seeding {args.hot_rows:,} hot rows ...")
+    with app.app_context():
+        seed_inventory(args.hot_rows, 0)
+
+    client = _login(app)
+    steps = []
+
+    for step in range(1, args.steps + 1):
+        with app.app_context():
+            _grow_history(args.rows_per_step, step, args.batch_size)
+            history = db.session.query(HardDiskBackup).count() + db.session.query(HardDiskArchive).count()
+
+        before = _measure(client, args.repeat)
+
+        with app.app_context():
+            archived = archive_hard_disks(CUTOFF, batch_size=args.batch_size)
+
+        after = _measure(client, args.repeat)
+        steps.append({
+            "history_rows": history,
+            "archived_rows": archived.moved,
+            "archive_seconds": archived.elapsed,
+            "unarchived": before,
+            "archived": after,
+        })
+
+        print(f"\nstep {step}: {history:,} rows in history, "
+              f"{archived.moved:,} archived in {archived.elapsed:.1f}s")
+        print(f"{'scenario':<30} {'all hot':>9} {'archived':>9}")
+        for name, _, _ in SCENARIOS:
+            print(f"{name:<30} {before[name] * 1000:>7.1f}ms {after[name] * 1000:>7.1f}ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"hot_rows": args.hot_rows, "steps": steps}, f, indent=2)
+
+    first, last = steps[0]["archived"], steps[-1]["archived"]
+    failures = [
+        f"{name}: {first[name] * 1000:.1f}ms -> {last[name] * 1000:.1f}ms"
+        for name, _, gated in SCENARIOS
+        if gated and last[name] > first[name] * args.max_ratio
+    ]
+    for failure in failures:
+        print(f"FAIL {failure} (over {args.max_ratio}x)")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
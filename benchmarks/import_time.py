@@ -0,0 +1,99 @@
+"""
+Cold import time of the app, from ``python -X importtime``.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget-ms 800 --top 20
+
+Imports ``app`` in fresh interpreters (what every gunicorn worker and
+``flask db`` run pays), prints the slowest top-level imports and exits
+non-zero if the best run is over budget or if a module that should load
+lazily (export / upload engines) was imported.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BUDGET_MS = 1000
+
+# Only needed by uploads / exports; must not load at app import
+LAZY_MODULES = ("pandas", "numpy", "openpyxl", "reportlab")
+
+
+def measure(module, database_url):
+    """One cold import; returns {module name: (self_us, cumulative_us, depth)}."""
+    env = dict(
+        os.environ,
+        DATABASE_URL=database_url,
+        FLASK_SECRET_KEY=os.environ.get("FLASK_SECRET_KEY", "import-time"),
+        PYTHONDONTWRITEBYTECODE="",
+    )
+    env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        timings.setdefault(name.strip(), (int(self_us), int(cumulative_us), depth))
+
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--budget-ms", type=float,
+                        default=float(os.getenv("IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS)))
+    parser.add_argument("--runs", type=int, default=3,
+                        help="fresh interpreters; the fastest run is checked")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--database-url", default="sqlite://",
+                        help="DATABASE_URL for the import (no DB connection is made)")
+    args = parser.parse_args(argv)
+
+    runs = [measure(args.module, args.database_url) for _ in range(args.runs)]
+    best = min(runs, key=lambda t: t[args.module][1])
+    total_ms = best[args.module][1] / 1000
+
+    print(f"{'cumulative':>12} {'self':>9}  module")
+    top_level = sorted(
+        ((name, t) for name, t in best.items() if t[2] <= 1 and name != args.module),
+        key=lambda item: item[1][1],
+        reverse=True,
+    )
+    for name, (self_us, cumulative_us, _) in top_level[:args.top]:
+        print(f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>7.1f}ms  {name}")
+
+    failures = []
+
+    loaded = sorted({
+        name.split(".")[0] for name in best
+        if name.split(".")[0] in LAZY_MODULES
+    })
+    if loaded:
+        failures.append(f"imported at startup but should load lazily: {', '.join(loaded)}")
+
+    if total_ms > args.budget_ms:
+        failures.append(f"import {args.module} took {total_ms:.0f}ms, budget {args.budget_ms:.0f}ms")
+
+    print(f"\nimport {args.module}: {total_ms:.0f}ms (best of {args.runs}), budget {args.budget_ms:.0f}ms")
+    for failure in failures:
+        print(f"FAIL {failure}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
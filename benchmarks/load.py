@@ -0,0 +1,399 @@
+"""
+Concurrent load test of the gunicorn deployment profile.
+
+    python -m benchmarks.load --db /tmp/dba_bench.db --rows 200000 \\
+        --matrix 2x2:gthread 4x2:gthread 4x4:gthread 4x1:sync --users 16 --duration 60
+
+For each ``WORKERSxTHREADS[:CLASS]`` entry the app is started with
+gunicorn.conf.py (GUNICORN_* overrides) against a SQLite copy of the
+inventory. Virtual viewers and operators then log in and loop over a
+weighted mix of list, search, server, export and upload requests. Each
+configuration reports throughput, p50/p95/p99 latency and the peak RSS
+of the master plus its workers.
+
+SQLite serialises writers, so upload latency here is pessimistic
+compared to MSSQL; read paths are representative. RSS is read from
+/proc (Linux only).
+"""
+import argparse
+import http.cookiejar
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from datetime import datetime
+
+from werkzeug.security import generate_password_hash
+
+from .suite import create_benchmark_app, _sample
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOAD_PASSWORD = "benchmark"
+STARTUP_TIMEOUT = 60
+REQUEST_TIMEOUT = 300
+
+# (action, weight); viewers only read, operators also upload / export
+VIEWER_MIX = [
+    ("hard disk list", 30),
+    ("hard disk next page", 10),
+    ("search", 25),
+    ("server list", 20),
+    ("server filter", 10),
+    ("export csv (one disk)", 5),
+]
+OPERATOR_MIX = VIEWER_MIX + [
+    ("export xlsx (one disk)", 4),
+    ("upload csv", 2),
+]
+
+SEARCH_TERMS = ["DB0042", "DB0007_FULL", "COLD-DISK-01", "LOG", "20240115"]
+
+
+# =============================
+# GUNICORN
+# =============================
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_gunicorn(db_path, workers, threads, worker_class, port):
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{os.path.abspath(db_path)}",
+        FLASK_SECRET_KEY=os.environ.get("FLASK_SECRET_KEY", "benchmark"),
+        GUNICORN_WORKERS=str(workers),
+        GUNICORN_THREADS=str(threads),
+        GUNICORN_WORKER_CLASS=worker_class,
+        PROMETHEUS_MULTIPROC_DIR=tempfile.mkdtemp(prefix="dba_load_metrics_"),
+        JOB_POLL_INTERVAL="0.5",
+    )
+
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "gunicorn",
+            "-c", "gunicorn.conf.py",
+            "--bind", f"127.0.0.1:{port}",
+            "--log-level", "warning",
+            "app:app",
+        ],
+        cwd=ROOT,
+        env=env,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with code {process.returncode}")
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/login", timeout=2).read()
+            return process
+        except (urllib.error.URLError, ConnectionError, socket.timeout):
+            time.sleep(0.2)
+
+    stop_gunicorn(process)
+    raise RuntimeError("gunicorn did not start in time")
+
+
+def stop_gunicorn(process):
+    if process.poll() is None:
+        os.killpg(process.pid, signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+
+
+def _children(pid):
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(p) for p in f.read().split()]
+    except OSError:
+        return []
+
+
+def _rss_kb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss(pid):
+    """Resident memory (KB) of ``pid`` and every descendant."""
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        total += _rss_kb(current)
+        stack.extend(_children(current))
+    return total
+
+
+# =============================
+# VIRTUAL USERS
+# =============================
+class VirtualUser:
+    def __init__(self, base_url, username, mix, sample, upload_csv, rng):
+        self.base_url = base_url
+        self.username = username
+        self.mix = mix
+        self.sample = sample
+        self.upload_csv = upload_csv
+        self.rng = rng
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+        )
+
+    def login(self):
+        data = urllib.parse.urlencode(
+            {"username": self.username, "password": LOAD_PASSWORD}
+        ).encode()
+        self.opener.open(f"{self.base_url}/login", data, timeout=REQUEST_TIMEOUT).read()
+
+    def _request(self, path, data=None, headers=None):
+        request = urllib.request.Request(self.base_url + path, data, headers or {})
+        with self.opener.open(request, timeout=REQUEST_TIMEOUT) as response:
+            return response.status, len(response.read())
+
+    def run_action(self, action):
+        serial = self.sample["serial"]
+
+        if action == "hard disk list":
+            return self._request("/assets/hard-disk")
+        if action == "hard disk next page":
+            return self._request(f"/assets/hard-disk?cursor={self.sample['middle_cursor']}")
+        if action == "search":
+            term = urllib.parse.quote(self.rng.choice(SEARCH_TERMS))
+            return self._request(f"/assets/hard-disk?q={term}")
+        if action == "server list":
+            return self._request("/assets/servers")
+        if action == "server filter":
+            segment = self.rng.choice(["CORE", "APP", "DB", "DMZ", "MGMT"])
+            return self._request(f"/assets/servers?segment={segment}")
+        if action == "export csv (one disk)":
+            return self._request(f"/assets/hard-disk/export/csv?serial={serial}")
+        if action == "export xlsx (one disk)":
+            return self._request(f"/assets/hard-disk/export/xlsx?serial={serial}")
+        if action == "upload csv":
+            boundary = f"----load{self.rng.getrandbits(64):x}"
+            body = (
+                f"--{boundary}\r\n"
+                'Content-Disposition: form-data; name="file"; filename="load.csv"\r\n'
+                "Content-Type: text/csv\r\n\r\n"
+            ).encode() + self.upload_csv + f"\r\n--{boundary}--\r\n".encode()
+            return self._request(
+                "/assets/hard-disk/upload", body,
+                {"Content-Type": f"multipart/form-data; boundary={boundary}"},
+            )
+        raise ValueError(action)
+
+    def loop(self, stop_at, samples):
+        actions = [a for a, _ in self.mix]
+        weights = [w for _, w in self.mix]
+
+        while time.monotonic() < stop_at:
+            action = self.rng.choices(actions, weights)[0]
+            started = time.perf_counter()
+            try:
+                status, _ = self.run_action(action)
+                ok = status == 200
+            except (urllib.error.URLError, ConnectionError, socket.timeout, OSError):
+                ok = False
+            samples.append((action, time.perf_counter() - started, ok))
+
+
+# =============================
+# RUN
+# =============================
+def _percentiles(values):
+    if not values:
+        return {"p50": None, "p95": None, "p99": None}
+    ordered = sorted(values)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, round(p / 100 * (len(ordered) - 1)))]
+
+    return {"p50": pct(50), "p95": pct(95), "p99": pct(99)}
+
+
+def run_config(spec, args, sample, upload_csv):
+    workers, threads, worker_class = spec
+    port = _free_port()
+    process = start_gunicorn(args.db, workers, threads, worker_class, port)
+    base_url = f"http://127.0.0.1:{port}"
+
+    try:
+        rng = random.Random(args.seed)
+        users = []
+        for i in range(args.users):
+            operator = i < round(args.users * args.operator_share)
+            users.append(VirtualUser(
+                base_url,
+                "load_operator" if operator else "load_viewer",
+                OPERATOR_MIX if operator else VIEWER_MIX,
+                sample,
+                upload_csv,
+                random.Random(rng.random()),
+            ))
+        for user in users:
+            user.login()
+
+        samples = []
+        peak_rss = process_tree_rss(process.pid)
+        stop_at = time.monotonic() + args.duration
+        threads_ = [
+            threading.Thread(target=user.loop, args=(stop_at, samples), daemon=True)
+            for user in users
+        ]
+
+        started = time.monotonic()
+        for t in threads_:
+            t.start()
+        while any(t.is_alive() for t in threads_):
+            peak_rss = max(peak_rss, process_tree_rss(process.pid))
+            time.sleep(0.5)
+        elapsed = time.monotonic() - started
+    finally:
+        stop_gunicorn(process)
+
+    by_action = defaultdict(list)
+    for action, latency, ok in samples:
+        by_action[action].append((latency, ok))
+
+    latencies = [latency for _, latency, ok in samples if ok]
+    return {
+        "config": f"{workers}x{threads}:{worker_class}",
+        "workers": workers,
+        "threads": threads,
+        "worker_class": worker_class,
+        "users": args.users,
+        "duration": round(elapsed, 2),
+        "requests": len(samples),
+        "errors": sum(1 for *_, ok in samples if not ok),
+        "throughput": round(len(latencies) / elapsed, 2),
+        **_percentiles(latencies),
+        "peak_rss_mb": round(peak_rss / 1024, 1),
+        "actions": {
+            action: {
+                "requests": len(values),
+                "errors": sum(1 for _, ok in values if not ok),
+                **_percentiles([latency for latency, ok in values if ok]),
+            }
+            for action, values in sorted(by_action.items())
+        },
+    }
+
+
+def parse_spec(text):
+    """``4x2:gthread`` -> (4, 2, "gthread"); the class defaults to gthread."""
+    size, _, worker_class = text.partition(":")
+    workers, _, threads = size.lower().partition("x")
+    return int(workers), int(threads or 1), worker_class or "gthread"
+
+
+def _prepare(args):
+    fresh = not (args.reuse and os.path.exists(args.db))
+    app = create_benchmark_app(args.db, fresh=fresh)
+
+    from extensions import db
+    from models import User
+    from .synthetic import seed_inventory
+
+    with app.app_context():
+        if fresh:
+            print(f"Seeding {args.rows:,} hard disk rows and {args.servers:,} servers ...")
+            seed_inventory(args.rows, args.servers, seed=args.seed)
+
+        for username, role in (("load_viewer", "viewer"), ("load_operator", "operator")):
+            if not User.query.filter_by(username=username).first():
+                db.session.add(User(
+                    username=username,
+                    password_hash=generate_password_hash(LOAD_PASSWORD),
+                    role=role,
+                    is_active=True,
+                    must_change_password=False,
+                ))
+        db.session.commit()
+
+        # release the SQLite file before gunicorn opens it
+        db.engine.dispose()
+
+    return _sample(app)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default="dba_bench.db", help="SQLite file")
+    parser.add_argument("--reuse", action="store_true",
+                        help="keep an already seeded --db instead of recreating it")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--servers", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--matrix", nargs="+", default=["2x2:gthread", "4x2:gthread", "4x1:sync"],
+                        help="WORKERSxTHREADS[:CLASS] entries")
+    parser.add_argument("--users", type=int, default=16, help="concurrent virtual users")
+    parser.add_argument("--operator-share", type=float, default=0.25)
+    parser.add_argument("--duration", type=float, default=30, help="seconds per configuration")
+    parser.add_argument("--upload-rows", type=int, default=500)
+    parser.add_argument("--output", default="load_results.json")
+    args = parser.parse_args(argv)
+
+    specs = [parse_spec(s) for s in args.matrix]
+
+    from .synthetic import hard_disk_csv
+
+    sample = _prepare(args)
+    upload_csv = hard_disk_csv(args.upload_rows)
+
+    results = []
+    print(f"{'config':<16} {'req':>7} {'err':>5} {'req/s':>8} "
+          f"{'p50':>8} {'p95':>8} {'p99':>8} {'RSS MB':>8}")
+    for spec in specs:
+        result = run_config(spec, args, sample, upload_csv)
+        results.append(result)
+
+        def ms(v):
+            return f"{v * 1000:.0f}ms" if v is not None else "-"
+
+        print(
+            f"{result['config']:<16} {result['requests']:>7} {result['errors']:>5} "
+            f"{result['throughput']:>8.1f} {ms(result['p50']):>8} {ms(result['p95']):>8} "
+            f"{ms(result['p99']):>8} {result['peak_rss_mb']:>8.1f}"
+        )
+
+    with open(args.output, "w") as f:
+        json.dump({
+            "meta": {
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "db": os.path.abspath(args.db),
+                "users": args.users,
+                "operator_share": args.operator_share,
+                "duration": args.duration,
+                "cpus": os.cpu_count(),
+            },
+            "results": results,
+        }, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
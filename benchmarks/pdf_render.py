@@ -0,0 +1,94 @@
+"""
+PDF export render time against row count.
+
+    python -m benchmarks.pdf_render --rows 1000 5000 20000 100000
+    python -m benchmarks.pdf_render --rows 1000 5000 --legacy
+
+Rows are synthetic and generated in memory, so no database is needed.
+``--legacy`` also times the previous single-Table layout for comparison.
+"""
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from assets.pdf_report import render_hard_disk_pdf, PDF_COLUMNS
+
+
+def synthetic_partitions(rows, disks=8, batch_size=2000):
+    base = datetime(2024, 1, 1)
+    batch = []
+    for i in range(rows):
+        disk = i % disks
+        batch.append((
+            f"COLD-DISK-{disk:02d}",
+            f"SN{disk:06d}",
+            f"DB_FULL_{i:08d}.bak",
+            f"E:\\Backup\\SQL{disk:02d}\\DB_FULL_{i:08d}.bak",
+            1024.0 + (i % 977),
+            base + timedelta(minutes=i),
+            "benchmark",
+            base,
+        ))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def synthetic_summary(rows, disks=8):
+    per_disk = rows // disks
+    return [
+        (f"COLD-DISK-{d:02d}", f"SN{d:06d}", per_disk, per_disk * 1500.0, datetime(2024, 6, 1))
+        for d in range(disks)
+    ]
+
+
+def render_legacy(output, rows):
+    """Previous renderer: one giant Table for every row."""
+    from reportlab.platypus import SimpleDocTemplate, Table, Paragraph
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.styles import getSampleStyleSheet
+    from assets.pdf_report import TABLE_STYLE
+
+    doc = SimpleDocTemplate(output, pagesize=landscape(A4),
+                            rightMargin=20, leftMargin=20, topMargin=20, bottomMargin=20)
+    data = [[title for _, title, _ in PDF_COLUMNS]]
+    for partition in synthetic_partitions(rows):
+        data.extend([str(v) for v in row] for row in partition)
+
+    table = Table(data, repeatRows=1, colWidths=[w for _, _, w in PDF_COLUMNS])
+    table.setStyle(TABLE_STYLE)
+    doc.build([Paragraph("Hard Disk Cold Storage Report", getSampleStyleSheet()["Title"]), table])
+
+
+def timed(fn):
+    with tempfile.TemporaryFile() as output:
+        started = time.perf_counter()
+        fn(output)
+        elapsed = time.perf_counter() - started
+        return elapsed, output.tell()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--legacy", action="store_true",
+                        help="also time the single-table renderer")
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>10} {'renderer':>10} {'seconds':>9} {'rows/s':>10} {'size KB':>9}")
+    for rows in args.rows:
+        elapsed, size = timed(lambda out: render_hard_disk_pdf(
+            out, synthetic_summary(rows), synthetic_partitions(rows)
+        ))
+        print(f"{rows:>10} {'chunked':>10} {elapsed:>9.2f} {rows / elapsed:>10.0f} {size / 1024:>9.0f}")
+
+        if args.legacy:
+            elapsed, size = timed(lambda out: render_legacy(out, rows))
+            print(f"{rows:>10} {'legacy':>10} {elapsed:>9.2f} {rows / elapsed:>10.0f} {size / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Check that SQLite's planner uses the indexes declared in the models.
+
+    python -m benchmarks.query_plans
+
+Builds the schema in an in-memory SQLite database with a small synthetic
+data set, runs EXPLAIN QUERY PLAN for each real query shape and exits
+non-zero if a query does not use its expected index. The same checks
+run under pytest in tests/test_query_plans.py.
+"""
+import sys
+from datetime import datetime, timedelta
+
+from flask import Flask
+from sqlalchemy import select, text
+
+from extensions import db
+from assets.models import HardDiskBackup, ServerAsset
+
+
+def _seed():
+    base = datetime(2024, 1, 1)
+    db.session.execute(HardDiskBackup.__table__.insert(), [
+        {
+            "disk_name": f"COLD-DISK-{i % 20:02d}",
+            "serial_number": f"SN{i % 20:06d}",
+            "file_name": f"DB_FULL_{i:08d}.bak",
+            "size_mb": 1024.0,
+            "modified": base + timedelta(minutes=i),
+            "uploaded_at": base,
+        }
+        for i in range(5000)
+    ])
+    db.session.execute(ServerAsset.__table__.insert(), [
+        {
+            "hostname": f"srv{i:04d}",
+            "ip_address": f"10.0.{i // 250}.{i % 250}",
+            "environment": "Production" if i % 3 else "Disaster Recovery",
+            "segment": ["CORE", "APP", "DB", "DMZ"][i % 4],
+        }
+        for i in range(1000)
+    ])
+    db.session.commit()
+    db.session.execute(text("ANALYZE"))
+
+
+def query_cases():
+    """(name, statement, expected index) for each hot query shape."""
+    hd = HardDiskBackup.__table__
+    sa = ServerAsset.__table__
+    day = datetime(2024, 1, 2)
+
+    return [
+        (
+            "hard disk date range",
+            select(hd).where(hd.c.modified >= day, hd.c.modified <= day + timedelta(hours=2))
+            .order_by(hd.c.id).limit(21),
+            "IX_HardDiskHistorical_Modified",
+        ),
+        (
+            "export by serial ORDER BY modified DESC",
+            select(hd).where(hd.c.serial_number == "SN000003").order_by(hd.c.modified.desc()),
+            "IX_HardDiskHistorical_Serial_Modified",
+        ),
+        (
+            "full export ORDER BY modified DESC",
+            select(hd).order_by(hd.c.modified.desc()),
+            "IX_HardDiskHistorical_Modified",
+        ),
+        (
+            "search IN (disk_name)",
+            select(hd).where(hd.c.disk_name.in_(["COLD-DISK-01", "COLD-DISK-02"])),
+            "IX_HardDiskHistorical_Disk_Serial",
+        ),
+        (
+            "servers by segment",
+            select(sa).where(sa.c.segment == "DB").order_by(sa.c.segment, sa.c.hostname),
+            "IX_ServerAssets_Segment_Hostname",
+        ),
+        (
+            "servers by environment",
+            select(sa).where(sa.c.environment == "Disaster Recovery")
+            .order_by(sa.c.segment, sa.c.hostname),
+            "IX_ServerAssets_Env_Segment_Hostname",
+        ),
+    ]
+
+
+def create_plan_app():
+    """Bare app on a seeded in-memory SQLite database (no blueprints)."""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        _seed()
+
+    return app
+
+
+def query_plan(stmt):
+    """SQLite's EXPLAIN QUERY PLAN of ``stmt`` as one line."""
+    sql = str(stmt.compile(db.engine, compile_kwargs={"literal_binds": True}))
+    return " | ".join(
+        row[-1] for row in db.session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+    )
+
+
+def main():
+    app = create_plan_app()
+
+    failures = 0
+    with app.app_context():
+        for name, stmt, index in query_cases():
+            plan = query_plan(stmt)
+            ok = index in plan
+            failures += not ok
+            print(f"{'ok  ' if ok else 'FAIL'} {name}: {plan}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
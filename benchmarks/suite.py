@@ -0,0 +1,341 @@
+"""
+Timed end-to-end scenarios against a local SQLite copy of the inventory.
+
+    python -m benchmarks.suite --db /tmp/dba_bench.db --rows 1000000 --output before.json
+    python -m benchmarks.suite --db /tmp/dba_bench.db --reuse --output after.json --compare before.json
+
+Requests go through the Flask test client (full routing, templates and
+SQL, no network). The database is seeded by ``benchmarks.synthetic``;
+``--reuse`` keeps an existing file so repeated runs skip the seeding.
+Results are written as JSON so two runs can be compared.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from werkzeug.security import generate_password_hash
+
+
+BENCH_USER = "benchmark"
+BENCH_PASSWORD = "benchmark"
+
+JOB_TIMEOUT = 600
+
+
+# =============================
+# APP
+# =============================
+def create_benchmark_app(db_path, fresh=False):
+    """
+    Import the portal against ``db_path``. Must run before anything else
+    imports ``app``, since Config reads DATABASE_URL at import time.
+    """
+    db_path = os.path.abspath(db_path)
+    if fresh and os.path.exists(db_path):
+        os.remove(db_path)
+
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("FLASK_SECRET_KEY", "benchmark")
+    os.environ.setdefault("JOB_POLL_INTERVAL", "0.2")
+
+    from app import app
+    from extensions import db
+    from models import User
+
+    with app.app_context():
+        db.create_all()
+
+        if not User.query.filter_by(username=BENCH_USER).first():
+            db.session.add(User(
+                username=BENCH_USER,
+                password_hash=generate_password_hash(BENCH_PASSWORD),
+                full_name="Benchmark",
+                role="admin",
+                is_active=True,
+                must_change_password=False,
+            ))
+            db.session.commit()
+
+    return app
+
+
+def _login(app):
+    client = app.test_client()
+    client.post("/login", data={"username": BENCH_USER, "password": BENCH_PASSWORD})
+    return client
+
+
+# =============================
+# SCENARIOS
+# =============================
+def _sample(app):
+    """Values the scenarios need from the seeded data."""
+    from extensions import db
+    from sqlalchemy import func
+    from assets.models import HardDiskBackup, HardDiskSummary
+    from utils.keyset import encode_cursor
+
+    with app.app_context():
+        low, high = db.session.query(
+            func.min(HardDiskBackup.id), func.max(HardDiskBackup.id)
+        ).one()
+        smallest = (
+            HardDiskSummary.query
+            .order_by(HardDiskSummary.total_files)
+            .first()
+        )
+        modified = db.session.query(HardDiskBackup.modified).filter(
+            HardDiskBackup.id == (low + high) // 2
+        ).scalar()
+
+    return {
+        "middle_cursor": encode_cursor({"k": (low + high) // 2, "d": "n"}),
+        "last_cursor": encode_cursor({"k": high - 20, "d": "n"}),
+        "serial": smallest.serial_number,
+        "disk_name": smallest.disk_name,
+        "day": f"{modified:%Y-%m-%d}",
+    }
+
+
+def build_scenarios(sample, upload_csv=None, export_all=False):
+    """``(name, setup, request)`` triples; ``request(client)`` returns a response."""
+    from assets.inventory import _server_view_cache
+    from main.widgets import get_widget
+
+    serial = sample["serial"]
+    day = sample["day"]
+
+    def get(url):
+        return lambda client: client.get(url)
+
+    scenarios = [
+        ("hard disk list: first page", None, get("/assets/hard-disk")),
+        ("hard disk list: middle page", None,
+         get(f"/assets/hard-disk?cursor={sample['middle_cursor']}")),
+        ("hard disk list: last page", None,
+         get(f"/assets/hard-disk?cursor={sample['last_cursor']}")),
+        ("hard disk list: one day", None,
+         get(f"/assets/hard-disk?start={day}&end={day} 23:59:59")),
+        ("hard disk list: one day + count", None,
+         get(f"/assets/hard-disk?start={day}&end={day} 23:59:59&count=1")),
+
+        ("search: exact serial", None, get(f"/assets/hard-disk?q={serial}")),
+        ("search: disk name", None, get(f"/assets/hard-disk?q={sample['disk_name'][-6:]}")),
+        ("search: file token", None, get("/assets/hard-disk?q=DB0042")),
+        ("search: file tokens", None, get("/assets/hard-disk?q=DB0042_FULL")),
+        ("search: file tokens + count", None, get("/assets/hard-disk?q=DB0042_FULL&count=1")),
+
+        ("capacity: projection + monthly chart", None, get("/assets/hard-disk/capacity")),
+        ("capacity: daily chart", None,
+         get(f"/assets/hard-disk/capacity?serial={serial}&period=D")),
+
+        ("dashboard: shell", None, get("/dashboard")),
+        *(
+            (f"widget: {name} ({state} cache)",
+             get_widget(name).cache.clear if state == "cold" else None,
+             get(f"/dashboard/widgets/{name}"))
+            for name in ("servers", "disks", "latest-backup")
+            for state in ("cold", "warm")
+        ),
+
+        ("servers: list (cold cache)", _server_view_cache.clear, get("/assets/servers")),
+        ("servers: list (warm cache)", None, get("/assets/servers")),
+        ("servers: segment", None, get("/assets/servers?segment=DB")),
+        ("servers: search", None, get("/assets/servers?q=srv001")),
+
+        ("export csv: one disk", None, get(f"/assets/hard-disk/export/csv?serial={serial}")),
+        ("export xlsx: one disk", None, get(f"/assets/hard-disk/export/xlsx?serial={serial}")),
+        ("export pdf: one disk", None, get(f"/assets/hard-disk/export/pdf?serial={serial}")),
+        ("export csv: all", None, get("/assets/hard-disk/export/csv")),
+    ]
+
+    if export_all:
+        scenarios += [
+            ("export xlsx: all", None, get("/assets/hard-disk/export/xlsx")),
+            ("export pdf: all", None, get("/assets/hard-disk/export/pdf")),
+        ]
+
+    if upload_csv is not None:
+        scenarios.append(("upload csv (until job done)", None, _upload(upload_csv)))
+
+    return scenarios
+
+
+def _upload(data):
+    import io
+
+    def run(client):
+        response = client.post(
+            "/assets/hard-disk/upload",
+            data={"file": (io.BytesIO(data), "benchmark.csv")},
+            content_type="multipart/form-data",
+        )
+        job_url = response.headers["Location"].rstrip("/")
+
+        deadline = time.monotonic() + JOB_TIMEOUT
+        while time.monotonic() < deadline:
+            status = client.get(f"{job_url}/status")
+            if status.json["status"] in ("done", "failed"):
+                if status.json["status"] == "failed":
+                    raise RuntimeError(f"Upload job failed: {status.json['message']}")
+                return status
+            time.sleep(0.05)
+
+        raise RuntimeError("Upload job did not finish")
+
+    return run
+
+
+# =============================
+# RUNNER
+# =============================
+def _percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def run_scenario(client, name, setup, request, repeat, warmup):
+    timings = []
+    status = size = None
+
+    for i in range(warmup + repeat):
+        if setup:
+            setup()
+
+        started = time.perf_counter()
+        response = request(client)
+        body = response.get_data()        # drains streamed responses
+        elapsed = time.perf_counter() - started
+
+        status, size = response.status_code, len(body)
+        if i >= warmup:
+            timings.append(elapsed)
+
+    return {
+        "name": name,
+        "status": status,
+        "bytes": size,
+        "runs": len(timings),
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "p95": _percentile(timings, 95),
+        "max": max(timings),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {r["name"]: r for r in json.load(f)["results"]}
+
+    print(f"\n{'scenario':<36} {'before':>9} {'after':>9} {'change':>8}")
+    for result in results:
+        before = baseline.get(result["name"])
+        if not before:
+            continue
+        change = (result["median"] / before["median"] - 1) * 100 if before["median"] else 0
+        print(
+            f"{result['name']:<36} {before['median'] * 1000:>7.1f}ms "
+            f"{result['median'] * 1000:>7.1f}ms {change:>+7.1f}%"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default="dba_bench.db", help="SQLite file")
+    parser.add_argument("--reuse", action="store_true",
+                        help="keep an already seeded --db instead of recreating it")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--servers", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--upload-rows", type=int, default=10_000,
+                        help="rows per upload scenario run (0 to skip)")
+    parser.add_argument("--export-all", action="store_true",
+                        help="also time full XLSX / PDF exports (slow on big data sets)")
+    parser.add_argument("--only", help="run scenarios whose name contains this text")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="previous results file to compare medians with")
+    args = parser.parse_args(argv)
+
+    fresh = not (args.reuse and os.path.exists(args.db))
+    app = create_benchmark_app(args.db, fresh=fresh)
+
+    seed_timings = {}
+    if fresh:
+        from .synthetic import seed_inventory
+
+        print(f"Seeding {args.rows:,} hard disk rows and {args.servers:,} servers ...")
+        with app.app_context():
+            seed_timings = seed_inventory(args.rows, args.servers, seed=args.seed)
+
+    from .synthetic import hard_disk_csv
+
+    scenarios = build_scenarios(
+        _sample(app),
+        upload_csv=hard_disk_csv(args.upload_rows) if args.upload_rows else None,
+        export_all=args.export_all,
+    )
+    if args.only:
+        scenarios = [s for s in scenarios if args.only in s[0]]
+
+    client = _login(app)
+    results = []
+
+    print(f"{'scenario':<36} {'status':>6} {'median':>9} {'p95':>9} {'KB':>9}")
+    for name, setup, request in scenarios:
+        # uploads add rows, so run them once
+        repeat, warmup = (1, 0) if name.startswith("upload") else (args.repeat, args.warmup)
+        result = run_scenario(client, name, setup, request, repeat, warmup)
+        results.append(result)
+        print(
+            f"{name:<36} {result['status']:>6} {result['median'] * 1000:>7.1f}ms "
+            f"{result['p95'] * 1000:>7.1f}ms {result['bytes'] / 1024:>9.1f}"
+        )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "db": os.path.abspath(args.db),
+            "rows": args.rows if fresh else None,
+            "servers": args.servers if fresh else None,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "seed_seconds": seed_timings,
+        },
+        "results": results,
+    }
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        _compare(results, args.compare)
+
+    return 0 if all(r["status"] == 200 for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""
+Synthetic, reproducible inventory data for benchmarks.
+
+    python -m benchmarks.synthetic --db /tmp/dba_bench.db --rows 2000000 --servers 2000
+
+Hard disk rows follow the shape of real cold storage uploads: a few dozen
+disks (one serial each), each holding full / diff / log backups of a
+fixed set of databases taken over a couple of years. The same ``seed``
+always produces the same rows.
+"""
+import argparse
+import io
+import csv
+import random
+import time
+from datetime import datetime, timedelta
+
+from extensions import db
+from assets.models import HardDiskBackup, ServerAsset
+
+
+DEFAULT_DISKS = 48
+DEFAULT_DATABASES = 120
+INSERT_BATCH_SIZE = 10000
+
+BACKUP_TYPES = (("FULL", 0.15, 20000), ("DIFF", 0.35, 4000), ("LOG", 0.50, 300))
+SEGMENTS = ("CORE", "APP", "DB", "DMZ", "MGMT")
+ENVIRONMENTS = (("Production", 0.6), ("Disaster Recovery", 0.25), ("Development", 0.15))
+OPERATING_SYSTEMS = ("Windows Server 2019", "Windows Server 2022", "RHEL 8", "RHEL 9", "Ubuntu 22.04")
+
+
+def disk_identity(disk):
+    return f"COLD-DISK-{disk:03d}", f"{disk:08d}"
+
+
+# =============================
+# HARD DISKS
+# =============================
+def iter_hard_disk_rows(rows, disks=DEFAULT_DISKS, databases=DEFAULT_DATABASES,
+                        seed=42, start=datetime(2023, 1, 1)):
+    """Yield ``rows`` HardDiskHistorical dicts (without upload columns)."""
+    rng = random.Random(seed)
+    kinds = [kind for kind, _, _ in BACKUP_TYPES]
+    weights = [weight for _, weight, _ in BACKUP_TYPES]
+    sizes = {kind: size for kind, _, size in BACKUP_TYPES}
+
+    # spread the rows over ~2 years, in time order like real uploads
+    step = timedelta(days=730) / max(rows, 1)
+
+    for i in range(rows):
+        disk = rng.randrange(disks)
+        disk_name, serial = disk_identity(disk)
+        database = f"DB{rng.randrange(databases):04d}"
+        kind = rng.choices(kinds, weights)[0]
+        modified = (start + step * i).replace(microsecond=0)
+        file_name = f"{database}_{kind}_{modified:%Y%m%d_%H%M%S}_{i}.bak"
+
+        yield {
+            "disk_name": disk_name,
+            "serial_number": serial,
+            "file_name": file_name,
+            "full_path": f"E:\\Backup\\{database}\\{kind}\\{file_name}",
+            "size_mb": round(sizes[kind] * rng.uniform(0.2, 1.8), 2),
+            "modified": modified,
+        }
+
+
+def hard_disk_csv(rows, seed=7, **kwargs):
+    """An upload file (as bytes) in the format the upload page accepts."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(["DiskName", "SerialNumber", "FileName", "FullPath", "SizeMB", "Modified"])
+
+    for row in iter_hard_disk_rows(rows, seed=seed, start=datetime(2025, 1, 1), **kwargs):
+        writer.writerow([
+            row["disk_name"], row["serial_number"], row["file_name"],
+            row["full_path"], row["size_mb"], f"{row['modified']:%Y-%m-%d %H:%M:%S}",
+        ])
+
+    return buffer.getvalue().encode("utf-8")
+
+
+# =============================
+# SERVERS
+# =============================
+def iter_server_rows(servers, seed=42):
+    rng = random.Random(seed)
+    envs = [env for env, _ in ENVIRONMENTS]
+    weights = [weight for _, weight in ENVIRONMENTS]
+
+    for i in range(servers):
+        segment = SEGMENTS[i % len(SEGMENTS)]
+        yield {
+            "hostname": f"{segment.lower()}-srv{i:05d}",
+            "ip_address": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+            "environment": rng.choices(envs, weights)[0],
+            "segment": segment,
+            "os": rng.choice(OPERATING_SYSTEMS),
+            "owner": f"team-{rng.randrange(12):02d}",
+            "cpu": rng.choice((2, 4, 8, 16, 32)),
+            "ram": rng.choice((8, 16, 32, 64, 128, 256)),
+            "storage": rng.choice((100, 250, 500, 1024, 2048, 4096)),
+        }
+
+
+# =============================
+# SEED
+# =============================
+def _insert(table, rows, batch_size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            db.session.execute(table.insert(), batch)
+            db.session.commit()
+            batch = []
+    if batch:
+        db.session.execute(table.insert(), batch)
+        db.session.commit()
+
+
+def seed_inventory(rows, servers, seed=42, disks=DEFAULT_DISKS, batch_size=INSERT_BATCH_SIZE):
+    """
+    Fill an empty schema (inside an app context) and build the derived
+    summary / search tables the way an upload would. Returns timings.
+    """
+    from assets.summary import rebuild_hard_disk_summary
+    from assets.search import rebuild_search_index
+    from assets.ingest import row_hashes
+    from assets.usage_rollup import refresh_usage_rollups
+
+    timings = {}
+    uploaded_at = datetime(2025, 1, 1)
+
+    started = time.perf_counter()
+    _insert(
+        HardDiskBackup.__table__,
+        (
+            dict(
+                row, uploaded_by="benchmark", uploaded_at=uploaded_at,
+                **dict(zip(("content_hash", "path_hash"), row_hashes(
+                    row["serial_number"], row["full_path"], row["size_mb"], row["modified"]
+                ))),
+            )
+            for row in iter_hard_disk_rows(rows, disks=disks, seed=seed)
+        ),
+        batch_size,
+    )
+    timings["hard_disks"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    _insert(ServerAsset.__table__, iter_server_rows(servers, seed=seed), batch_size)
+    timings["servers"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    rebuild_hard_disk_summary()
+    timings["summary"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    rebuild_search_index()
+    timings["search_index"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    refresh_usage_rollups()
+    timings["usage"] = time.perf_counter() - started
+
+    return timings
+
+
+def main(argv=None):
+    from .suite import create_benchmark_app
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", required=True, help="SQLite file to (re)create")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--servers", type=int, default=2000)
+    parser.add_argument("--disks", type=int, default=DEFAULT_DISKS)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    app = create_benchmark_app(args.db, fresh=True)
+    with app.app_context():
+        timings = seed_inventory(args.rows, args.servers, seed=args.seed, disks=args.disks)
+
+    for name, seconds in timings.items():
+        print(f"{name:>14} {seconds:>9.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,56 @@
 import os
+import tempfile
 from urllib.parse import quote_plus
 
+from sqlalchemy.engine import make_url
+
+from utils.db_pool import InstrumentedQueuePool
+
 APP_VERSION = "V1.0"
 
+
+def engine_options(uri):
+    """
+    Pool settings for ``uri``.
+
+    Every gunicorn thread and job worker thread of a process can hold a
+    connection at once, so the pool is sized to that; the database sees
+    at most GUNICORN_WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW).
+    """
+    url = make_url(uri)
+
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+
+    threads = int(os.getenv("GUNICORN_THREADS", 2))
+    job_workers = int(os.getenv("JOB_WORKERS", 2))
+
+    options = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": int(os.getenv("DB_POOL_SIZE", threads + job_workers)),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 2)),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", 30)),
+        # drop connections the server / firewall may have closed
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        # survive DB failovers: test each connection on checkout
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "1") == "1",
+    }
+
+    if url.get_backend_name() == "mssql":
+        # pyodbc sends executemany batches as one round trip
+        options["fast_executemany"] = True
+
+    return options
+
+
 class Config:
     SECRET_KEY = os.getenv("FLASK_SECRET_KEY")
 
-    DB_USER = quote_plus(os.getenv("DB_USER"))
-    DB_PASSWORD = quote_plus(os.getenv("DB_PASSWORD"))
+    DB_USER = quote_plus(os.getenv("DB_USER", ""))
+    DB_PASSWORD = quote_plus(os.getenv("DB_PASSWORD", ""))
 
-    SQLALCHEMY_DATABASE_URI = (
+    # DATABASE_URL overrides the MSSQL settings (e.g. SQLite for benchmarks)
+    SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL") or (
         f"mssql+pyodbc://{DB_USER}:{DB_PASSWORD}"
         f"@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}"
         "?driver=ODBC+Driver+18+for+SQL+Server"
@@ -18,3 +59,47 @@ class Config:
     )
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+
+    # Rows per transaction for hard disk CSV uploads
+    HARD_DISK_UPLOAD_BATCH_SIZE = int(os.getenv("HARD_DISK_UPLOAD_BATCH_SIZE", 5000))
+
+    # `flask assets archive`: rows with modified older than this move to
+    # HardDiskHistoricalArchive, ARCHIVE_BATCH_SIZE rows per transaction
+    HARD_DISK_RETENTION_DAYS = int(os.getenv("HARD_DISK_RETENTION_DAYS", 365))
+    HARD_DISK_ARCHIVE_BATCH_SIZE = int(os.getenv("HARD_DISK_ARCHIVE_BATCH_SIZE", 5000))
+
+    # Capacity page: disk size (per serial: "SERIAL=GB,SERIAL=GB") and the
+    # days of growth the days-until-full projection averages over
+    HARD_DISK_CAPACITY_GB = float(os.getenv("HARD_DISK_CAPACITY_GB", 4000))
+    HARD_DISK_CAPACITIES = os.getenv("HARD_DISK_CAPACITIES", "")
+    HARD_DISK_GROWTH_WINDOW_DAYS = int(os.getenv("HARD_DISK_GROWTH_WINDOW_DAYS", 90))
+
+    # Background jobs (uploads / exports); JOB_DIR must be shared by all workers
+    JOB_DIR = os.getenv("JOB_DIR", os.path.join(tempfile.gettempdir(), "dba_portal_jobs"))
+    JOB_WORKERS = int(os.getenv("JOB_WORKERS", 2))
+    JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", 5))
+    JOB_STALE_SECONDS = int(os.getenv("JOB_STALE_SECONDS", 900))
+    JOB_RETENTION_HOURS = int(os.getenv("JOB_RETENTION_HOURS", 24))
+
+    # Per-worker cache of logged-in users; role / deactivation changes made
+    # on another worker take effect within USER_CACHE_TTL seconds
+    USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", 60))
+    USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", 1024))
+
+    # Dashboard widget JSON (per worker, per widget) is reused this long
+    DASHBOARD_WIDGET_TTL = int(os.getenv("DASHBOARD_WIDGET_TTL", 30))
+
+    # /metrics: admins, or scrapers sending "Authorization: Bearer <token>"
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+    # shared sample directory when running several worker processes
+    PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+    # gzip / brotli for dynamic responses (streamed ones always)
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", 1024))
+    COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", 6))
+    COMPRESS_BR_LEVEL = int(os.getenv("COMPRESS_BR_LEVEL", 4))
+
+    # serve static/build (flask static build) when present
+    STATIC_USE_BUILD = os.getenv("STATIC_USE_BUILD", "1") == "1"
@@ -1,13 +1,50 @@
+import os
+import shutil
+import tempfile
+
 bind = "0.0.0.0:8000"
 
-workers = 4        # for 2 CPU
-threads = 2
-worker_class = "gthread"
+# Defaults sized for 2 CPU; compare settings with benchmarks.load
+workers = int(os.getenv("GUNICORN_WORKERS", 4))
+threads = int(os.getenv("GUNICORN_THREADS", 2))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
 
-timeout = 120
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 120))
 keepalive = 5
 
-max_requests = 1000
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 1000))
 max_requests_jitter = 100
 
 preload_app = True
+
+# Workers write Prometheus samples here; /metrics aggregates them.
+# Must be set before the app (and prometheus_client) is imported.
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR",
+    os.path.join(tempfile.gettempdir(), "dba_portal_metrics"),
+)
+
+
+def on_starting(server):
+    # samples from a previous run would be added to this one's
+    metrics_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def post_fork(server, worker):
+    # Connections opened while preloading belong to the master; never
+    # share them with the worker, and start the pool counters fresh.
+    from app import app
+    from extensions import db
+    from utils.db_pool import pool_stats
+
+    with app.app_context():
+        db.engine.dispose(close=False)
+    pool_stats.reset()
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
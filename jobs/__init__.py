@@ -0,0 +1,10 @@
+from flask import Blueprint
+
+jobs_bp = Blueprint(
+    "jobs",
+    __name__,
+    template_folder="../templates/jobs",
+    url_prefix="/jobs"
+)
+
+from . import routes
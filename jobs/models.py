@@ -0,0 +1,36 @@
+import json
+from datetime import datetime
+from extensions import db
+
+
+class Job(db.Model):
+    __tablename__ = "BackgroundJobs"
+
+    id = db.Column(db.String(32), primary_key=True)
+
+    kind = db.Column(db.String(50), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default="queued", index=True)
+    progress = db.Column(db.Integer, nullable=False, default=0)
+    message = db.Column(db.String(500))
+
+    params = db.Column(db.Text)
+    result = db.Column(db.Text)
+    result_path = db.Column(db.String(500))
+    result_name = db.Column(db.String(255))
+
+    created_by = db.Column(db.String(100))
+    created_at = db.Column(db.DateTime, default=datetime.now)
+    started_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+    @property
+    def result_data(self):
+        return json.loads(self.result) if self.result else None
+
+    @property
+    def is_finished(self):
+        return self.status in ("done", "failed")
+
+    def __repr__(self):
+        return f"<Job {self.kind} {self.id} {self.status}>"
@@ -0,0 +1,74 @@
+from flask import render_template, jsonify, url_for, abort, send_file
+from flask_login import login_required, current_user
+from extensions import db
+from .models import Job
+from . import jobs_bp
+
+
+def _get_own_job(job_id):
+    job = db.session.get(Job, job_id)
+
+    if not job:
+        abort(404)
+
+    # Owner or admin only
+    if job.created_by != current_user.username and current_user.role != "admin":
+        abort(403)
+
+    return job
+
+
+# =============================
+# JOB STATUS (JSON)
+# =============================
+@jobs_bp.route("/<string:job_id>/status")
+@login_required
+def status(job_id):
+    job = _get_own_job(job_id)
+
+    download_url = None
+    if job.status == "done" and job.result_path:
+        download_url = url_for("jobs.download", job_id=job.id)
+
+    return jsonify({
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "progress": job.progress,
+        "message": job.message,
+        "result": job.result_data,
+        "download_url": download_url,
+        "created_at": job.created_at,
+        "finished_at": job.finished_at,
+    })
+
+
+# =============================
+# JOB PAGE (POLLS STATUS)
+# =============================
+@jobs_bp.route("/<string:job_id>")
+@login_required
+def detail(job_id):
+    job = _get_own_job(job_id)
+    return render_template("jobs/job_detail.html", job=job)
+
+
+# =============================
+# DOWNLOAD RESULT
+# =============================
+@jobs_bp.route("/<string:job_id>/download")
+@login_required
+def download(job_id):
+    job = _get_own_job(job_id)
+
+    if job.status != "done" or not job.result_path:
+        abort(404)
+
+    try:
+        return send_file(
+            job.result_path,
+            as_attachment=True,
+            download_name=job.result_name,
+        )
+    except FileNotFoundError:
+        abort(410)
@@ -0,0 +1,265 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import update
+
+from extensions import db
+from .models import Job
+
+
+_handlers = {}
+
+
+def job_handler(kind):
+    """
+    Register ``f(job, params, progress)`` as the handler for ``kind``.
+
+    The handler may return a dict with ``result`` (JSON-serialisable),
+    ``result_path``/``result_name`` (downloadable file) and ``message``.
+    """
+    def decorator(f):
+        _handlers[kind] = f
+        return f
+    return decorator
+
+
+# =============================
+# JOB RUNNER
+# =============================
+class JobRunner:
+    """
+    Local worker pool that uses the BackgroundJobs table as its queue.
+
+    Every gunicorn worker runs ``JOB_WORKERS`` threads that claim queued
+    jobs with a conditional UPDATE, so any worker can pick up a job and no
+    external broker is needed. Threads are started lazily per process,
+    which keeps them out of the preloaded master.
+
+    A heartbeat thread keeps ``updated_at`` of the jobs this process is
+    running fresh, so long handlers (big XLSX / PDF exports) are not
+    taken for dead workers by the stale-job sweep.
+    """
+
+    def __init__(self):
+        self.app = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._last_cleanup = 0.0
+        self._running = set()
+
+    def init_app(self, app):
+        self.app = app
+        app.extensions["job_runner"] = self
+        app.before_request(self.ensure_started)
+
+    def ensure_started(self):
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._wakeup = threading.Event()
+            self._running = set()
+
+            for i in range(self.app.config["JOB_WORKERS"]):
+                threading.Thread(
+                    target=self._loop,
+                    name=f"job-worker-{i}",
+                    daemon=True,
+                ).start()
+
+            threading.Thread(
+                target=self._heartbeat_loop,
+                name="job-heartbeat",
+                daemon=True,
+            ).start()
+
+    def wake(self):
+        self._wakeup.set()
+
+    # ===== Worker loop =====
+    def _loop(self):
+        while True:
+            try:
+                with self.app.app_context():
+                    self._housekeeping()
+                    job = self._claim_next()
+                    if job:
+                        self._run(job)
+                        continue
+            except Exception:
+                self.app.logger.exception("Job worker error")
+
+            self._wakeup.wait(self.app.config["JOB_POLL_INTERVAL"])
+            self._wakeup.clear()
+
+    def _claim_next(self):
+        candidate = (
+            db.session.query(Job.id)
+            .filter(Job.status == "queued")
+            .order_by(Job.created_at)
+            .limit(1)
+            .scalar()
+        )
+        if not candidate:
+            return None
+
+        now = datetime.now()
+        claimed = db.session.execute(
+            update(Job)
+            .where(Job.id == candidate, Job.status == "queued")
+            .values(status="running", started_at=now, updated_at=now)
+        ).rowcount
+        db.session.commit()
+
+        # another worker won the race
+        if not claimed:
+            return None
+
+        return db.session.get(Job, candidate)
+
+    # ===== Heartbeat =====
+    def _heartbeat_loop(self):
+        interval = min(self.app.config["JOB_STALE_SECONDS"] / 3, 60)
+        while True:
+            time.sleep(interval)
+            try:
+                with self.app.app_context():
+                    self._heartbeat()
+            except Exception:
+                self.app.logger.exception("Job heartbeat error")
+
+    def _heartbeat(self):
+        with self._lock:
+            running = list(self._running)
+        if not running:
+            return
+
+        db.session.execute(
+            update(Job)
+            .where(Job.id.in_(running), Job.status == "running")
+            .values(updated_at=datetime.now())
+        )
+        db.session.commit()
+
+    def _run(self, job):
+        with self._lock:
+            self._running.add(job.id)
+        try:
+            self._run_handler(job)
+        finally:
+            with self._lock:
+                self._running.discard(job.id)
+
+    def _run_handler(self, job):
+        def progress(percent, message=None):
+            _update_job(
+                job.id,
+                progress=max(0, min(int(percent), 100)),
+                message=message,
+            )
+
+        try:
+            handler = _handlers[job.kind]
+            outcome = handler(job, json.loads(job.params or "{}"), progress) or {}
+
+            _update_job(
+                job.id,
+                status="done",
+                progress=100,
+                message=outcome.get("message"),
+                result=(
+                    json.dumps(outcome["result"], default=str)
+                    if "result" in outcome else None
+                ),
+                result_path=outcome.get("result_path"),
+                result_name=outcome.get("result_name"),
+                finished_at=datetime.now(),
+            )
+
+        except Exception as e:
+            db.session.rollback()
+            self.app.logger.exception("Job %s (%s) failed", job.id, job.kind)
+            _update_job(
+                job.id,
+                status="failed",
+                message=str(e)[:500],
+                finished_at=datetime.now(),
+            )
+
+    # ===== Stale / expired jobs =====
+    def _housekeeping(self):
+        if time.monotonic() - self._last_cleanup < 60:
+            return
+        self._last_cleanup = time.monotonic()
+
+        now = datetime.now()
+        stale_before = now - timedelta(seconds=self.app.config["JOB_STALE_SECONDS"])
+        expire_before = now - timedelta(hours=self.app.config["JOB_RETENTION_HOURS"])
+
+        # worker died (recycled / killed) while running the job
+        db.session.execute(
+            update(Job)
+            .where(Job.status == "running", Job.updated_at < stale_before)
+            .values(
+                status="failed",
+                message="Job worker stopped responding",
+                finished_at=now,
+            )
+        )
+
+        # finished jobs only: queued / running ones still own their files
+        expired = Job.query.filter(
+            Job.status.in_(("done", "failed")),
+            Job.finished_at < expire_before,
+        ).all()
+        for job in expired:
+            if job.result_path and os.path.exists(job.result_path):
+                os.remove(job.result_path)
+            db.session.delete(job)
+
+        db.session.commit()
+
+
+def _update_job(job_id, **values):
+    values["updated_at"] = datetime.now()
+    db.session.execute(update(Job).where(Job.id == job_id).values(**values))
+    db.session.commit()
+
+
+job_runner = JobRunner()
+
+
+# =============================
+# SUBMIT
+# =============================
+def submit_job(kind, params, created_by):
+    job = Job(
+        id=uuid4().hex,
+        kind=kind,
+        status="queued",
+        params=json.dumps(params),
+        created_by=created_by,
+    )
+    db.session.add(job)
+    db.session.commit()
+
+    job_runner.ensure_started()
+    job_runner.wake()
+
+    return job
+
+
+def job_file_path(name):
+    # created on first use, not at import: `flask static build` in the
+    # Dockerfile imports the app as root before switching to flaskuser
+    job_dir = job_runner.app.config["JOB_DIR"]
+    os.makedirs(job_dir, exist_ok=True)
+    return os.path.join(job_dir, name)
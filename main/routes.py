@@ -1,16 +1,36 @@
-from flask import Blueprint, render_template
+from flask import Blueprint, render_template, jsonify, abort, current_app
 from flask_login import login_required
 from datetime import datetime
 
+from .widgets import get_widget
+
 main_bp = Blueprint("main", __name__)
 
 @main_bp.route("/")
 @main_bp.route("/dashboard")
 @login_required
 def dashboard():
+    # shell only; the widgets below fetch their numbers after load
     return render_template("dashboard.html")
 
 
+# =============================
+# DASHBOARD WIDGETS (JSON)
+# =============================
+@main_bp.route("/dashboard/widgets/<name>")
+@login_required
+def dashboard_widget(name):
+    widget = get_widget(name)
+    if widget is None:
+        abort(404)
+
+    response = jsonify(widget.load())
+    response.headers["Cache-Control"] = (
+        f"private, max-age={current_app.config['DASHBOARD_WIDGET_TTL']}"
+    )
+    return response
+
+
 @main_bp.context_processor
 def inject_year():
     return {
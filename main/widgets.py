@@ -0,0 +1,101 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from flask import current_app
+from sqlalchemy import func, select
+
+from extensions import db
+from assets.models import HardDiskSummary, ServerAsset
+from utils.cache import TTLCache
+
+
+@dataclass
+class Widget:
+    name: str
+    loader: object
+    # one entry per widget; each endpoint expires on its own
+    cache: TTLCache = field(default_factory=lambda: TTLCache(maxsize=1))
+
+    def load(self):
+        data = self.cache.get(self.name)
+        if data is None:
+            data = self.loader()
+            data["generated_at"] = datetime.now().isoformat(timespec="seconds")
+            self.cache.set(self.name, data, current_app.config["DASHBOARD_WIDGET_TTL"])
+        return data
+
+
+_widgets = {}
+
+
+def register_widget(name, loader):
+    _widgets[name] = Widget(name, loader)
+
+
+def get_widget(name):
+    return _widgets.get(name)
+
+
+# =============================
+# SERVERS BY ENVIRONMENT
+# =============================
+def server_counts():
+    rows = db.session.execute(
+        select(ServerAsset.environment, func.count())
+        .group_by(ServerAsset.environment)
+        .order_by(func.count().desc())
+    ).all()
+
+    return {
+        "total": sum(count for _, count in rows),
+        "by_environment": [
+            {"environment": env or "Unknown", "count": count} for env, count in rows
+        ],
+    }
+
+
+# =============================
+# DISK TOTALS (rollup, O(disks))
+# =============================
+def disk_totals():
+    disks, files, archived, size_mb = db.session.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(HardDiskSummary.total_files), 0),
+            func.coalesce(func.sum(HardDiskSummary.archived_files), 0),
+            func.coalesce(func.sum(HardDiskSummary.total_size_mb), 0),
+        )
+    ).one()
+
+    return {
+        "disks": disks,
+        "files": files,
+        "archived_files": archived,
+        "size_mb": size_mb,
+    }
+
+
+# =============================
+# LATEST BACKUP AGE
+# =============================
+def latest_backup():
+    latest = (
+        HardDiskSummary.query
+        .filter(HardDiskSummary.latest_backup.is_not(None))
+        .order_by(HardDiskSummary.latest_backup.desc())
+        .first()
+    )
+    if latest is None:
+        return {"latest_backup": None}
+
+    return {
+        "latest_backup": latest.latest_backup.isoformat(timespec="seconds"),
+        "age_seconds": int((datetime.now() - latest.latest_backup).total_seconds()),
+        "disk_name": latest.disk_name,
+        "serial_number": latest.serial_number,
+    }
+
+
+register_widget("servers", server_counts)
+register_widget("disks", disk_totals)
+register_widget("latest-backup", latest_backup)
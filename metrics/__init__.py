@@ -0,0 +1,5 @@
+from flask import Blueprint
+
+metrics_bp = Blueprint("metrics", __name__)
+
+from . import routes
@@ -0,0 +1,64 @@
+"""
+Prometheus metric definitions.
+
+Imported lazily by ``init_metrics`` so PROMETHEUS_MULTIPROC_DIR (read by
+prometheus_client at import time) can come from .env as well.
+"""
+from prometheus_client import Counter, Histogram
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 500)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30)
+
+
+# ===== HTTP =====
+REQUEST_LATENCY = Histogram(
+    "dba_portal_request_duration_seconds",
+    "Time to produce a response (streamed bodies excluded)",
+    ["endpoint", "method", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+# ===== SQL =====
+SQL_STATEMENTS = Counter(
+    "dba_portal_sql_statements_total",
+    "SQL statements executed",
+    ["endpoint"],
+)
+SQL_SECONDS = Counter(
+    "dba_portal_sql_seconds_total",
+    "Time spent executing SQL statements",
+    ["endpoint"],
+)
+SQL_STATEMENTS_PER_REQUEST = Histogram(
+    "dba_portal_sql_statements_per_request",
+    "SQL statements executed per request",
+    ["endpoint"],
+    buckets=STATEMENT_BUCKETS,
+)
+SQL_ROWS_FETCHED = Counter(
+    "dba_portal_sql_rows_fetched_total",
+    "Rows fetched from query results (ORM and Core)",
+    ["endpoint"],
+)
+SQL_ROWS_AFFECTED = Counter(
+    "dba_portal_sql_rows_affected_total",
+    "Rows affected by INSERT / UPDATE / DELETE statements",
+    ["endpoint"],
+)
+
+# ===== Connection pool =====
+POOL_CHECKOUT_WAIT = Histogram(
+    "dba_portal_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    buckets=WAIT_BUCKETS,
+)
+POOL_OVERFLOW_CHECKOUTS = Counter(
+    "dba_portal_db_pool_overflow_checkouts_total",
+    "Checkouts served by an overflow connection",
+)
+POOL_TIMEOUTS = Counter(
+    "dba_portal_db_pool_timeouts_total",
+    "Checkouts that timed out waiting for a connection",
+)
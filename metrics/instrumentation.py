@@ -0,0 +1,146 @@
+import os
+import time
+
+from flask import g, has_request_context, request, request_started, request_finished
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from utils.db_pool import pool_stats
+
+
+# metrics.collectors, imported by init_metrics
+_collectors = None
+
+
+def _endpoint_label():
+    if not has_request_context():
+        return "background"
+    # unmatched URLs share one label to keep cardinality bounded
+    return request.endpoint or "unmatched"
+
+
+# =============================
+# SETUP
+# =============================
+def init_metrics(app):
+    """
+    Record request latency, SQL statement counts / time / rows and pool
+    waits for every request of ``app``.
+
+    With PROMETHEUS_MULTIPROC_DIR set (gunicorn), every worker writes its
+    samples there and ``/metrics`` aggregates them.
+    """
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        os.makedirs(multiproc_dir, exist_ok=True)
+
+    global _collectors
+    from . import collectors as _collectors
+
+    request_started.connect(_request_started, app)
+    request_finished.connect(_request_finished, app)
+
+    # every engine of the process; benchmarks and tests build more than
+    # one app, so register once or every statement is counted per app
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+    if _pool_checkout not in pool_stats.observers:
+        pool_stats.observers.append(_pool_checkout)
+
+
+# =============================
+# REQUEST SIGNALS
+# =============================
+def _request_started(sender, **extra):
+    g._metrics_start = time.perf_counter()
+    g._metrics_statements = 0
+
+
+def _request_finished(sender, response, **extra):
+    start = g.pop("_metrics_start", None)
+    if start is None:
+        return
+
+    endpoint = _endpoint_label()
+
+    _collectors.REQUEST_LATENCY.labels(
+        endpoint, request.method, str(response.status_code)
+    ).observe(time.perf_counter() - start)
+
+    _collectors.SQL_STATEMENTS_PER_REQUEST.labels(endpoint).observe(
+        g.pop("_metrics_statements", 0)
+    )
+
+
+# =============================
+# SQL EVENTS
+# =============================
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("_metrics_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("_metrics_start")
+    if not started:
+        return
+
+    elapsed = time.perf_counter() - started.pop()
+    endpoint = _endpoint_label()
+
+    _collectors.SQL_STATEMENTS.labels(endpoint).inc()
+    _collectors.SQL_SECONDS.labels(endpoint).inc(elapsed)
+
+    if cursor.description is not None:
+        # SELECT rowcount is -1 until fetched; count rows as the result
+        # (ORM, Core or streamed) fetches them
+        if context is not None:
+            context.cursor = _CountingCursor(cursor, endpoint)
+    elif cursor.rowcount > 0:
+        _collectors.SQL_ROWS_AFFECTED.labels(endpoint).inc(cursor.rowcount)
+
+    if has_request_context() and "_metrics_statements" in g:
+        g._metrics_statements += 1
+
+
+class _CountingCursor:
+    """DBAPI cursor proxy counting the rows fetched through it."""
+
+    def __init__(self, cursor, endpoint):
+        self._cursor = cursor
+        self._rows = _collectors.SQL_ROWS_FETCHED.labels(endpoint)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._rows.inc()
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        if rows:
+            self._rows.inc(len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        if rows:
+            self._rows.inc(len(rows))
+        return rows
+
+
+# =============================
+# POOL
+# =============================
+def _pool_checkout(wait, overflow, timed_out=False):
+    if timed_out:
+        _collectors.POOL_TIMEOUTS.inc()
+        return
+
+    _collectors.POOL_CHECKOUT_WAIT.observe(wait)
+    if overflow:
+        _collectors.POOL_OVERFLOW_CHECKOUTS.inc()
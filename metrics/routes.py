@@ -0,0 +1,39 @@
+import hmac
+
+from flask import Response, abort, current_app, request
+from flask_login import current_user
+
+from . import metrics_bp
+
+
+def _authorized():
+    if current_user.is_authenticated and current_user.role == "admin":
+        return True
+
+    # scrapers authenticate with "Authorization: Bearer <METRICS_TOKEN>"
+    token = current_app.config.get("METRICS_TOKEN")
+    auth = request.headers.get("Authorization", "")
+    return bool(token) and hmac.compare_digest(auth, f"Bearer {token}")
+
+
+# =============================
+# PROMETHEUS SCRAPE
+# =============================
+@metrics_bp.route("/metrics")
+def metrics():
+    if not _authorized():
+        abort(403)
+
+    from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest
+    from prometheus_client import multiprocess
+
+    if current_app.config.get("PROMETHEUS_MULTIPROC_DIR"):
+        # samples of every gunicorn worker
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    # content_type, not mimetype: CONTENT_TYPE_LATEST already carries the
+    # charset and Flask would append a second one
+    return Response(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
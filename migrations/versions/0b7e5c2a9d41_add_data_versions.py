@@ -0,0 +1,32 @@
+"""Add DataVersions table
+
+Revision ID: 0b7e5c2a9d41
+Revises: f5a3d9c27b40
+Create Date: 2026-10-18 12:41:07.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0b7e5c2a9d41'
+down_revision = 'f5a3d9c27b40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    data_versions = op.create_table('DataVersions',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+    # seeded so bump_version() never has to race on the first insert
+    op.bulk_insert(data_versions, [{'name': 'servers', 'version': 0}])
+
+
+def downgrade():
+    op.drop_table('DataVersions')
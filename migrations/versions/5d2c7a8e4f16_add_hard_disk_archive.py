@@ -0,0 +1,62 @@
+"""Add hard disk archive table
+
+Revision ID: 5d2c7a8e4f16
+Revises: b3e8f1c5a92d
+Create Date: 2026-10-18 17:24:10.552817
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2c7a8e4f16'
+down_revision = 'b3e8f1c5a92d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('HardDiskHistoricalArchive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('disk_name', sa.String(length=200), nullable=False),
+        sa.Column('serial_number', sa.String(length=50), nullable=True),
+        sa.Column('file_name', sa.String(length=255), nullable=False),
+        sa.Column('full_path', sa.Text(), nullable=True),
+        sa.Column('size_mb', sa.Float(), nullable=True),
+        sa.Column('modified', sa.DateTime(), nullable=True),
+        sa.Column('uploaded_by', sa.String(length=100), nullable=True),
+        sa.Column('uploaded_at', sa.DateTime(), nullable=True),
+        sa.Column('content_hash', sa.String(length=40), nullable=True),
+        sa.Column('path_hash', sa.String(length=40), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('HardDiskHistoricalArchive', schema=None) as batch_op:
+        batch_op.create_index('IX_HardDiskHistoricalArchive_ContentHash', ['content_hash'], unique=False)
+        batch_op.create_index('IX_HardDiskHistoricalArchive_Disk_Serial', ['disk_name', 'serial_number'], unique=False)
+        batch_op.create_index('IX_HardDiskHistoricalArchive_Modified', ['modified'], unique=False)
+        batch_op.create_index('IX_HardDiskHistoricalArchive_Serial_Modified', ['serial_number', 'modified'], unique=False)
+        batch_op.create_index(batch_op.f('ix_HardDiskHistoricalArchive_file_name'), ['file_name'], unique=False)
+
+    # Cold rows are written once and rarely read: page compression keeps
+    # the archive small on SQL Server
+    if op.get_bind().dialect.name == 'mssql':
+        op.execute('ALTER TABLE HardDiskHistoricalArchive REBUILD WITH (DATA_COMPRESSION = PAGE)')
+
+    with op.batch_alter_table('HardDiskSummary', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('archived_files', sa.BigInteger(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    with op.batch_alter_table('HardDiskSummary', schema=None) as batch_op:
+        batch_op.drop_column('archived_files')
+
+    with op.batch_alter_table('HardDiskHistoricalArchive', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_HardDiskHistoricalArchive_file_name'))
+        batch_op.drop_index('IX_HardDiskHistoricalArchive_Serial_Modified')
+        batch_op.drop_index('IX_HardDiskHistoricalArchive_Modified')
+        batch_op.drop_index('IX_HardDiskHistoricalArchive_Disk_Serial')
+        batch_op.drop_index('IX_HardDiskHistoricalArchive_ContentHash')
+
+    op.drop_table('HardDiskHistoricalArchive')
@@ -0,0 +1,35 @@
+"""Add ApiTokens table
+
+Revision ID: 7c2e9a4f1b63
+Revises: 0b7e5c2a9d41
+Create Date: 2026-10-18 14:06:52.407391
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c2e9a4f1b63'
+down_revision = '0b7e5c2a9d41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ApiTokens',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('token_hash', sa.String(length=64), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('last_used_at', sa.DateTime(), nullable=True),
+    sa.Column('revoked', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('token_hash')
+    )
+
+
+def downgrade():
+    op.drop_table('ApiTokens')
@@ -0,0 +1,26 @@
+"""Index HardDiskHistoricalArchive.path_hash
+
+Revision ID: 7f4b2d9c1e38
+Revises: e6a49c0b7d25
+Create Date: 2026-10-18 21:05:13.482107
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7f4b2d9c1e38'
+down_revision = 'e6a49c0b7d25'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('HardDiskHistoricalArchive', schema=None) as batch_op:
+        batch_op.create_index('IX_HardDiskHistoricalArchive_PathHash', ['path_hash'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('HardDiskHistoricalArchive', schema=None) as batch_op:
+        batch_op.drop_index('IX_HardDiskHistoricalArchive_PathHash')
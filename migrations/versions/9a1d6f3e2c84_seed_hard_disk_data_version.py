@@ -0,0 +1,29 @@
+"""Seed hard_disk row in DataVersions
+
+Revision ID: 9a1d6f3e2c84
+Revises: 7c2e9a4f1b63
+Create Date: 2026-10-18 15:12:30.664120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a1d6f3e2c84'
+down_revision = '7c2e9a4f1b63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    data_versions = sa.table('DataVersions',
+        sa.column('name', sa.String),
+        sa.column('version', sa.Integer),
+    )
+    # seeded so concurrent upload batches never race on the first insert
+    op.bulk_insert(data_versions, [{'name': 'hard_disk', 'version': 0}])
+
+
+def downgrade():
+    op.execute("DELETE FROM DataVersions WHERE name = 'hard_disk'")
@@ -0,0 +1,45 @@
+"""Add background jobs table
+
+Revision ID: a3c9e1f4b7d2
+Revises: 5f3d23060031
+Create Date: 2026-10-18 09:12:44.120381
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c9e1f4b7d2'
+down_revision = '5f3d23060031'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('BackgroundJobs',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('kind', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('progress', sa.Integer(), nullable=False),
+        sa.Column('message', sa.String(length=500), nullable=True),
+        sa.Column('params', sa.Text(), nullable=True),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('result_path', sa.String(length=500), nullable=True),
+        sa.Column('result_name', sa.String(length=255), nullable=True),
+        sa.Column('created_by', sa.String(length=100), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('BackgroundJobs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_BackgroundJobs_status'), ['status'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('BackgroundJobs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_BackgroundJobs_status'))
+
+    op.drop_table('BackgroundJobs')
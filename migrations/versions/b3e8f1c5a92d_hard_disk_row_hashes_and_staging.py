@@ -0,0 +1,58 @@
+"""Hard disk row hashes and upload staging table
+
+Revision ID: b3e8f1c5a92d
+Revises: 9a1d6f3e2c84
+Create Date: 2026-10-18 16:02:47.318905
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e8f1c5a92d'
+down_revision = '9a1d6f3e2c84'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('HardDiskStaging',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('batch_id', sa.String(length=32), nullable=False),
+        sa.Column('disk_name', sa.String(length=200), nullable=False),
+        sa.Column('serial_number', sa.String(length=50), nullable=True),
+        sa.Column('file_name', sa.String(length=255), nullable=False),
+        sa.Column('full_path', sa.Text(), nullable=True),
+        sa.Column('size_mb', sa.Float(), nullable=True),
+        sa.Column('modified', sa.DateTime(), nullable=True),
+        sa.Column('uploaded_by', sa.String(length=100), nullable=True),
+        sa.Column('uploaded_at', sa.DateTime(), nullable=True),
+        sa.Column('content_hash', sa.String(length=40), nullable=False),
+        sa.Column('path_hash', sa.String(length=40), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('HardDiskStaging', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_HardDiskStaging_batch_id'), ['batch_id'], unique=False)
+
+    with op.batch_alter_table('HardDiskHistorical', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(length=40), nullable=True))
+        batch_op.add_column(sa.Column('path_hash', sa.String(length=40), nullable=True))
+        batch_op.create_index('IX_HardDiskHistorical_ContentHash', ['content_hash'], unique=False)
+        batch_op.create_index('IX_HardDiskHistorical_PathHash', ['path_hash'], unique=False)
+
+    # Hashes for existing rows: run `flask assets backfill-hashes`
+    # (then `flask assets dedupe` to drop earlier re-uploads)
+
+
+def downgrade():
+    with op.batch_alter_table('HardDiskHistorical', schema=None) as batch_op:
+        batch_op.drop_index('IX_HardDiskHistorical_PathHash')
+        batch_op.drop_index('IX_HardDiskHistorical_ContentHash')
+        batch_op.drop_column('path_hash')
+        batch_op.drop_column('content_hash')
+
+    with op.batch_alter_table('HardDiskStaging', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_HardDiskStaging_batch_id'))
+
+    op.drop_table('HardDiskStaging')
@@ -0,0 +1,45 @@
+"""Add hard disk summary rollup
+
+Revision ID: c81f2d6a9e35
+Revises: a3c9e1f4b7d2
+Create Date: 2026-10-18 10:02:17.553104
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c81f2d6a9e35'
+down_revision = 'a3c9e1f4b7d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('HardDiskSummary',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('disk_name', sa.String(length=200), nullable=False),
+        sa.Column('serial_number', sa.String(length=50), nullable=True),
+        sa.Column('total_files', sa.BigInteger(), nullable=False),
+        sa.Column('total_size_mb', sa.Float(), nullable=False),
+        sa.Column('latest_backup', sa.DateTime(), nullable=True),
+        sa.Column('last_upload_at', sa.DateTime(), nullable=True),
+        sa.Column('last_uploaded_by', sa.String(length=100), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('disk_name', 'serial_number', name='UQ_HardDiskSummary_Disk')
+    )
+
+    # Seed from existing history (same as `flask assets rebuild-summary`)
+    op.execute(
+        'INSERT INTO "HardDiskSummary" '
+        '(disk_name, serial_number, total_files, total_size_mb, latest_backup, last_upload_at) '
+        'SELECT disk_name, serial_number, COUNT(*), COALESCE(SUM(size_mb), 0), '
+        'MAX(modified), MAX(uploaded_at) '
+        'FROM "HardDiskHistorical" '
+        'GROUP BY disk_name, serial_number'
+    )
+
+
+def downgrade():
+    op.drop_table('HardDiskSummary')
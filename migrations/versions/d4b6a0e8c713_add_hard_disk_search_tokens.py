@@ -0,0 +1,36 @@
+"""Add hard disk search tokens
+
+Revision ID: d4b6a0e8c713
+Revises: c81f2d6a9e35
+Create Date: 2026-10-18 10:41:05.907215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4b6a0e8c713'
+down_revision = 'c81f2d6a9e35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('HardDiskSearchTokens',
+        sa.Column('token', sa.String(length=64), nullable=False),
+        sa.Column('file_name', sa.String(length=255), nullable=False),
+        sa.PrimaryKeyConstraint('token', 'file_name')
+    )
+
+    with op.batch_alter_table('HardDiskHistorical', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_HardDiskHistorical_file_name'), ['file_name'], unique=False)
+
+    # Tokens for existing rows: run `flask assets rebuild-search-index`
+
+
+def downgrade():
+    with op.batch_alter_table('HardDiskHistorical', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_HardDiskHistorical_file_name'))
+
+    op.drop_table('HardDiskSearchTokens')
@@ -0,0 +1,43 @@
+"""Performance indexes for hard disk and server queries
+
+Revision ID: e2f7c4b91d58
+Revises: d4b6a0e8c713
+Create Date: 2026-10-18 11:20:31.664092
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2f7c4b91d58'
+down_revision = 'd4b6a0e8c713'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('HardDiskHistorical', schema=None) as batch_op:
+        # leading column of IX_HardDiskHistorical_Serial_Modified covers it
+        batch_op.drop_index(batch_op.f('ix_HardDiskHistorical_serial_number'))
+        batch_op.create_index('IX_HardDiskHistorical_Serial_Modified', ['serial_number', 'modified'], unique=False)
+        batch_op.create_index('IX_HardDiskHistorical_Modified', ['modified'], unique=False)
+        batch_op.create_index('IX_HardDiskHistorical_Disk_Serial', ['disk_name', 'serial_number'], unique=False)
+
+    with op.batch_alter_table('ServerAssets', schema=None) as batch_op:
+        batch_op.create_index('IX_ServerAssets_Segment_Hostname', ['segment', 'hostname'], unique=False)
+        batch_op.create_index('IX_ServerAssets_Env_Segment_Hostname', ['environment', 'segment', 'hostname'], unique=False)
+        batch_op.create_index('IX_ServerAssets_IP', ['ip_address'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('ServerAssets', schema=None) as batch_op:
+        batch_op.drop_index('IX_ServerAssets_IP')
+        batch_op.drop_index('IX_ServerAssets_Env_Segment_Hostname')
+        batch_op.drop_index('IX_ServerAssets_Segment_Hostname')
+
+    with op.batch_alter_table('HardDiskHistorical', schema=None) as batch_op:
+        batch_op.drop_index('IX_HardDiskHistorical_Disk_Serial')
+        batch_op.drop_index('IX_HardDiskHistorical_Modified')
+        batch_op.drop_index('IX_HardDiskHistorical_Serial_Modified')
+        batch_op.create_index(batch_op.f('ix_HardDiskHistorical_serial_number'), ['serial_number'], unique=False)
@@ -0,0 +1,42 @@
+"""Add hard disk usage rollups
+
+Revision ID: e6a49c0b7d25
+Revises: 5d2c7a8e4f16
+Create Date: 2026-10-18 18:40:52.104388
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6a49c0b7d25'
+down_revision = '5d2c7a8e4f16'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('HardDiskUsage',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('period', sa.String(length=1), nullable=False),
+        sa.Column('bucket', sa.Date(), nullable=False),
+        sa.Column('disk_name', sa.String(length=200), nullable=False),
+        sa.Column('serial_number', sa.String(length=50), nullable=True),
+        sa.Column('files_added', sa.BigInteger(), nullable=False),
+        sa.Column('mb_added', sa.Float(), nullable=False),
+        sa.Column('cumulative_mb', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('period', 'disk_name', 'serial_number', 'bucket', name='UQ_HardDiskUsage_Bucket')
+    )
+    with op.batch_alter_table('HardDiskUsage', schema=None) as batch_op:
+        batch_op.create_index('IX_HardDiskUsage_Period_Bucket', ['period', 'bucket'], unique=False)
+
+    # Rollups for existing rows: run `flask assets rebuild-usage`
+
+
+def downgrade():
+    with op.batch_alter_table('HardDiskUsage', schema=None) as batch_op:
+        batch_op.drop_index('IX_HardDiskUsage_Period_Bucket')
+
+    op.drop_table('HardDiskUsage')
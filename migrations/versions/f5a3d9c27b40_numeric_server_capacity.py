@@ -0,0 +1,79 @@
+"""Numeric CPU, RAM, Storage columns on ServerAssets
+
+Revision ID: f5a3d9c27b40
+Revises: e2f7c4b91d58
+Create Date: 2026-10-18 11:58:49.301557
+
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5a3d9c27b40'
+down_revision = 'e2f7c4b91d58'
+branch_labels = None
+depends_on = None
+
+
+# unit -> multiplier to GB
+_UNITS = {"": 1, "gb": 1, "g": 1, "tb": 1024, "t": 1024, "mb": 1 / 1024, "m": 1 / 1024}
+
+
+def _to_number(value, units=None):
+    """'16 cores' -> 16, '64 GB' -> 64, '2 TB' -> 2048; unparseable -> None."""
+    if value is None:
+        return None
+    match = re.match(r"\s*([\d.,]+)\s*([a-zA-Z]*)", str(value))
+    if not match:
+        return None
+    try:
+        number = float(match.group(1).replace(",", ""))
+    except ValueError:
+        return None
+    if units is None:
+        return int(round(number))
+    factor = units.get(match.group(2).lower())
+    return int(round(number * factor)) if factor else None
+
+
+def upgrade():
+    with op.batch_alter_table('ServerAssets', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('cpu_n', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('ram_n', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('storage_n', sa.Integer(), nullable=True))
+
+    conn = op.get_bind()
+    servers = sa.table(
+        'ServerAssets',
+        sa.column('id', sa.Integer),
+        sa.column('cpu', sa.String), sa.column('ram', sa.String), sa.column('storage', sa.String),
+        sa.column('cpu_n', sa.Integer), sa.column('ram_n', sa.Integer), sa.column('storage_n', sa.Integer),
+    )
+    for row in conn.execute(sa.select(servers.c.id, servers.c.cpu, servers.c.ram, servers.c.storage)).fetchall():
+        conn.execute(
+            servers.update().where(servers.c.id == row.id).values(
+                cpu_n=_to_number(row.cpu),
+                ram_n=_to_number(row.ram, _UNITS),
+                storage_n=_to_number(row.storage, _UNITS),
+            )
+        )
+
+    with op.batch_alter_table('ServerAssets', schema=None) as batch_op:
+        batch_op.drop_column('cpu')
+        batch_op.drop_column('ram')
+        batch_op.drop_column('storage')
+
+    with op.batch_alter_table('ServerAssets', schema=None) as batch_op:
+        batch_op.alter_column('cpu_n', new_column_name='cpu', existing_type=sa.Integer())
+        batch_op.alter_column('ram_n', new_column_name='ram', existing_type=sa.Integer())
+        batch_op.alter_column('storage_n', new_column_name='storage', existing_type=sa.Integer())
+
+
+def downgrade():
+    with op.batch_alter_table('ServerAssets', schema=None) as batch_op:
+        batch_op.alter_column('cpu', type_=sa.String(length=50), existing_type=sa.Integer())
+        batch_op.alter_column('ram', type_=sa.String(length=50), existing_type=sa.Integer())
+        batch_op.alter_column('storage', type_=sa.String(length=50), existing_type=sa.Integer())
@@ -1,5 +1,9 @@
-from app import db, login_manager
+from dataclasses import dataclass
+
+from flask import current_app
+from extensions import db, login_manager
 from flask_login import UserMixin
+from utils.cache import TTLCache
 
 class User(UserMixin, db.Model):
     __tablename__ = "users"
@@ -19,6 +23,68 @@ class User(UserMixin, db.Model):
     def is_admin(self):
         return self.role == "admin"
 
+
+# ======================
+# SESSION PRINCIPAL
+# ======================
+@dataclass(frozen=True)
+class UserPrincipal:
+    """
+    Detached, read-only view of a User used as ``current_user``.
+    Load the ORM ``User`` explicitly before changing anything.
+    """
+    user_id: int
+    username: str
+    full_name: str
+    role: str
+    is_active: bool
+    must_change_password: bool
+
+    is_authenticated = True
+    is_anonymous = False
+
+    @classmethod
+    def from_user(cls, user):
+        return cls(
+            user_id=user.user_id,
+            username=user.username,
+            full_name=user.full_name,
+            role=user.role,
+            is_active=user.is_active,
+            must_change_password=bool(user.must_change_password),
+        )
+
+    def get_id(self):
+        return str(self.user_id)
+
+    def is_admin(self):
+        return self.role == "admin"
+
+
+_principal_cache = TTLCache()
+
+
+def invalidate_user(user_id):
+    """Drop the cached principal; call after committing a change to the user."""
+    _principal_cache.pop(int(user_id))
+
+
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    user_id = int(user_id)
+
+    principal = _principal_cache.get(user_id)
+    if principal is None:
+        user = db.session.get(User, user_id)
+        if user is None:
+            return None
+
+        principal = UserPrincipal.from_user(user)
+        _principal_cache.maxsize = current_app.config["USER_CACHE_SIZE"]
+        _principal_cache.set(user_id, principal, current_app.config["USER_CACHE_TTL"])
+
+    # deactivated users are logged out on their next request
+    if not principal.is_active:
+        return None
+
+    return principal
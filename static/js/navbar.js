@@ -55,16 +55,15 @@ document.addEventListener("DOMContentLoaded", () => {
 });
 
 /* ===============================
-   FOOTER SERVER CLOCK
+   FOOTER CLOCK
    =============================== */
 
 (function () {
   const clockEl = document.getElementById("footerClock");
   if (!clockEl) return;
 
-  // Parse server time
-  let serverTime = new Date(clockEl.dataset.serverTime.replace(" ", "T"));
-
+  // Client clock: pages are served from 304s, so a server timestamp
+  // rendered into the HTML would be stale
   let showColon = true;
 
   function pad(num) {
@@ -72,14 +71,14 @@ document.addEventListener("DOMContentLoaded", () => {
   }
 
   function updateClock() {
-    serverTime.setSeconds(serverTime.getSeconds() + 1);
+    const now = new Date();
 
     showColon = !showColon;
     const colon = showColon ? ":" : " ";
 
-    const hours = pad(serverTime.getHours());
-    const minutes = pad(serverTime.getMinutes());
-    const seconds = pad(serverTime.getSeconds());
+    const hours = pad(now.getHours());
+    const minutes = pad(now.getMinutes());
+    const seconds = pad(now.getSeconds());
 
     clockEl.textContent = `${hours}${colon}${minutes}${colon}${seconds}`;
   }
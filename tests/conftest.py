@@ -0,0 +1,69 @@
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+
+# run from anywhere: the app's packages live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Config reads the environment at import time: point the app at a
+# throwaway SQLite file before anything imports it (never DATABASE_URL
+# from .env; the tests empty every table)
+TEST_DIR = tempfile.mkdtemp(prefix="dba_portal_tests_")
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(TEST_DIR, "test.db")
+os.environ["JOB_DIR"] = os.path.join(TEST_DIR, "jobs")
+os.environ["FLASK_SECRET_KEY"] = "tests"
+os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
+
+ADMIN_PASSWORD = "Admin-password-1"
+
+
+@pytest.fixture(scope="session")
+def app():
+    from app import app
+    from extensions import db
+    from models import User
+
+    app.config["TESTING"] = True
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(
+            username="admin",
+            password_hash=generate_password_hash(ADMIN_PASSWORD),
+            full_name="Test Admin",
+            role="admin",
+            is_active=True,
+            must_change_password=False,
+        ))
+        db.session.commit()
+
+    yield app
+
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
+
+
+@pytest.fixture
+def app_ctx(app):
+    """App context with every table but users emptied afterwards."""
+    from extensions import db
+
+    with app.app_context():
+        yield app
+
+        db.session.rollback()
+        for table in reversed(db.metadata.sorted_tables):
+            if table.name != "users":
+                db.session.execute(table.delete())
+        db.session.commit()
+
+
+@pytest.fixture
+def client(app, app_ctx):
+    client = app.test_client()
+    client.post("/login", data={"username": "admin", "password": ADMIN_PASSWORD})
+    return client
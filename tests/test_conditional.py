@@ -0,0 +1,80 @@
+"""ETag / 304 handling of the list pages and the API (utils.conditional)."""
+from datetime import datetime
+
+from assets.ingest import ingest_hard_disks
+from extensions import db
+from models import User, invalidate_user
+
+
+def _ingest(file_name):
+    ingest_hard_disks([{
+        "disk_name": "COLD-01",
+        "serial_number": "SN000001",
+        "file_name": file_name,
+        "full_path": f"D:\\bak\\{file_name}",
+        "size_mb": 1.0,
+        "modified": datetime(2024, 1, 1),
+    }], "admin")
+
+
+def test_unchanged_page_is_not_modified(client):
+    _ingest("a.bak")
+    first = client.get("/assets/hard-disk")
+    etag = first.headers["ETag"]
+
+    assert first.status_code == 200
+    assert "private" in first.headers["Cache-Control"]
+    assert "no-cache" in first.headers["Cache-Control"]
+
+    again = client.get("/assets/hard-disk", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.data == b""
+    assert again.headers["ETag"] == etag
+
+
+def test_upload_invalidates_the_etag(client):
+    _ingest("a.bak")
+    etag = client.get("/assets/hard-disk").headers["ETag"]
+
+    _ingest("b.bak")
+    response = client.get("/assets/hard-disk", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert b"b.bak" in response.data
+
+
+def test_query_string_is_part_of_the_etag(client):
+    _ingest("a.bak")
+    etag = client.get("/assets/hard-disk").headers["ETag"]
+
+    response = client.get("/assets/hard-disk?q=a", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_renamed_user_gets_a_fresh_page(client):
+    etag = client.get("/assets/hard-disk").headers["ETag"]
+
+    user = User.query.filter_by(username="admin").one()
+    full_name = user.full_name
+    user.full_name = "Renamed Admin"
+    db.session.commit()
+    invalidate_user(user.user_id)
+
+    try:
+        response = client.get("/assets/hard-disk", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert b"Renamed Admin" in response.data
+    finally:
+        user.full_name = full_name
+        db.session.commit()
+        invalidate_user(user.user_id)
+
+
+def test_api_not_modified(client):
+    _ingest("a.bak")
+    first = client.get("/api/v1/hard-disks")
+
+    response = client.get("/api/v1/hard-disks", headers={"If-None-Match": first.headers["ETag"]})
+    assert response.status_code == 304
@@ -0,0 +1,80 @@
+"""Hard disk CSV validation (assets.csv_parser)."""
+import io
+from datetime import datetime
+
+import pytest
+
+from assets.csv_parser import CsvSchemaError, ParseReport, iter_hard_disk_batches
+
+
+HEADER = "DiskName,SerialNumber,FileName,FullPath,SizeMB,Modified\n"
+
+
+def _parse(body, chunksize=5000):
+    report = ParseReport()
+    f = io.BytesIO((HEADER + body).encode("utf-8"))
+    rows = [row for batch in iter_hard_disk_batches(f, report, chunksize) for row in batch]
+    return rows, report
+
+
+def test_valid_rows_are_normalized():
+    rows, report = _parse(
+        "COLD-01, WD-ABCD12345678 ,DB_FULL.bak,D:\\bak\\DB_FULL.bak,1024.5,2024-03-01 10:00:00\n"
+        "COLD-01,,LOG.trn,,,\n"
+    )
+
+    assert report.rows_read == 2 and report.rows_valid == 2 and report.errors == []
+    assert rows[0] == {
+        "disk_name": "COLD-01",
+        "serial_number": "12345678",
+        "file_name": "DB_FULL.bak",
+        "full_path": "D:\\bak\\DB_FULL.bak",
+        "size_mb": 1024.5,
+        "modified": datetime(2024, 3, 1, 10, 0),
+    }
+    assert type(rows[0]["modified"]) is datetime
+    # empty optional values are stored as NULL
+    assert rows[1]["serial_number"] is None
+    assert rows[1]["full_path"] is None
+    assert rows[1]["size_mb"] is None
+    assert rows[1]["modified"] is None
+
+
+def test_invalid_rows_are_rejected_with_line_and_column():
+    rows, report = _parse(
+        "COLD-01,S1,ok.bak,,1,2024-01-01\n"
+        ",S1,no_disk.bak,,1,2024-01-01\n"
+        "COLD-01,S1,,,1,2024-01-01\n"
+        "COLD-01,S1,size.bak,,abc,2024-01-01\n"
+        "COLD-01,S1,negative.bak,,-5,2024-01-01\n"
+        "COLD-01,S1,date.bak,,1,not a date\n"
+        f"COLD-01,S1,{'x' * 256},,1,2024-01-01\n"
+    )
+
+    assert [row["file_name"] for row in rows] == ["ok.bak"]
+    assert report.rows_read == 7
+    assert report.rows_rejected == 6
+    assert [(e.line, e.column, e.message) for e in report.errors] == [
+        (3, "DiskName", "DiskName is required"),
+        (4, "FileName", "FileName is required"),
+        (5, "SizeMB", "SizeMB is not a number"),
+        (6, "SizeMB", "SizeMB is negative"),
+        (7, "Modified", "Modified is not a valid date"),
+        (8, "FileName", "FileName longer than 255 characters"),
+    ]
+
+
+def test_line_numbers_continue_across_chunks():
+    body = "".join(f"COLD-01,S1,f{i}.bak,,{'x' if i == 4 else 1},2024-01-01\n" for i in range(6))
+    rows, report = _parse(body, chunksize=2)
+
+    assert len(rows) == 5
+    assert [(e.line, e.column) for e in report.errors] == [(6, "SizeMB")]
+
+
+def test_missing_column_fails_the_upload():
+    report = ParseReport()
+    f = io.BytesIO(b"DiskName,FileName\nCOLD-01,a.bak\n")
+
+    with pytest.raises(CsvSchemaError, match="SerialNumber"):
+        list(iter_hard_disk_batches(f, report))
@@ -0,0 +1,37 @@
+"""App startup stays cheap: heavy export / upload engines load lazily."""
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.import_time import LAZY_MODULES, ROOT, measure
+
+
+# Loose on purpose: catches an eager pandas import (~1s on its own),
+# not machine-to-machine noise
+BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", 2000))
+
+
+def _fresh_python(code):
+    env = dict(os.environ, DATABASE_URL="sqlite://", FLASK_SECRET_KEY="import-time")
+    env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    return proc.stdout
+
+
+def test_heavy_modules_not_imported_by_create_app():
+    out = _fresh_python(
+        "import json, sys\n"
+        "from app import create_app\n"
+        "create_app()\n"
+        f"print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))\n"
+    )
+    assert json.loads(out.splitlines()[-1]) == []
+
+
+def test_import_app_within_budget():
+    best = min(measure("app", "sqlite://")["app"][1] for _ in range(3)) / 1000
+    assert best <= BUDGET_MS, f"import app took {best:.0f}ms, budget {BUDGET_MS:.0f}ms"
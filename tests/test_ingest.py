@@ -0,0 +1,75 @@
+"""Delta ingest through the staging table (assets.ingest)."""
+from datetime import datetime, timedelta
+
+from assets.archive import archive_hard_disks
+from assets.ingest import ingest_hard_disks
+from assets.models import HardDiskArchive, HardDiskBackup, HardDiskSummary
+
+
+def _rows(count=10, size=1.0, serial="SN000001", shift=0):
+    return [
+        {
+            "disk_name": "COLD-01",
+            "serial_number": serial,
+            "file_name": f"DB{i}_FULL.bak",
+            "full_path": f"D:\\bak\\DB{i}_FULL.bak",
+            "size_mb": size + i,
+            "modified": datetime(2024, 1, 1) + timedelta(days=30 * i + shift),
+        }
+        for i in range(count)
+    ]
+
+
+def _counts(result):
+    return result.inserted, result.updated, result.skipped, result.failed
+
+
+def _summary():
+    s = HardDiskSummary.query.filter_by(disk_name="COLD-01", serial_number="SN000001").one()
+    return s.total_files, s.total_size_mb, s.latest_backup
+
+
+def test_reupload_is_idempotent(app_ctx):
+    first = ingest_hard_disks(_rows(), "admin", batch_size=4)
+    again = ingest_hard_disks(_rows(), "admin", batch_size=4)
+
+    assert _counts(first) == (10, 0, 0, 0)
+    assert first.batches == 3
+    assert _counts(again) == (0, 0, 10, 0)
+    assert HardDiskBackup.query.count() == 10
+    assert _summary() == (10, sum(1.0 + i for i in range(10)), datetime(2024, 1, 1) + timedelta(days=270))
+
+
+def test_changed_files_are_updated_in_place(app_ctx):
+    ingest_hard_disks(_rows(), "admin")
+    result = ingest_hard_disks(_rows(size=5.0, shift=-1) + _rows(2, serial="SN000002"), "admin")
+
+    assert _counts(result) == (2, 10, 0, 0)
+    assert HardDiskBackup.query.count() == 12
+    assert HardDiskBackup.query.filter_by(serial_number="SN000001", size_mb=5.0).count() == 1
+    # latest_backup moved backwards: recomputed, not folded in as a delta
+    assert _summary()[2] == datetime(2024, 1, 1) + timedelta(days=269)
+
+
+def test_file_listed_twice_in_one_upload_keeps_the_last_line(app_ctx):
+    rows = _rows(1) + _rows(1, size=7.0)
+    result = ingest_hard_disks(rows, "admin")
+
+    assert _counts(result) == (1, 0, 1, 0)
+    assert HardDiskBackup.query.one().size_mb == 7.0
+
+
+def test_reupload_after_archival_does_not_duplicate(app_ctx):
+    ingest_hard_disks(_rows(), "admin")
+    archive_hard_disks(datetime(2024, 6, 1))
+    archived = HardDiskArchive.query.count()
+    assert archived
+
+    unchanged = ingest_hard_disks(_rows(), "admin")
+    changed = ingest_hard_disks(_rows(size=5.0, shift=1), "admin")
+
+    assert _counts(unchanged) == (0, 0, 10, 0)
+    assert _counts(changed) == (0, 10, 0, 0)
+    assert HardDiskBackup.query.count() + HardDiskArchive.query.count() == 10
+    assert HardDiskArchive.query.count() == 0
+    assert _summary()[0] == 10
@@ -0,0 +1,88 @@
+"""Opaque cursors and seek pagination (utils.keyset)."""
+import base64
+import json
+
+import pytest
+
+from assets.models import ServerAsset
+from extensions import db
+from utils.keyset import decode_cursor, encode_cursor, keyset_paginate
+
+
+def _token(data):
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+
+def test_cursor_round_trip():
+    for data in ({"k": 1, "d": "n"}, {"k": 123456789, "d": "p"}):
+        assert decode_cursor(encode_cursor(data)) == data
+
+
+TAMPERED = {
+    "missing": None,
+    "empty": "",
+    "garbage": "not base64 json!",
+    "list": _token([1, 2]),
+    "no direction": _token({"k": 5}),
+    "bad direction": _token({"k": 5, "d": "x"}),
+    "string key": _token({"k": "5", "d": "n"}),
+    "bool key": _token({"k": True, "d": "n"}),
+    "dict key": _token({"k": {"id": 1}, "d": "n"}),
+    "null key": _token({"k": None, "d": "p"}),
+}
+
+
+@pytest.mark.parametrize("token", TAMPERED.values(), ids=TAMPERED.keys())
+def test_tampered_cursor_falls_back_to_first_page(token):
+    assert decode_cursor(token) is None
+
+
+@pytest.fixture
+def servers(app_ctx):
+    db.session.execute(ServerAsset.__table__.insert(), [
+        {
+            "hostname": f"srv{i:02d}",
+            "ip_address": f"10.0.0.{i}",
+            "environment": "Production",
+            "segment": "DB",
+        }
+        for i in range(10)
+    ])
+    db.session.commit()
+    return [s.id for s in ServerAsset.query.order_by(ServerAsset.id)]
+
+
+def test_pages_walk_forward_and_back(servers):
+    query = ServerAsset.query
+    pages = [keyset_paginate(query, ServerAsset.id, 4)]
+    while pages[-1].has_next:
+        pages.append(keyset_paginate(query, ServerAsset.id, 4, pages[-1].next_cursor))
+
+    assert [[s.id for s in p.items] for p in pages] == [servers[0:4], servers[4:8], servers[8:10]]
+    assert not pages[0].has_prev and pages[-1].has_prev
+
+    back = keyset_paginate(query, ServerAsset.id, 4, pages[-1].prev_cursor)
+    assert [s.id for s in back.items] == servers[4:8]
+    assert back.has_next and back.has_prev
+
+    first = keyset_paginate(query, ServerAsset.id, 4, back.prev_cursor)
+    assert [s.id for s in first.items] == servers[0:4]
+    assert not first.has_prev
+
+
+def test_api_cursor_round_trip(client, servers):
+    seen = []
+    url = "/api/v1/servers?limit=3&fields=id"
+    while url:
+        body = client.get(url).get_json()
+        seen += [row["id"] for row in body["data"]]
+        url = body["next_cursor"] and f"/api/v1/servers?limit=3&fields=id&cursor={body['next_cursor']}"
+
+    assert seen == servers
+
+
+def test_api_ignores_a_forged_cursor(client, servers):
+    response = client.get("/api/v1/servers?limit=3&cursor=" + _token({"k": {"id": 1}, "d": "n"}))
+
+    assert response.status_code == 200
+    assert [row["id"] for row in response.get_json()["data"]] == servers[:3]
@@ -0,0 +1,47 @@
+"""Prometheus scrape endpoint (metrics.routes)."""
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from assets.models import ServerAsset
+from extensions import db
+
+
+def test_metrics_content_type_has_one_charset(client):
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == CONTENT_TYPE_LATEST
+    assert response.headers["Content-Type"].count("charset") == 1
+    assert b"dba_portal_request_duration_seconds" in response.data
+
+
+def test_metrics_requires_admin_or_token(app, app_ctx, monkeypatch):
+    client = app.test_client()
+    assert client.get("/metrics").status_code == 403
+
+    monkeypatch.setitem(app.config, "METRICS_TOKEN", "scrape-token")
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 403
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-token"}).status_code == 200
+
+
+def test_fetched_rows_are_counted_for_core_queries(client):
+    def fetched():
+        for line in client.get("/metrics").get_data(as_text=True).splitlines():
+            if line.startswith('dba_portal_sql_rows_fetched_total{endpoint="api.servers"}'):
+                return float(line.split()[-1])
+        return 0.0
+
+    db.session.execute(ServerAsset.__table__.insert(), [
+        {
+            "hostname": f"srv{i}",
+            "ip_address": f"10.0.0.{i}",
+            "environment": "Production",
+            "segment": "DB",
+        }
+        for i in range(5)
+    ])
+    db.session.commit()
+
+    before = fetched()
+    client.get("/api/v1/servers?limit=10")
+    # with_entities projection: Core rows, no ORM instance loads
+    assert fetched() - before >= 5
@@ -0,0 +1,21 @@
+"""The hot queries keep using their indexes (SQLite query planner)."""
+import pytest
+
+from benchmarks.query_plans import create_plan_app, query_cases, query_plan
+
+
+@pytest.fixture(scope="module")
+def plan_app():
+    app = create_plan_app()
+    with app.app_context():
+        yield app
+
+
+@pytest.mark.parametrize(
+    "stmt, index",
+    [(stmt, index) for _, stmt, index in query_cases()],
+    ids=[name for name, _, _ in query_cases()],
+)
+def test_query_uses_index(plan_app, stmt, index):
+    plan = query_plan(stmt)
+    assert index in plan, plan
@@ -0,0 +1,100 @@
+import gzip
+import zlib
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # optional, see requirements.txt
+    brotli = None
+
+
+COMPRESSIBLE_TYPES = (
+    "text/html", "text/css", "text/csv", "text/plain", "text/javascript",
+    "application/json", "application/javascript", "image/svg+xml",
+)
+
+
+def negotiate_encoding(candidates):
+    """
+    The coding from ``candidates`` (in order of preference) the request's
+    Accept-Encoding gives the highest quality > 0; None for identity.
+    """
+    accepted = request.accept_encodings
+    best, best_quality = None, 0
+    for encoding in candidates:
+        quality = accepted[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def _compress(data, encoding, level):
+    if encoding == "br":
+        return brotli.compress(data, quality=level)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def _compress_stream(chunks, encoding, level):
+    """
+    Compress a streamed body chunk by chunk; each chunk is flushed so the
+    client keeps receiving data as it is produced.
+    """
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=level)
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)    # 31: gzip container
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            if data:
+                yield data
+        yield compressor.flush()
+
+
+# =============================
+# SETUP
+# =============================
+def init_compression(app):
+    """
+    gzip / brotli for compressible dynamic responses of at least
+    COMPRESS_MIN_SIZE bytes; streamed responses (CSV export) are always
+    compressed incrementally. Files (send_file, static) are left alone.
+    """
+    min_size = app.config["COMPRESS_MIN_SIZE"]
+    levels = {"gzip": app.config["COMPRESS_GZIP_LEVEL"], "br": app.config["COMPRESS_BR_LEVEL"]}
+
+    @app.after_request
+    def compress_response(response):
+        if (
+            response.status_code != 200
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_TYPES
+        ):
+            return response
+
+        encoding = negotiate_encoding(("br", "gzip") if brotli is not None else ("gzip",))
+        response.vary.add("Accept-Encoding")
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            response.response = _compress_stream(response.response, encoding, levels[encoding])
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < min_size:
+                return response
+            response.set_data(_compress(data, encoding, levels[encoding]))
+
+        response.headers["Content-Encoding"] = encoding
+        return response
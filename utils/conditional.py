@@ -0,0 +1,49 @@
+import hashlib
+from datetime import timezone
+
+from flask import request, make_response
+
+
+class Validators:
+    """
+    ETag / Last-Modified for a response that is fully determined by
+    ``parts`` (data version stamps, filters, viewer).
+
+    Check ``not_modified()`` before doing any work and pass the final
+    response through ``apply()``.
+    """
+
+    def __init__(self, *parts, last_modified=None):
+        digest = hashlib.sha1(
+            "|".join(str(p) for p in parts).encode("utf-8")
+        ).hexdigest()
+        self.etag = digest[:32]
+
+        # HTTP dates have one-second resolution
+        if last_modified is not None:
+            last_modified = last_modified.replace(microsecond=0)
+            if last_modified.tzinfo is None:
+                last_modified = last_modified.astimezone(timezone.utc)
+        self.last_modified = last_modified
+
+    def _matches(self):
+        if request.if_none_match:
+            return request.if_none_match.contains_weak(self.etag)
+
+        since = request.if_modified_since
+        return bool(since and self.last_modified and self.last_modified <= since)
+
+    def not_modified(self):
+        """A 304 response if the client's copy is current, else None."""
+        if not self._matches():
+            return None
+        return self.apply(make_response("", 304))
+
+    def apply(self, response):
+        response.set_etag(self.etag, weak=True)
+        if self.last_modified is not None:
+            response.last_modified = self.last_modified
+        # per-user content; always revalidate, never share
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        return response
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from sqlalchemy import update
+
+from extensions import db
+
+
+# One row per data set ("servers", ...); bumped in the same transaction
+# as every write so all gunicorn workers see the change on their next read
+class DataVersion(db.Model):
+    __tablename__ = "DataVersions"
+
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.now)
+
+    def __repr__(self):
+        return f"<DataVersion {self.name}={self.version}>"
+
+
+def get_version(name):
+    version = (
+        db.session.query(DataVersion.version)
+        .filter(DataVersion.name == name)
+        .scalar()
+    )
+    return version or 0
+
+
+def get_stamp(name):
+    """``(version, updated_at)`` for conditional GET validators."""
+    row = (
+        db.session.query(DataVersion.version, DataVersion.updated_at)
+        .filter(DataVersion.name == name)
+        .first()
+    )
+    return (row.version, row.updated_at) if row else (0, None)
+
+
+def bump_version(name):
+    """Increment ``name``'s version; the caller commits."""
+    updated = db.session.execute(
+        update(DataVersion)
+        .where(DataVersion.name == name)
+        .values(version=DataVersion.version + 1, updated_at=datetime.now())
+    ).rowcount
+
+    if not updated:
+        db.session.add(DataVersion(name=name, version=1, updated_at=datetime.now()))
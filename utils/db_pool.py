@@ -0,0 +1,106 @@
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+
+# Upper bounds (seconds) of the checkout wait histogram
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30)
+
+
+class PoolStats:
+    """Checkout counters for this worker process's connection pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # callables ``f(wait, overflow, timed_out=False)`` (e.g. metrics)
+        self.observers = []
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.overflow_checkouts = 0
+            self.timeouts = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+            self.wait_buckets = [0] * len(WAIT_BUCKETS)
+
+    def record(self, wait, overflow):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            if overflow:
+                self.overflow_checkouts += 1
+            for i, bound in enumerate(WAIT_BUCKETS):
+                if wait <= bound:
+                    self.wait_buckets[i] += 1
+                    break
+
+        for observer in self.observers:
+            observer(wait, overflow)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+        for observer in self.observers:
+            observer(0.0, False, timed_out=True)
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "timeouts": self.timeouts,
+                "wait_total_seconds": round(self.wait_total, 6),
+                "wait_max_seconds": round(self.wait_max, 6),
+                "wait_avg_seconds": (
+                    round(self.wait_total / self.checkouts, 6) if self.checkouts else 0.0
+                ),
+                "wait_buckets": {
+                    f"le_{bound}": count
+                    for bound, count in zip(WAIT_BUCKETS, self.wait_buckets)
+                },
+            }
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that records how long each checkout waited for a connection
+    and whether it was served from overflow.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            pool_stats.record_timeout()
+            raise
+
+        pool_stats.record(time.perf_counter() - start, self.overflow() > 0)
+        return conn
+
+
+def pool_status(engine):
+    """Current pool occupancy plus the checkout counters."""
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+            max_overflow=pool._max_overflow,
+        )
+
+    status.update(pool_stats.as_dict())
+    return status
@@ -0,0 +1,84 @@
+import base64
+import json
+from dataclasses import dataclass, field
+
+
+def encode_cursor(data: dict) -> str:
+    raw = json.dumps(data, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str):
+    """
+    Decode an opaque cursor token; returns None for missing or tampered
+    tokens so callers fall back to the first page.
+    """
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        data = json.loads(raw)
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(data, dict) or data.get("d") not in ("n", "p"):
+        return None
+    # keys are integer primary keys; anything else would reach the query
+    key = data.get("k")
+    if not isinstance(key, int) or isinstance(key, bool):
+        return None
+    return data
+
+
+@dataclass
+class KeysetPage:
+    items: list = field(default_factory=list)
+    next_cursor: str = None
+    prev_cursor: str = None
+    total: int = None
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self):
+        return self.prev_cursor is not None
+
+
+def keyset_paginate(query, column, per_page, cursor=None):
+    """
+    Seek pagination on a unique, ascending ``column`` (e.g. the primary key).
+
+    Each page is one ``WHERE column > :key ORDER BY column LIMIT n + 1``
+    query, so its cost does not depend on how deep the page is and no
+    OFFSET or COUNT(*) is issued.
+    """
+    data = decode_cursor(cursor)
+    key = column.key
+
+    if data and data["d"] == "p":
+        rows = (
+            query.filter(column < data["k"])
+            .order_by(column.desc())
+            .limit(per_page + 1)
+            .all()
+        )
+        has_prev = len(rows) > per_page
+        rows = rows[:per_page][::-1]
+        has_next = True
+    else:
+        if data:
+            query = query.filter(column > data["k"])
+        rows = query.order_by(column.asc()).limit(per_page + 1).all()
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
+        has_prev = data is not None
+
+    page = KeysetPage(items=rows)
+    if rows:
+        if has_next:
+            page.next_cursor = encode_cursor({"k": getattr(rows[-1], key), "d": "n"})
+        if has_prev:
+            page.prev_cursor = encode_cursor({"k": getattr(rows[0], key), "d": "p"})
+
+    return page
@@ -0,0 +1,165 @@
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+
+import click
+from flask import current_app, request, send_from_directory
+from flask.cli import with_appcontext
+
+from .compression import negotiate_encoding
+
+try:
+    import brotli
+except ImportError:  # optional, see requirements.txt
+    brotli = None
+
+
+BUILD_DIR = "build"
+MANIFEST_NAME = "manifest.json"
+PRECOMPRESS_EXTENSIONS = (".css", ".js", ".svg", ".json", ".txt", ".html")
+HASH_LENGTH = 12
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def _fingerprint(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:HASH_LENGTH]
+
+
+# =============================
+# BUILD
+# =============================
+def build_static(static_folder):
+    """
+    Copy every static file to ``static/build`` as ``name.<hash>.ext``,
+    write ``.gz`` / ``.br`` siblings for text assets and a manifest
+    mapping original names to the hashed ones. Returns the manifest.
+    """
+    build_root = os.path.join(static_folder, BUILD_DIR)
+    shutil.rmtree(build_root, ignore_errors=True)
+
+    manifest = {}
+    for root, dirs, files in os.walk(static_folder):
+        dirs[:] = [d for d in dirs if os.path.join(root, d) != build_root]
+
+        for name in sorted(files):
+            source = os.path.join(root, name)
+            relative = os.path.relpath(source, static_folder).replace(os.sep, "/")
+
+            stem, ext = os.path.splitext(relative)
+            hashed = f"{BUILD_DIR}/{stem}.{_fingerprint(source)}{ext}"
+            target = os.path.join(static_folder, hashed)
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(source, target)
+
+            if ext in PRECOMPRESS_EXTENSIONS:
+                with open(source, "rb") as f:
+                    data = f.read()
+                with open(target + ".gz", "wb") as f:
+                    f.write(gzip.compress(data, compresslevel=9, mtime=0))
+                if brotli is not None:
+                    with open(target + ".br", "wb") as f:
+                        f.write(brotli.compress(data, quality=11))
+
+            manifest[relative] = hashed
+
+    with open(os.path.join(build_root, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    return manifest
+
+
+def load_manifest(static_folder):
+    path = os.path.join(static_folder, BUILD_DIR, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+# =============================
+# SETUP
+# =============================
+def init_static_assets(app):
+    """
+    When ``flask static build`` has been run, ``url_for('static', ...)``
+    points at the fingerprinted copies, which are served precompressed
+    (when the client accepts it) with immutable cache headers.
+    """
+    manifest = load_manifest(app.static_folder) if app.config["STATIC_USE_BUILD"] else {}
+    app.extensions["static_manifest"] = manifest
+    app.cli.add_command(static_cli)
+
+    if not manifest:
+        return
+
+    hashed_files = set(manifest.values())
+
+    @app.url_defaults
+    def hashed_static_url(endpoint, values):
+        if endpoint == "static" and values.get("filename") in manifest:
+            values["filename"] = manifest[values["filename"]]
+
+    @app.before_request
+    def serve_precompressed():
+        if request.endpoint != "static":
+            return None
+
+        filename = (request.view_args or {}).get("filename")
+        if filename not in hashed_files:
+            return None
+
+        suffixes = {"br": ".br", "gzip": ".gz"}
+        encoding = negotiate_encoding([
+            encoding for encoding, suffix in suffixes.items()
+            if os.path.exists(os.path.join(app.static_folder, filename + suffix))
+        ])
+        if encoding is None:
+            return None
+
+        response = send_from_directory(
+            app.static_folder, filename + suffixes[encoding],
+            mimetype=_guess_mimetype(filename),
+        )
+        response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+        return response
+
+    @app.after_request
+    def immutable_static(response):
+        if request.endpoint == "static" and (request.view_args or {}).get("filename") in hashed_files:
+            response.headers["Cache-Control"] = IMMUTABLE
+        return response
+
+
+def _guess_mimetype(filename):
+    return mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+
+# =============================
+# flask static build / clean
+# =============================
+@click.group("static")
+def static_cli():
+    """Fingerprinted, precompressed static assets."""
+
+
+@static_cli.command("build")
+@with_appcontext
+def build_command():
+    """Fingerprint and precompress everything under static/."""
+    manifest = build_static(current_app.static_folder)
+    click.echo(f"Built {len(manifest)} static file(s) into static/{BUILD_DIR}/")
+
+
+@static_cli.command("clean")
+@with_appcontext
+def clean_command():
+    """Remove static/build (url_for falls back to the original files)."""
+    shutil.rmtree(os.path.join(current_app.static_folder, BUILD_DIR), ignore_errors=True)
+    click.echo(f"Removed static/{BUILD_DIR}/")